@@ -0,0 +1,34 @@
+"""
+FILE: app/api/health.py
+Liveness and readiness probes.
+
+``/health`` answers as soon as the process serves HTTP. ``/ready`` answers
+503 until the predictor is loaded and warmed up (and again while shutting
+down), so a load balancer only routes traffic to warm workers.
+"""
+
+import os
+
+from fastapi import APIRouter, Request, Response
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/health")
+async def health() -> dict:
+    """Liveness: the worker is up."""
+    return {"status": "ok", "pid": os.getpid()}
+
+
+@router.get("/ready")
+async def ready(request: Request, response: Response) -> dict:
+    """Readiness: the model is loaded and warmed up."""
+    is_ready = getattr(request.app.state, "ready", False)
+    if not is_ready:
+        response.status_code = 503
+    predictor = getattr(request.app.state, "predictor", None)
+    return {
+        "ready": is_ready,
+        "model_name": getattr(predictor, "model_name", None),
+        "pid": os.getpid(),
+    }
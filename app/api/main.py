@@ -0,0 +1,91 @@
+"""
+FILE: app/api/main.py
+FastAPI application factory for the churn prediction service.
+
+Usage:
+    uv run uvicorn app.api.main:app --host 0.0.0.0 --port 8080
+    uv run python -m app.api.server --workers 4  # pre-forked, shared warm model
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.health import router as health_router
+from app.api.metrics import RequestMetricsMiddleware
+from app.api.metrics import router as metrics_router
+from app.api.v1.predict import router as v1_predict_router
+from app.core import get_logger, get_settings
+from app.services.batcher import MicroBatcher
+from app.services.predictor import ChurnPredictor, load_predictor, warm_up
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+async def _follow_live_version(predictor) -> None:
+    """Hot-swap to a newly promoted registry version (see ``LivePredictor``)."""
+    while True:
+        await asyncio.sleep(settings.registry_poll_seconds)
+        try:
+            await run_in_threadpool(predictor.refresh)
+        except Exception:
+            logger.exception("[%s][PREDICT] Model refresh failed", settings.env)
+
+
+def create_app(
+    predictor: ChurnPredictor | None = None,
+    microbatch: bool | None = None,
+    warmup: bool | None = None,
+) -> FastAPI:
+    """
+    Build the API application.
+
+    Args:
+        predictor (ChurnPredictor | None): Predictor to serve. When omitted,
+            the model from settings (``serving_backend``) is loaded once at startup.
+        microbatch (bool | None): Coalesce concurrent single-record requests.
+            Defaults to ``settings.microbatch_enabled``.
+        warmup (bool | None): Score ``settings.warmup_records`` rows before
+            ``/ready`` reports ready. Defaults to warming up only a predictor
+            loaded here (a passed-in one is assumed ready, e.g. pre-forked).
+
+    Returns:
+        FastAPI: Configured application.
+    """
+    use_microbatch = settings.microbatch_enabled if microbatch is None else microbatch
+    use_warmup = predictor is None if warmup is None else warmup
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        app.state.ready = False
+        app.state.predictor = predictor or load_predictor()
+        if use_warmup:
+            warm_up(app.state.predictor)
+        app.state.batcher = None
+        if use_microbatch:
+            app.state.batcher = MicroBatcher(app.state.predictor.predict_records)
+            await app.state.batcher.start()
+        watcher = None
+        if hasattr(app.state.predictor, "refresh") and settings.registry_poll_seconds:
+            watcher = asyncio.create_task(_follow_live_version(app.state.predictor))
+        app.state.ready = True
+        yield
+        app.state.ready = False
+        if watcher is not None:
+            watcher.cancel()
+        if app.state.batcher is not None:
+            await app.state.batcher.stop()
+
+    app = FastAPI(title="Churn Guardian", debug=settings.debug, lifespan=lifespan)
+    app.add_middleware(RequestMetricsMiddleware)
+    app.include_router(health_router)
+    app.include_router(metrics_router)
+    app.include_router(v1_predict_router)
+    return app
+
+
+app = create_app()
@@ -0,0 +1,64 @@
+"""
+FILE: app/api/metrics.py
+Prometheus scrape endpoint and request-latency middleware.
+
+``GET /metrics`` returns the metrics (``app.core.metrics``) in the
+Prometheus text format: this worker's, merged with the other pre-fork
+workers' snapshots when ``metrics_multiproc_dir`` is set. It answers 404
+while ``metrics_enabled`` is off.
+``RequestMetricsMiddleware`` observes every request's end-to-end latency,
+labelled with the route template (``/v1/predict``, not the raw URL) so the
+label set stays bounded.
+"""
+
+import time
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import metrics
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def scrape() -> PlainTextResponse:
+    """Every metric of this worker, or of every worker of the server."""
+    if not metrics.enabled():
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
+
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware timing HTTP requests into ``REQUEST_SECONDS``."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not metrics.enabled():
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the (shared) scope.
+            route = scope.get("route")
+            metrics.REQUEST_SECONDS.labels(
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=status,
+            ).observe(time.perf_counter() - start)
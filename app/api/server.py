@@ -0,0 +1,203 @@
+"""
+FILE: app/api/server.py
+Pre-fork API server: load and warm the model once, then fork the workers.
+
+The master process
+1. loads the serving predictor and warms it up (``warm_up``) with the garbage
+   collector disabled, and imports the uvicorn/anyio modules that are
+   otherwise imported by each worker's first request,
+2. binds ``settings.host:settings.port``,
+3. calls ``gc.freeze()``, moving everything loaded so far out of the
+   collector's reach, so collections in the workers do not write to (and
+   copy) the pages holding the model,
+4. forks ``settings.server_workers`` uvicorn workers serving the same app
+   over the shared socket; each reports ``/ready`` as soon as it listens.
+
+It then supervises them: a worker that dies is re-forked from the warm
+master, and SIGTERM is forwarded to all workers.
+
+Each worker writes snapshots of its metrics to ``metrics_multiproc_dir``
+(a fresh temporary directory unless set), so ``GET /metrics`` on the shared
+port reports the whole server, whichever worker answers it.
+
+onnxruntime thread pools do not survive ``fork``, so with
+``serving_backend="onnx"`` the master only pre-imports the backend and each
+worker opens (and warms) its own session. ``--no-preload`` loads nothing in
+the master (the behaviour of ``uvicorn --workers``), for comparison.
+
+Usage:
+    uv run python -m app.api.server --workers 4
+    uv run python -m app.api.server --workers 4 --no-preload
+"""
+
+import argparse
+import gc
+import importlib
+import os
+import shutil
+import signal
+import socket
+import tempfile
+from pathlib import Path
+
+import anyio
+import uvicorn
+
+from app.api.main import create_app
+from app.core import get_logger, get_settings, metrics
+from app.services.predictor import load_predictor, warm_up
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _preload_imports(config: uvicorn.Config) -> None:
+    """Import what the workers would otherwise import on their first request."""
+    config.load()  # HTTP protocol, lifespan and middleware classes
+    anyio.run(anyio.sleep, 0)  # the asyncio backend used by run_in_threadpool
+    if settings.serving_backend == "onnx":
+        for module in ("onnxruntime", "app.services.onnx_backend"):
+            importlib.import_module(module)
+
+
+def _fork_worker(config: uvicorn.Config, sock: socket.socket) -> int:
+    """Fork one uvicorn worker serving ``config`` on ``sock``; return its pid."""
+    pid = os.fork()
+    if pid:
+        return pid
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    gc.enable()
+    metrics_dir = settings.metrics_multiproc_dir
+    if metrics_dir:
+        metrics.start_snapshots(metrics_dir, settings.metrics_snapshot_seconds)
+    code = 0
+    try:
+        uvicorn.Server(config).run(sockets=[sock])
+    except BaseException:
+        logger.exception("[%s][SERVER] Worker %d crashed", settings.env, os.getpid())
+        code = 1
+    finally:
+        if metrics_dir:
+            try:
+                metrics.write_snapshot(metrics_dir)
+            except OSError:
+                pass
+        os._exit(code)
+
+
+def _metrics_dir() -> tuple[str, bool]:
+    """Empty snapshot directory for this run and whether it was created here."""
+    if settings.metrics_multiproc_dir is None:
+        return tempfile.mkdtemp(prefix="churn_metrics_"), True
+    directory = Path(settings.metrics_multiproc_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    for stale in directory.glob("*.json"):  # left over from an earlier run
+        stale.unlink()
+    return str(directory), False
+
+
+def serve(
+    workers: int | None = None,
+    host: str | None = None,
+    port: int | None = None,
+    preload: bool = True,
+) -> None:
+    """
+    Run the API with pre-forked workers until SIGTERM/SIGINT.
+
+    Args:
+        workers (int | None): Worker processes. Defaults to ``settings.server_workers``.
+        host (str | None): Bind address. Defaults to ``settings.host``.
+        port (int | None): Bind port. Defaults to ``settings.port``.
+        preload (bool): Load and warm the predictor (and the modules the
+            first request imports) in the master.
+    """
+    workers = workers or settings.server_workers
+    host = host or settings.host
+    port = port or settings.port
+
+    gc.disable()  # no collections while the long-lived model objects are built
+    shared_model = preload and settings.serving_backend != "onnx"
+    if shared_model:
+        predictor = load_predictor()
+        warm_up(predictor)
+        app = create_app(predictor)
+    else:
+        app = create_app()
+    config = uvicorn.Config(app, log_level=settings.log_level.lower())
+    if preload:
+        _preload_imports(config)
+    sock = _bind(host, port)
+    metrics_dir, own_metrics_dir = _metrics_dir()
+    settings.metrics_multiproc_dir = metrics_dir  # inherited by the workers
+    gc.collect()
+    gc.freeze()
+
+    stopping = False
+    children: set[int] = set()
+
+    def _stop(signum, _frame):
+        nonlocal stopping
+        stopping = True
+        # Ctrl-C already reaches the workers through the process group.
+        if signum == signal.SIGTERM:
+            for pid in children:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+    children.update(_fork_worker(config, sock) for _ in range(workers))
+    gc.enable()
+    logger.info(
+        "[%s][SERVER] Serving on %s:%d with %d workers (shared model: %s)",
+        settings.env,
+        host,
+        port,
+        workers,
+        shared_model,
+    )
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        metrics.mark_process_dead(pid, metrics_dir)
+        if not stopping:
+            logger.warning(
+                "[%s][SERVER] Worker %d exited with %d, restarting",
+                settings.env,
+                pid,
+                os.waitstatus_to_exitcode(status),
+            )
+            children.add(_fork_worker(config, sock))
+    sock.close()
+    if own_metrics_dir:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument(
+        "--no-preload", action="store_true", help="Load the model in each worker"
+    )
+    args = parser.parse_args()
+    serve(args.workers, args.host, args.port, preload=not args.no_preload)
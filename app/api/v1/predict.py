@@ -0,0 +1,73 @@
+"""
+FILE: app/api/v1/predict.py
+Batched, vectorized churn prediction endpoint.
+"""
+
+from typing import Annotated
+
+import numpy as np
+from fastapi import APIRouter, Body, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+
+from app.core import get_logger, get_settings
+from app.core.metrics import BATCH_SIZE
+from app.schemas.customer import CustomerBatch, CustomerFeatures, PredictionResponse
+from app.services.batcher import MicroBatcher
+from app.services.predictor import ChurnPredictor
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/v1", tags=["predict"])
+
+_REQUEST_BATCH_SIZE = BATCH_SIZE.labels(kind="request")
+
+
+def get_predictor(request: Request) -> ChurnPredictor:
+    """Return the predictor loaded at application startup."""
+    return request.app.state.predictor
+
+
+def get_batcher(request: Request) -> MicroBatcher | None:
+    """Return the single-record coalescer, if micro-batching is enabled."""
+    return getattr(request.app.state, "batcher", None)
+
+
+@router.post("/predict", response_model=PredictionResponse)
+async def predict(
+    payload: Annotated[CustomerFeatures | CustomerBatch, Body()],
+    predictor: Annotated[ChurnPredictor, Depends(get_predictor)],
+    batcher: Annotated[MicroBatcher | None, Depends(get_batcher)],
+) -> dict:
+    """
+    Score one customer or a list of customers.
+
+    A list is transformed and scored as a single matrix. A single record is
+    coalesced with concurrent single-record requests when micro-batching is on.
+    """
+    records = payload if isinstance(payload, list) else [payload]
+    _REQUEST_BATCH_SIZE.observe(len(records))
+    if batcher is not None and not isinstance(payload, list):
+        probabilities = np.array([await batcher.submit(payload)])
+    else:
+        probabilities = await run_in_threadpool(predictor.predict_records, records)
+    labels = probabilities >= settings.prediction_threshold
+    logger.debug("[%s][PREDICT] Scored %d records", settings.env, len(records))
+    return {
+        "model_name": predictor.model_name,
+        "predictions": [
+            {"churn_probability": p, "churn": c}
+            for p, c in zip(probabilities.tolist(), labels.tolist())
+        ],
+    }
+
+
+@router.get("/predict/cache")
+async def prediction_cache_info(
+    predictor: Annotated[ChurnPredictor, Depends(get_predictor)],
+) -> dict:
+    """Hit rate and scoring time saved by this worker's prediction cache."""
+    cache_info = getattr(predictor, "cache_info", None)
+    if cache_info is None:
+        raise HTTPException(status_code=404, detail="Prediction cache is off")
+    return cache_info()._asdict()
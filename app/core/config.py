@@ -26,19 +26,74 @@ class Settings(BaseSettings):
     port: int = 8080
     debug: bool = True
     env: str = "dev"  # dev, prod, staging
+    server_workers: int = 1  # processes forked by app.api.server
 
     # Training / ML
     epochs: int = 10
     batch_size: int = 32
+    learning_rate: float = 1e-3
+    mlp_hidden_layers: list[int] = [64, 32]
+    val_size: float = 0.2  # stratified validation fraction
+    early_stopping_patience: int = 3  # epochs without val-loss improvement
+    train_threads: int = 0  # BLAS threads while training; 0: library default
+    cv_folds: int = 5  # stratified cross-validation folds
+    cv_jobs: int = -1  # fold fits run in parallel; -1: all CPUs
 
     # Paths
     model_path: str = "app/models/weights/mlp_churn_model.h5"
     default_csv_path: str = "app/data/raw/customer-churn-prediction-2020/train.csv"
     processed_csv_path: str = "app/data/processed"
 
+    # Serving
+    serving_artifact_dir: str = "app/data/processed"
+    serving_model_name: str = "automl_baseline_model"
+    serving_preprocessor_name: str = "preprocessor"
+    serving_backend: str = "joblib"  # "joblib" or "onnx" (needs the onnx extra)
+    onnx_intra_op_threads: int = 0  # 0: onnxruntime default
+    onnx_inter_op_threads: int = 0
+    serving_registry: bool = False  # serve the live version from the model registry
+    registry_model_name: str = "churn"
+    registry_poll_seconds: float = 5.0  # check for a newly promoted version; 0: off
+    prediction_threshold: float = 0.5
+    max_predict_records: int = 10_000
+    microbatch_enabled: bool = True  # coalesce concurrent single-record requests
+    microbatch_max_size: int = 64
+    microbatch_max_wait_ms: float = 2.0
+    fast_path_max_records: int = 64  # compiled record path up to this size; 0: off
+    score_chunk_size: int = 50_000  # rows per chunk for batch scoring
+    prediction_cache: str = "off"  # "off", "memory" or "sqlite" (shared by workers)
+    prediction_cache_max_entries: int = 100_000
+    prediction_cache_ttl_seconds: float | None = 3600.0  # None: never expire
+    prediction_cache_path: str = "app/data/processed/prediction_cache.sqlite"
+    warmup_records: int = 64  # rows scored before reporting ready; 0: off
+    warmup_data_path: str | None = None  # CSV for warm-up; None: default_csv_path
+
+    # Data cache
+    data_cache_enabled: bool = True  # columnar on-disk cache for raw CSVs
+
+    # Feature store
+    feature_store_path: str = "app/data/processed/feature_store"
+    feature_store_key: str = "customer_id"
+    feature_store_chunk_rows: int = 65_536  # rows per columnar chunk
+
+    # EDA figure rendering
+    figure_workers: int | None = None  # render processes; None: CPU count, 1 nested
+    figure_dpi: int = 300
+
+    # In-process cache (log_and_cache), per decorated function
+    cache_max_entries: int = 32
+    cache_max_bytes: int = 1024**3  # 1 GiB
+    cache_ttl_seconds: float | None = None  # None: entries never expire
+
     # Logging
     log_level: str = "INFO"  # default log level
 
+    # Metrics
+    metrics_enabled: bool = True  # record metrics and serve GET /metrics
+    # Pre-fork workers share metric snapshots here; None: a temp dir (server)
+    metrics_multiproc_dir: str | None = None
+    metrics_snapshot_seconds: float = 5.0  # how often each worker writes one
+
     # Pydantic v2 configuration
     model_config = SettingsConfigDict(
         extra="ignore",
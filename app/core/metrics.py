@@ -0,0 +1,521 @@
+"""
+FILE: app/core/metrics.py
+Lightweight Prometheus metrics for loaders, scoring, the API and EDA stages.
+
+Counters, gauges and histograms register in one process-wide ``REGISTRY``
+and are rendered in the Prometheus text format, either for ``GET /metrics``
+(``render``) or as a node-exporter textfile for batch jobs
+(``write_textfile``). No client library is needed.
+
+Code is instrumented with ``timed`` (decorator) and ``track`` (context
+manager) around a labelled histogram, or by calling ``inc`` / ``observe`` /
+``set`` on a child resolved once with ``labels``. With
+``settings.metrics_enabled`` off every update returns after one flag check.
+
+Values live in each process. Behind the pre-fork server every worker also
+writes a JSON snapshot of its values to ``settings.metrics_multiproc_dir``
+every ``metrics_snapshot_seconds`` (``start_snapshots``); ``render`` then
+merges the live values of the scraped worker with the other workers'
+snapshots, so one scrape of the shared port covers the whole server. Counters
+and histograms are summed; gauges are reported per worker with a ``pid``
+label. Snapshots of exited workers keep counting, minus their gauges
+(``mark_process_dead``).
+"""
+
+from __future__ import annotations
+
+import abc
+import bisect
+import json
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from functools import wraps
+from pathlib import Path
+from typing import Any, ClassVar, Self
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+_ENABLED = settings.metrics_enabled
+
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096, 10_000)
+
+
+def enabled() -> bool:
+    """Whether metric updates are recorded."""
+    return _ENABLED
+
+
+def set_enabled(flag: bool) -> None:
+    """Turn recording on or off for this process."""
+    global _ENABLED
+    _ENABLED = flag
+
+
+def _format(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+# --------------------------
+# Metric children (one per label set)
+# --------------------------
+class _CounterChild:
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if not _ENABLED:
+            return
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild(_CounterChild):
+    def set(self, value: float) -> None:
+        if not _ENABLED:
+            return
+        self.value = float(value)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+
+class _HistogramChild:
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last: above every bucket
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        if not _ENABLED:
+            return
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+
+class _Timer:
+    """Context manager that observes its own duration."""
+
+    __slots__ = ("child", "start")
+
+    def __init__(self, child: _HistogramChild) -> None:
+        self.child = child
+        self.start = 0.0
+
+    def __enter__(self) -> Self:
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.child.observe(time.perf_counter() - self.start)
+
+
+class _NoTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        return None
+
+
+_NO_TIMER = _NoTimer()
+
+
+# --------------------------
+# Metrics
+# --------------------------
+class Registry:
+    """Named metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> _Metric:
+        return self._metrics[name]
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (0.0.4)."""
+        return "".join(metric.render() for metric in self._metrics.values())
+
+    def snapshot(self) -> dict[str, list]:
+        """JSON-serializable values of every metric in this process."""
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def render_aggregate(self, snapshots: dict[int, dict[str, list]]) -> str:
+        """
+        Render the metrics merged over several processes.
+
+        Args:
+            snapshots (dict[int, dict[str, list]]): ``snapshot()`` per pid.
+        """
+        parts = []
+        for name, metric in self._metrics.items():
+            labelnames, children = metric.merge(
+                {pid: snap.get(name, []) for pid, snap in snapshots.items()}
+            )
+            parts.append(metric.render(labelnames, children))
+        return "".join(parts)
+
+
+REGISTRY = Registry()
+
+
+class _Metric(abc.ABC):
+    kind: ClassVar[str]
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: Registry | None = REGISTRY,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    @abc.abstractmethod
+    def _child(self) -> Any:
+        """A new, zeroed child for one label set."""
+
+    def labels(self, **labels: Any) -> Any:
+        """The child for one set of label values (created on first use)."""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._child())
+        return child
+
+    def _state(self, child: Any) -> Any:
+        return child.value
+
+    def _add(self, child: Any, state: Any) -> None:
+        child.value += state
+
+    def snapshot(self) -> list:
+        """``[label values, state]`` per child, for ``merge`` in another process."""
+        return [[list(key), self._state(c)] for key, c in list(self._children.items())]
+
+    def merge(
+        self, snapshots: dict[int, list]
+    ) -> tuple[tuple[str, ...], dict[tuple[str, ...], Any]]:
+        """Label names and children summing ``snapshot()`` of several pids."""
+        merged: dict[tuple[str, ...], Any] = {}
+        for snapshot in snapshots.values():
+            for key, state in snapshot:
+                key = tuple(key)
+                if key not in merged:
+                    merged[key] = self._child()
+                self._add(merged[key], state)
+        return self.labelnames, merged
+
+    def _samples(
+        self, labelnames: tuple[str, ...], key: tuple[str, ...], child: Any
+    ) -> list[str]:
+        return [f"{self.name}{_labels(labelnames, key)} {_format(child.value)}"]
+
+    def render(
+        self,
+        labelnames: tuple[str, ...] | None = None,
+        children: dict[tuple[str, ...], Any] | None = None,
+    ) -> str:
+        """This metric's children (or ``merge`` output) in the text format."""
+        if children is None:
+            labelnames, children = self.labelnames, self._children
+        assert labelnames is not None
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for key, child in list(children.items()):
+            lines.extend(self._samples(labelnames, key, child))
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """Monotonic count, e.g. cache hits."""
+
+    kind = "counter"
+
+    def _child(self) -> _CounterChild:
+        return _CounterChild()
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, e.g. loaded-model memory."""
+
+    kind = "gauge"
+
+    def _child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def merge(
+        self, snapshots: dict[int, list]
+    ) -> tuple[tuple[str, ...], dict[tuple[str, ...], Any]]:
+        """Gauges are not summed: one child per pid, under a ``pid`` label."""
+        merged = {}
+        for pid, snapshot in snapshots.items():
+            for key, state in snapshot:
+                child = merged[(*key, str(pid))] = self._child()
+                child.value = float(state)
+        return (*self.labelnames, "pid"), merged
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        registry: Registry | None = REGISTRY,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def _state(self, child: Any) -> Any:
+        return [list(child.counts), child.sum]
+
+    def _add(self, child: Any, state: Any) -> None:
+        counts, total = state
+        child.counts = [a + b for a, b in zip(child.counts, counts, strict=True)]
+        child.sum += total
+
+    def _samples(
+        self, labelnames: tuple[str, ...], key: tuple[str, ...], child: Any
+    ) -> list[str]:
+        lines, cumulative = [], 0
+        counts = list(child.counts)
+        for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+            cumulative += count
+            le = _labels(labelnames, key, f'le="{_format(bound)}"')
+            lines.append(f"{self.name}_bucket{le} {cumulative}")
+        labels = _labels(labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+# --------------------------
+# Instrumentation helpers
+# --------------------------
+def track(histogram: Histogram, **labels: Any) -> _Timer | _NoTimer:
+    """
+    Context manager timing its block into ``histogram``.
+
+    Returns a shared no-op when metrics are disabled.
+    """
+    if not _ENABLED:
+        return _NO_TIMER
+    return _Timer(histogram.labels(**labels))
+
+
+def timed(histogram: Histogram, **labels: Any) -> Callable:
+    """Decorator timing each call into ``histogram`` (labels fixed up front)."""
+    child = histogram.labels(**labels)
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def render() -> str:
+    """
+    Every registered metric in the Prometheus text format.
+
+    With ``settings.metrics_multiproc_dir`` set, merged with the snapshots
+    the other worker processes wrote there.
+    """
+    directory = settings.metrics_multiproc_dir
+    if not directory:
+        return REGISTRY.render()
+    snapshots = read_snapshots(directory)
+    snapshots[os.getpid()] = REGISTRY.snapshot()  # live values of this worker
+    return REGISTRY.render_aggregate(snapshots)
+
+
+def write_textfile(path: str | Path) -> Path:
+    """Write ``render()`` atomically, e.g. for the node-exporter textfile collector."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    tmp.write_text(render(), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+# --------------------------
+# Multi-process snapshots
+# --------------------------
+def _write_json(path: Path, data: Any) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def write_snapshot(directory: str | Path) -> Path:
+    """Write this process's metric values to ``<directory>/<pid>.json``."""
+    path = Path(directory) / f"{os.getpid()}.json"
+    _write_json(path, REGISTRY.snapshot())
+    return path
+
+
+def read_snapshots(directory: str | Path) -> dict[int, dict[str, list]]:
+    """Every worker snapshot in ``directory``, by pid."""
+    snapshots = {}
+    for path in Path(directory).glob("*.json"):
+        try:
+            snapshots[int(path.stem)] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):  # not a snapshot, or removed meanwhile
+            continue
+    return snapshots
+
+
+def mark_process_dead(pid: int, directory: str | Path) -> None:
+    """Drop an exited worker's gauges; its counters and histograms still count."""
+    path = Path(directory) / f"{pid}.json"
+    try:
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    _write_json(
+        path,
+        {
+            name: values
+            for name, values in snapshot.items()
+            if not isinstance(REGISTRY._metrics.get(name), Gauge)
+        },
+    )
+
+
+def start_snapshots(directory: str | Path, interval: float) -> threading.Thread:
+    """Write ``write_snapshot(directory)`` every ``interval`` seconds (daemon)."""
+
+    def loop() -> None:
+        while True:
+            try:
+                write_snapshot(directory)
+            except OSError:
+                pass  # retried next interval
+            time.sleep(interval)
+
+    thread = threading.Thread(target=loop, name="metrics-snapshots", daemon=True)
+    thread.start()
+    return thread
+
+
+# --------------------------
+# Application metrics
+# --------------------------
+DATA_LOAD_SECONDS = Histogram(
+    "churn_data_load_seconds", "Time to load a dataset from disk.", ["source"]
+)
+MODEL_LOAD_SECONDS = Histogram(
+    "churn_model_load_seconds", "Time to load a model artifact.", ["model", "backend"]
+)
+MODEL_MEMORY_BYTES = Gauge(
+    "churn_model_memory_bytes",
+    "Approximate memory of a loaded model (deep size of its objects and arrays; "
+    "the graph file size for ONNX sessions).",
+    ["model"],
+)
+PREPROCESS_SECONDS = Histogram(
+    "churn_preprocess_seconds", "Time to turn raw records into features.", ["path"]
+)
+INFERENCE_SECONDS = Histogram(
+    "churn_inference_seconds", "Time spent in model predict_proba.", ["backend"]
+)
+REQUEST_SECONDS = Histogram(
+    "churn_request_seconds",
+    "End-to-end HTTP request latency.",
+    ["method", "route", "status"],
+)
+CACHE_REQUESTS = Counter(
+    "churn_cache_requests_total", "Cache lookups by outcome.", ["cache", "result"]
+)
+CACHE_SAVED_SECONDS = Counter(
+    "churn_cache_saved_seconds_total",
+    "Estimated scoring time saved by prediction cache hits.",
+    ["cache"],
+)
+BATCH_SIZE = Histogram(
+    "churn_batch_size", "Records per scoring call.", ["kind"], buckets=SIZE_BUCKETS
+)
+EDA_STAGE_SECONDS = Histogram(
+    "churn_eda_stage_seconds", "Wall time of an EDA stage.", ["stage", "status"]
+)
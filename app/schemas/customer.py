@@ -0,0 +1,87 @@
+"""
+FILE: app/schemas/customer.py
+Pydantic schemas for churn prediction requests and responses.
+"""
+
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.core import get_settings
+
+settings = get_settings()
+
+YesNo = Literal["yes", "no"]
+
+
+class CustomerFeatures(BaseModel):
+    """Raw features of one customer, as in the training CSV (without ``churn``)."""
+
+    model_config = ConfigDict(
+        extra="ignore",
+        json_schema_extra={
+            "example": {
+                "state": "OH",
+                "account_length": 107,
+                "area_code": "area_code_415",
+                "international_plan": "no",
+                "voice_mail_plan": "yes",
+                "number_vmail_messages": 26,
+                "total_day_minutes": 161.6,
+                "total_day_calls": 123,
+                "total_day_charge": 27.47,
+                "total_eve_minutes": 195.5,
+                "total_eve_calls": 103,
+                "total_eve_charge": 16.62,
+                "total_night_minutes": 254.4,
+                "total_night_calls": 103,
+                "total_night_charge": 11.45,
+                "total_intl_minutes": 13.7,
+                "total_intl_calls": 3,
+                "total_intl_charge": 3.7,
+                "number_customer_service_calls": 1,
+            }
+        },
+    )
+
+    state: str = Field(min_length=2, max_length=2)
+    account_length: int = Field(ge=0)
+    area_code: str
+    international_plan: YesNo
+    voice_mail_plan: YesNo
+    number_vmail_messages: int = Field(ge=0)
+    total_day_minutes: float = Field(ge=0)
+    total_day_calls: int = Field(ge=0)
+    total_day_charge: float = Field(ge=0)
+    total_eve_minutes: float = Field(ge=0)
+    total_eve_calls: int = Field(ge=0)
+    total_eve_charge: float = Field(ge=0)
+    total_night_minutes: float = Field(ge=0)
+    total_night_calls: int = Field(ge=0)
+    total_night_charge: float = Field(ge=0)
+    total_intl_minutes: float = Field(ge=0)
+    total_intl_calls: int = Field(ge=0)
+    total_intl_charge: float = Field(ge=0)
+    number_customer_service_calls: int = Field(ge=0)
+
+
+CustomerBatch = Annotated[
+    list[CustomerFeatures],
+    Field(min_length=1, max_length=settings.max_predict_records),
+]
+
+
+class Prediction(BaseModel):
+    """Churn score for one customer."""
+
+    churn_probability: float
+    churn: bool
+
+
+class PredictionResponse(BaseModel):
+    """Predictions in the same order as the submitted records."""
+
+    model_name: str
+    predictions: list[Prediction]
+
+    model_config = ConfigDict(protected_namespaces=())
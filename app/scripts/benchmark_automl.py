@@ -0,0 +1,362 @@
+"""
+AutoML and baseline leaderboard under fixed wall-clock budgets.
+
+For each feature set
+- ``raw``: scaled numerics and one-hot categoricals
+- ``engineered``: the same plus the ``BehavioralFeatures`` and
+  ``PriceContractFeatures`` transformers behind ``create_behavioral_features``
+  and ``create_price_contract_features``, fitted on the training rows only
+
+and each candidate
+- ``flaml``: FLAML ``AutoML`` with ``time_budget=--budget`` (ROC AUC)
+- ``logreg``, ``random_forest``, ``hist_gb``: scikit-learn models whose
+  hyperparameters are sampled at random and evaluated ``--jobs`` trials at a
+  time across cores, until ``--budget`` seconds are spent
+
+the best model is refit on the training split (stratified, ``val_size``) and
+scored on the held-out rows. Trial workers are started before the clock
+starts. A new round of trials is only started when the previous round's
+duration still fits in the budget, but the first round and the final refit
+always run, so the search overrun and the refit seconds are reported
+separately. The leaderboard records ROC AUC, accuracy, F1, training
+(search + refit) seconds, the search overrun, inference latency per 1k raw
+rows (preprocessing included, median of ``--repeat`` after one warm-up call),
+the pickled model size and whether the row is on the AUC/latency Pareto front. It is written as JSON and
+Markdown to ``--output-dir``.
+
+Usage:
+    uv run python -m app.scripts.benchmark_automl --budget 60 --jobs 4
+    uv run python -m app.scripts.benchmark_automl --budget 10 --candidates logreg hist_gb
+"""
+
+import argparse
+import json
+import os
+import pickle
+import platform
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
+
+from app.core import get_settings
+from app.services.data_loader import load_train, split_indices
+from app.services.preprocessing import build_preprocessor
+from app.services.training import build_training_data, feature_columns
+
+settings = get_settings()
+
+FEATURE_SETS = {"raw": False, "engineered": True}
+OUTPUT_DIR = Path(__file__).resolve().parents[1] / "reports" / "automl"
+
+
+def _log_uniform(rng: np.random.Generator, low: float, high: float) -> float:
+    return float(np.exp(rng.uniform(np.log(low), np.log(high))))
+
+
+# name -> (base estimator, sampler of one hyperparameter set)
+BASELINES: dict[str, tuple[object, Callable[[np.random.Generator], dict]]] = {
+    "logreg": (
+        LogisticRegression(max_iter=2000),
+        lambda rng: {"C": _log_uniform(rng, 1e-3, 1e2)},
+    ),
+    "random_forest": (
+        RandomForestClassifier(n_jobs=1),
+        lambda rng: {
+            "n_estimators": int(rng.integers(50, 400)),
+            "max_depth": int(rng.integers(3, 20)),
+            "min_samples_leaf": int(rng.integers(1, 10)),
+            "max_features": float(rng.uniform(0.2, 1.0)),
+        },
+    ),
+    "hist_gb": (
+        HistGradientBoostingClassifier(),
+        lambda rng: {
+            "learning_rate": _log_uniform(rng, 0.01, 0.3),
+            "max_leaf_nodes": int(rng.integers(8, 64)),
+            "l2_regularization": _log_uniform(rng, 1e-4, 1.0),
+            "max_iter": int(rng.integers(50, 400)),
+        },
+    ),
+}
+CANDIDATES = ["flaml", *BASELINES]
+
+
+# --------------------------
+# Search
+# --------------------------
+def _trial(estimator, params: dict, x_fit, y_fit, x_eval, y_eval, seed: int) -> float:
+    model = clone(estimator).set_params(**params)
+    if "random_state" in model.get_params():
+        model.set_params(random_state=seed)
+    model.fit(x_fit, y_fit)
+    return float(roc_auc_score(y_eval, model.predict_proba(x_eval)[:, 1]))
+
+
+def random_search(
+    name: str, x_train, y_train, budget: float, jobs: int, seed: int = 42
+) -> tuple[Any, dict]:
+    """
+    Evaluate random hyperparameters ``jobs`` at a time until ``budget`` runs out.
+
+    Trials are scored by ROC AUC on a stratified 25% slice of the training
+    rows; the best parameters are refit on all of them. The worker processes
+    are started before the clock starts.
+
+    Returns:
+        tuple: Refit estimator and ``{"params", "trials", "search_auc",
+        "search_seconds", "refit_seconds"}``.
+    """
+    estimator, sample = BASELINES[name]
+    rng = np.random.default_rng(seed)
+    fit_idx, eval_idx = split_indices(y_train, 0.25, seed)
+    x_fit, y_fit = x_train[fit_idx], y_train[fit_idx]
+    x_eval, y_eval = x_train[eval_idx], y_train[eval_idx]
+
+    best_params, best_auc, trials = {}, -np.inf, 0
+    with Parallel(n_jobs=jobs) as parallel:
+        # Spawn the workers and import the estimator there, off the clock.
+        parallel(delayed(clone)(estimator) for _ in range(jobs))
+        start = time.perf_counter()
+        round_seconds = 0.0
+        while time.perf_counter() - start + round_seconds <= budget or not trials:
+            round_start = time.perf_counter()
+            batch = [sample(rng) for _ in range(jobs)]
+            scores = parallel(
+                delayed(_trial)(estimator, p, x_fit, y_fit, x_eval, y_eval, seed)
+                for p in batch
+            )
+            trials += len(batch)
+            for params, auc in zip(batch, scores, strict=True):
+                if auc > best_auc:
+                    best_params, best_auc = params, auc
+            round_seconds = time.perf_counter() - round_start
+    search_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model = clone(estimator).set_params(**best_params)
+    if "random_state" in model.get_params():
+        model.set_params(random_state=seed)
+    model.fit(x_train, y_train)
+    return model, {
+        "params": best_params,
+        "trials": trials,
+        "search_auc": best_auc,
+        "search_seconds": search_seconds,
+        "refit_seconds": time.perf_counter() - start,
+    }
+
+
+def flaml_search(
+    x_train, y_train, budget: float, jobs: int, concurrent: int, seed: int = 42
+) -> tuple[Any, dict]:
+    """
+    Run FLAML ``AutoML`` for ``budget`` seconds (ROC AUC) and return it.
+
+    FLAML's own retrain of the best config is part of ``search_seconds``.
+    """
+    from flaml import AutoML
+
+    automl = AutoML()
+    start = time.perf_counter()
+    automl.fit(
+        x_train,
+        y_train,
+        task="classification",
+        metric="roc_auc",
+        time_budget=budget,
+        n_jobs=jobs,
+        n_concurrent_trials=concurrent,  # > 1 needs ray
+        seed=seed,
+        verbose=0,
+    )
+    return automl, {
+        "params": {"estimator": automl.best_estimator, **automl.best_config},
+        "trials": len(automl.config_history),
+        "search_auc": 1 - automl.best_loss,
+        "search_seconds": time.perf_counter() - start,
+        "refit_seconds": 0.0,
+    }
+
+
+# --------------------------
+# Measurements
+# --------------------------
+def latency_per_1k(preprocessor, model, raw_rows: pd.DataFrame, repeat: int) -> float:
+    """Median milliseconds to preprocess and score 1,000 raw rows."""
+
+    def score() -> None:
+        matrix = preprocessor.transform(raw_rows)
+        if hasattr(matrix, "toarray"):
+            matrix = matrix.toarray()
+        model.predict_proba(np.asarray(matrix, dtype="float32"))
+
+    score()  # warm-up: lazy imports, caches and allocations stay off the clock
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        score()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)) * 1e3 * 1000 / len(raw_rows)
+
+
+def pareto_front(rows: list[dict]) -> None:
+    """Flag rows no other row beats on both AUC and latency."""
+    for row in rows:
+        row["pareto"] = not any(
+            other["auc"] >= row["auc"]
+            and other["latency_ms_per_1k"] <= row["latency_ms_per_1k"]
+            and (
+                other["auc"] > row["auc"]
+                or other["latency_ms_per_1k"] < row["latency_ms_per_1k"]
+            )
+            for other in rows
+        )
+
+
+def to_markdown(rows: list[dict], meta: dict) -> str:
+    """Leaderboard as a Markdown table, best AUC first."""
+    lines = [
+        "# AutoML leaderboard",
+        "",
+        (
+            f"{meta['rows']} rows ({meta['val_rows']} held out), budget "
+            f"{meta['budget_seconds']:.0f}s per candidate, {meta['jobs']} jobs, "
+            f"{meta['cpus']} CPUs."
+        ),
+        "",
+        (
+            "| rank | candidate | features | AUC | accuracy | F1 | train (s) "
+            "| over budget (s) | latency (ms / 1k rows) | size (KB) | trials "
+            "| Pareto |"
+        ),
+        "|---:|---|---|---:|---:|---:|---:|---:|---:|---:|---:|:---:|",
+    ]
+    for rank, r in enumerate(rows, 1):
+        lines.append(
+            f"| {rank} | {r['candidate']} | {r['features']} | {r['auc']:.4f} "
+            f"| {r['accuracy']:.4f} | {r['f1']:.4f} | {r['train_seconds']:.1f} "
+            f"| {r['budget_overrun_seconds']:.1f} | {r['latency_ms_per_1k']:.2f} | {r['model_kb']:.0f} | {r['trials']} "
+            f"| {'yes' if r['pareto'] else ''} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+# --------------------------
+# Main
+# --------------------------
+def main(
+    budget: float = 60.0,
+    jobs: int = -1,
+    candidates: list[str] | None = None,
+    feature_sets: list[str] | None = None,
+    concurrent_trials: int = 1,
+    repeat: int = 5,
+    output_dir: Path = OUTPUT_DIR,
+    target: str = "churn",
+):
+    """Run every candidate on every feature set and write the leaderboard."""
+    jobs = (os.cpu_count() or 1) if jobs == -1 else jobs
+    candidates = candidates or CANDIDATES
+    feature_sets = feature_sets or list(FEATURE_SETS)
+    df = load_train()
+    num_cols, cat_cols = feature_columns(df, target)
+    raw_rows = pd.read_csv(settings.default_csv_path, nrows=1000).drop(columns=[target])
+
+    rows = []
+    for feature_set in feature_sets:
+        preprocessor = build_preprocessor(
+            num_cols, cat_cols, engineered=FEATURE_SETS[feature_set]
+        )
+        data = build_training_data(df, target, preprocessor)
+        x_train, y_train = data.train
+        x_val, y_val = data.validation
+        for name in candidates:
+            if name == "flaml":
+                model, search = flaml_search(
+                    x_train, y_train, budget, jobs, concurrent_trials
+                )
+            else:
+                model, search = random_search(name, x_train, y_train, budget, jobs)
+            train_seconds = search["search_seconds"] + search["refit_seconds"]
+
+            proba = model.predict_proba(x_val)[:, 1]
+            row = {
+                "candidate": name,
+                "features": feature_set,
+                "n_features": int(x_train.shape[1]),
+                "auc": float(roc_auc_score(y_val, proba)),
+                "accuracy": float(accuracy_score(y_val, proba >= 0.5)),
+                "f1": float(f1_score(y_val, proba >= 0.5)),
+                "train_seconds": train_seconds,
+                "budget_overrun_seconds": max(0.0, search["search_seconds"] - budget),
+                "latency_ms_per_1k": latency_per_1k(
+                    preprocessor, model, raw_rows, repeat
+                ),
+                "model_kb": len(pickle.dumps(model)) / 1024,
+                **search,
+            }
+            rows.append(row)
+            print(
+                f"{feature_set:<11}{name:<14} AUC {row['auc']:.4f}  "
+                f"train {train_seconds:6.1f}s  "
+                f"{row['latency_ms_per_1k']:7.2f} ms/1k  "
+                f"{row['model_kb']:8.0f} KB  {row['trials']} trials"
+            )
+
+    rows.sort(key=lambda r: r["auc"], reverse=True)
+    pareto_front(rows)
+    meta = {
+        "rows": len(df),
+        "val_rows": len(y_val),
+        "budget_seconds": budget,
+        "jobs": jobs,
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_dir / "leaderboard.json", "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "leaderboard": rows}, f, indent=2, default=str)
+    (output_dir / "leaderboard.md").write_text(to_markdown(rows, meta), "utf-8")
+    print(f"Leaderboard written to {output_dir}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--budget", type=float, default=60.0, help="Seconds per candidate"
+    )
+    parser.add_argument("--jobs", type=int, default=-1, help="Parallel trials")
+    parser.add_argument("--candidates", nargs="+", choices=CANDIDATES, default=None)
+    parser.add_argument(
+        "--feature-sets", nargs="+", choices=list(FEATURE_SETS), default=None
+    )
+    parser.add_argument(
+        "--concurrent-trials",
+        type=int,
+        default=1,
+        help="FLAML concurrent trials (> 1 needs ray)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    parser.add_argument("--target", type=str, default="churn")
+    args = parser.parse_args()
+    main(
+        budget=args.budget,
+        jobs=args.jobs,
+        candidates=args.candidates,
+        feature_sets=args.feature_sets,
+        concurrent_trials=args.concurrent_trials,
+        repeat=args.repeat,
+        output_dir=args.output_dir,
+        target=args.target,
+    )
@@ -0,0 +1,85 @@
+"""
+Benchmark cold CSV parsing against cold reads from the columnar data cache.
+
+"Cold" means no in-process memoization: every repeat goes through the full
+``pd.read_csv`` + dtype cast, or through the memory-mapped cache read.
+Also prints the in-memory size of the plain ``pd.read_csv`` frame next to the
+compact frame (``CHURN_DTYPES``), per column.
+
+Usage:
+    uv run python -m app.scripts.benchmark_data_cache --rows 1000000 --repeat 5
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from app.core import get_settings
+from app.services import data_cache
+
+settings = get_settings()
+
+
+def _make_source(rows: int, outdir: Path) -> Path:
+    """Write a CSV of ``rows`` rows resampled from the raw training set."""
+    base = pd.read_csv(settings.default_csv_path)
+    df = base.sample(n=rows, replace=True, random_state=42)
+    path = outdir / "train.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def _time(func, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(rows: int = 1_000_000, repeat: int = 5):
+    """Run the benchmark and print a timing table."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmpdir = Path(tmp)
+        data_cache.CACHE_DIR = tmpdir / "cache"
+        source = _make_source(rows, tmpdir)
+        size_mb = source.stat().st_size / 1e6
+
+        csv_times = _time(
+            lambda: data_cache.apply_dtypes(
+                pd.read_csv(source), data_cache.CHURN_DTYPES
+            ),
+            repeat,
+        )
+
+        start = time.perf_counter()
+        data_cache.read_csv_cached(source)  # populate the cache
+        build_time = time.perf_counter() - start
+        cache_times = _time(lambda: data_cache.read_csv_cached(source), repeat)
+        report = data_cache.memory_report(
+            pd.read_csv(source), data_cache.read_csv_cached(source)
+        )
+
+    csv_median = statistics.median(csv_times)
+    cache_median = statistics.median(cache_times)
+    print(f"rows={rows:,} source={size_mb:.1f} MB repeat={repeat}")
+    print(f"{'mode':<12}{'median (s)':>12}{'min (s)':>12}")
+    print(f"{'csv parse':<12}{csv_median:>12.4f}{min(csv_times):>12.4f}")
+    print(f"{'cache read':<12}{cache_median:>12.4f}{min(cache_times):>12.4f}")
+    print(f"cache build (one-off): {build_time:.4f} s")
+    print(f"speedup: {csv_median / cache_median:.1f}x")
+    print()
+    print(report)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(rows=args.rows, repeat=args.repeat)
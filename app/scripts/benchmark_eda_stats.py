@@ -0,0 +1,104 @@
+"""
+Compare the legacy multi-pass EDA statistics with the single-pass engine.
+
+The legacy path reproduces the previous ``summarize``,
+``find_unnecessary_columns``, ``detect_outliers`` and ``missingness_summary``
+bodies. Column scans are counted per call: ``isna``/``nunique`` read every
+column, each ``quantile`` call and each outlier mask reads a numeric column
+once more, and target ``value_counts`` reads the target twice. The engine
+reads every column once, chunk by chunk, from a DataFrame or straight from
+the CSV.
+
+Usage:
+    uv run python -m app.scripts.benchmark_eda_stats --rows 1000000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_settings
+from app.scripts.eda import (
+    detect_outliers,
+    find_unnecessary_columns,
+    missingness_summary,
+    summarize,
+)
+from app.scripts.eda.stats import compute_stats
+
+settings = get_settings()
+TARGET = "churn"
+
+
+def _legacy(df: pd.DataFrame) -> int:
+    """Run the previous implementations; return the number of column scans."""
+    n_cols = df.shape[1]
+    numeric = df.select_dtypes(include="number").columns
+
+    # summarize: isna + two target value_counts
+    df.isna().mean().sort_values(ascending=False)
+    df[TARGET].value_counts()
+    df[TARGET].value_counts(normalize=True)
+    # detect_outliers: q1, q3 and the mask per numeric column
+    for col in numeric:
+        q1 = df[col].quantile(0.25)
+        q3 = df[col].quantile(0.75)
+        iqr = q3 - q1
+        ((df[col] < (q1 - 1.5 * iqr)) | (df[col] > (q3 + 1.5 * iqr))).sum()
+    # missingness_summary: isna
+    df.isna().mean()
+    # find_unnecessary_columns: nunique + isna
+    df.nunique()
+    df.isna().mean()
+    return 4 * n_cols + 2 + 3 * len(numeric)
+
+
+def _engine(data) -> int:
+    stats = compute_stats(data, target=TARGET)
+    summarize(None, TARGET, stats=stats)
+    detect_outliers(None, stats=stats)
+    missingness_summary(None, stats=stats)
+    find_unnecessary_columns(None, TARGET, stats=stats)
+    return len(stats.columns)
+
+
+def _timed(func, *args) -> tuple[int, float]:
+    start = time.perf_counter()
+    scans = func(*args)
+    return scans, time.perf_counter() - start
+
+
+def main(n_rows: int = 1_000_000, chunk_size: int = 100_000):
+    """Build a dataset of ``n_rows`` by resampling train.csv and compare paths."""
+    base = pd.read_csv(settings.default_csv_path)
+    rng = np.random.default_rng(0)
+    df = base.iloc[rng.integers(0, len(base), n_rows)].reset_index(drop=True)
+
+    rows = [("legacy (DataFrame)", *_timed(_legacy, df))]
+    rows.append(("engine (DataFrame)", *_timed(_engine, df)))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "data.csv"
+        df.to_csv(path, index=False)
+        start = time.perf_counter()
+        pd.read_csv(path)
+        read_seconds = time.perf_counter() - start
+        scans, seconds = _timed(_engine, pd.read_csv(path, chunksize=chunk_size))
+        rows.append(("engine (CSV chunks)", scans, seconds - read_seconds))
+
+    print(f"rows={n_rows} cols={df.shape[1]} chunk={chunk_size}")
+    print(f"{'path':<22}{'column scans':>14}{'seconds':>10}")
+    for name, scans, seconds in rows:
+        print(f"{name:<22}{scans:>14}{seconds:>10.2f}")
+    print("(CSV row excludes the time of a plain pd.read_csv of the same file)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    args = parser.parse_args()
+    main(n_rows=args.rows, chunk_size=args.chunk_size)
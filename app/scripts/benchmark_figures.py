@@ -0,0 +1,63 @@
+"""
+Compare serial and pooled rendering of the univariate EDA figures.
+
+A synthetic frame with ``--columns`` numeric and categorical columns is
+aggregated once into figure specs, which are then rendered in-process and
+with each ``--workers`` pool size.
+
+Usage:
+    uv run python -m app.scripts.benchmark_figures --rows 100000 --workers 1 2 4
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+
+from app.scripts.eda.figures import render_figures
+from app.scripts.eda.plots import univariate_figures
+
+
+def _synthetic(n_rows: int, n_columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            f"x{i}": rng.gamma(2.0, size=n_rows).astype("float32")
+            for i in range(n_columns)
+        }
+    )
+    for i in range(n_columns):
+        df[f"c{i}"] = rng.choice(list("abcdefgh"), size=n_rows)
+    df["churn"] = np.where(rng.random(n_rows) < 0.15, "yes", "no")
+    return df
+
+
+def main(n_rows: int, n_columns: int, workers: list[int]):
+    """Print aggregation time and render seconds per pool size."""
+    df = _synthetic(n_rows, n_columns)
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        specs = univariate_figures(df, "churn", Path(tmp))
+        print(f"aggregated {len(specs)} figures in {time.perf_counter() - start:.2f}s")
+        print(f"{'workers':>8}{'wall (s)':>10}{'cpu (s)':>10}")
+        for n in workers:
+            start = time.perf_counter()
+            timings = render_figures(specs, workers=n)
+            wall = time.perf_counter() - start
+            print(f"{n:>8}{wall:>10.2f}{sum(timings.values()):>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+    main(args.rows, args.columns, args.workers)
@@ -0,0 +1,74 @@
+"""
+Per-row latency of the pandas and compiled single-record scoring paths.
+
+Each of ``--rows`` records from the training CSV is scored one at a time with
+the serving preprocessor and model, once through a one-row DataFrame and
+``ColumnTransformer.transform`` and once through the compiled record path.
+Transform-only and end-to-end p50/p99 latencies are reported per path, plus
+``predict_records`` answered from a warm prediction cache (memory and SQLite).
+
+Usage:
+    uv run python -m app.scripts.benchmark_inference --rows 500
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_settings
+from app.services.prediction_cache import CachedPredictor, make_cache
+from app.services.predictor import ChurnPredictor
+
+settings = get_settings()
+
+
+def _latencies(func, items) -> np.ndarray:
+    times = []
+    for item in items:
+        start = time.perf_counter()
+        func(item)
+        times.append(time.perf_counter() - start)
+    return np.array(times) * 1e6
+
+
+def main(n_rows: int):
+    """Print p50/p99 microseconds per row for both paths."""
+    predictor = ChurnPredictor.load()
+    if predictor.compiled is None:
+        raise SystemExit("The serving preprocessor cannot be compiled")
+    df = pd.read_csv(settings.default_csv_path, nrows=n_rows)
+    frames = [df.iloc[[i]][predictor.feature_columns] for i in range(len(df))]
+    records = df[predictor.feature_columns].to_dict("records")
+    compiled = predictor.compiled
+
+    rows = {
+        "pandas transform": _latencies(predictor.preprocessor.transform, frames),
+        "compiled transform": _latencies(compiled.transform_record, records),
+        "pandas end-to-end": _latencies(predictor.predict_proba, frames),
+        "compiled end-to-end": _latencies(
+            lambda r: predictor.model.predict_proba(compiled.transform_record(r)),
+            records,
+        ),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ("memory", "sqlite"):
+            cache = make_cache(backend, path=Path(tmp) / "cache.sqlite")
+            cached = CachedPredictor(predictor, cache)
+            cached.predict_records(records)  # fill
+            rows[f"{backend} cache hit"] = _latencies(
+                lambda r, c=cached: c.predict_records([r]), records
+            )
+    print(f"{'path':<22}{'p50 (us)':>12}{'p99 (us)':>12}")
+    for name, us in rows.items():
+        print(f"{name:<22}{np.percentile(us, 50):>12.1f}{np.percentile(us, 99):>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500)
+    args = parser.parse_args()
+    main(args.rows)
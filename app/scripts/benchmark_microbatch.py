@@ -0,0 +1,93 @@
+"""
+Load-test /v1/predict with single-record requests, with and without coalescing.
+
+Requests are sent in-process through an ASGI transport by ``--concurrency``
+concurrent clients; p50/p99 latency and throughput are reported per mode.
+
+Usage:
+    uv run python -m app.scripts.benchmark_microbatch --concurrency 32 --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+import numpy as np
+import pandas as pd
+
+from app.api.main import create_app
+from app.core import get_settings
+from app.services.predictor import ChurnPredictor
+
+settings = get_settings()
+
+
+async def _run_mode(
+    predictor: ChurnPredictor,
+    records: list[dict],
+    microbatch: bool,
+    concurrency: int,
+    n_requests: int,
+) -> dict:
+    app = create_app(predictor=predictor, microbatch=microbatch)
+    latencies: list[float] = []
+    counter = iter(range(n_requests))
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+
+            async def worker():
+                for i in counter:
+                    start = time.perf_counter()
+                    response = await client.post(
+                        "/v1/predict", json=records[i % len(records)]
+                    )
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000
+    return {
+        "mode": "coalesced" if microbatch else "direct",
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "throughput_rps": n_requests / elapsed,
+    }
+
+
+def main(concurrency: int = 32, n_requests: int = 2000):
+    """Run both modes and print a comparison table."""
+    predictor = ChurnPredictor.load()
+    features = pd.read_csv(settings.default_csv_path).drop(columns=["churn"])
+    records = json.loads(features.to_json(orient="records"))
+
+    print(
+        f"concurrency={concurrency} requests={n_requests} "
+        f"max_batch={settings.microbatch_max_size} "
+        f"max_wait_ms={settings.microbatch_max_wait_ms}"
+    )
+    print(f"{'mode':<12}{'p50 (ms)':>10}{'p99 (ms)':>10}{'req/s':>10}")
+    for microbatch in (False, True):
+        result = asyncio.run(
+            _run_mode(predictor, records, microbatch, concurrency, n_requests)
+        )
+        print(
+            f"{result['mode']:<12}{result['p50_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['throughput_rps']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    main(concurrency=args.concurrency, n_requests=args.requests)
@@ -0,0 +1,86 @@
+"""
+Compare the joblib and onnxruntime serving backends.
+
+For each backend:
+- cold start: wall time of a fresh interpreter that loads the predictor and
+  scores one record (imports included), median of ``--cold-runs``
+- throughput: rows/s scoring the training CSV in ``--batch-size`` batches
+- single-record p50/p99 latency of ``predict_records``
+
+Run ``app.scripts.export_onnx`` first.
+
+Usage:
+    uv run --extra onnx python -m app.scripts.benchmark_onnx --cold-runs 3
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_settings
+from app.services.predictor import load_predictor
+
+settings = get_settings()
+
+COLD_START = """
+import pandas as pd
+from app.core import get_settings
+from app.services.predictor import load_predictor
+record = pd.read_csv(get_settings().default_csv_path, nrows=1).to_dict("records")
+load_predictor({backend!r}).predict_records(record)
+"""
+
+
+def _cold_start(backend: str, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", COLD_START.format(backend=backend)],
+            check=True,
+            capture_output=True,
+        )
+        times.append(time.perf_counter() - start)
+    return float(np.median(times))
+
+
+def main(cold_runs: int = 3, batch_size: int = 1024, n_single: int = 300):
+    """Print cold start, batch throughput and single-record latency per backend."""
+    df = pd.read_csv(settings.default_csv_path)
+    records = df.to_dict("records")
+    print(
+        f"{'backend':<8}{'cold start (s)':>16}{'rows/s':>12}"
+        f"{'p50 (us)':>12}{'p99 (us)':>12}"
+    )
+    for backend in ("joblib", "onnx"):
+        predictor = load_predictor(backend)
+        start = time.perf_counter()
+        for i in range(0, len(df), batch_size):
+            predictor.predict_proba(df.iloc[i : i + batch_size])
+        throughput = len(df) / (time.perf_counter() - start)
+
+        latencies = []
+        for record in records[:n_single]:
+            start = time.perf_counter()
+            predictor.predict_records([record])
+            latencies.append(time.perf_counter() - start)
+        us = np.array(latencies) * 1e6
+
+        cold = _cold_start(backend, cold_runs)
+        print(
+            f"{backend:<8}{cold:>16.2f}{throughput:>12.0f}"
+            f"{np.percentile(us, 50):>12.1f}{np.percentile(us, 99):>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cold-runs", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--single", type=int, default=300)
+    args = parser.parse_args()
+    main(args.cold_runs, args.batch_size, args.single)
@@ -0,0 +1,93 @@
+"""
+Show that aggregated EDA rendering stays flat as the row count grows.
+
+For each row count, a synthetic churn-like frame is rendered with the
+binned backend (missingness bitmap, pairwise density grid, embedding
+density image) and, up to ``--legacy-max`` rows, with the previous
+per-row artists (seaborn heatmap, pairplot and ``plt.scatter``).
+
+Usage:
+    uv run python -m app.scripts.benchmark_rendering --rows 10000 100000 1000000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+from app.scripts.eda.dimensionality import _plot_embedding
+from app.scripts.eda.missingness import missingness_heatmap
+from app.scripts.eda.plots import plot_pairwise_interactions
+
+
+def _synthetic(n_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {f"x{i}": rng.normal(size=n_rows).astype("float32") for i in range(8)}
+    )
+    df.loc[rng.random(n_rows) < 0.02, "x3"] = np.nan
+    df["churn"] = np.where(rng.random(n_rows) < 0.15, "yes", "no")
+    return df
+
+
+def _aggregated(df: pd.DataFrame, outdir: Path) -> None:
+    missingness_heatmap(df, outdir)
+    plot_pairwise_interactions(df, "churn", outdir)
+    points = df[["x0", "x1"]].to_numpy()
+    _plot_embedding(
+        df, "churn", points, np.arange(len(df)), "scatter", outdir / "s.png"
+    )
+
+
+def _legacy(df: pd.DataFrame, outdir: Path) -> None:
+    plt.figure(figsize=(12, 8))
+    sns.heatmap(df.isna(), cbar=False, cmap="viridis", yticklabels=False)
+    plt.savefig(outdir / "missing.png", dpi=300)
+    plt.close()
+    sns.pairplot(df[["x0", "x1", "x2", "x3", "x4", "churn"]], hue="churn", corner=True)
+    plt.savefig(outdir / "pair.png", dpi=300)
+    plt.close()
+    plt.figure(figsize=(6, 6))
+    plt.scatter(df["x0"], df["x1"], c=(df["churn"] == "yes"), cmap="coolwarm")
+    plt.savefig(outdir / "s.png", dpi=300)
+    plt.close()
+
+
+def _timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(row_counts: list[int], legacy_max: int = 100_000):
+    """Print render seconds per row count for both backends."""
+    print(f"{'rows':>10}{'aggregated (s)':>16}{'legacy (s)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        outdir = Path(tmp)
+        for n_rows in row_counts:
+            df = _synthetic(n_rows)
+            aggregated = _timed(_aggregated, df, outdir)
+            legacy = _timed(_legacy, df, outdir) if n_rows <= legacy_max else None
+            legacy_text = (
+                f"{legacy:>12.2f}" if legacy is not None else f"{'skipped':>12}"
+            )
+            print(f"{n_rows:>10}{aggregated:>16.2f}{legacy_text}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--legacy-max", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.rows, legacy_max=args.legacy_max)
@@ -0,0 +1,145 @@
+"""
+Compare per-worker model loading with the pre-fork server.
+
+Starts ``app.api.server`` twice on ``--port``:
+- ``per-worker``: ``--no-preload`` and no warm-up, i.e. every worker loads its
+  own model after the fork (what ``uvicorn --workers`` does)
+- ``pre-fork``: the master loads and warms the model, freezes the GC and forks
+
+and reports for each:
+- seconds from launch until ``/ready`` answers 200, and until every worker
+  has answered it
+- latency of the first ``/v1/predict`` call, the worst of the first
+  ``2 * workers`` calls (one fresh connection each) and the steady p50
+- RSS and PSS per worker from ``/proc/<pid>/smaps_rollup`` (Linux); PSS splits
+  shared pages between the processes mapping them, so it shows what each
+  worker really costs
+
+Usage:
+    uv run python -m app.scripts.benchmark_server --workers 4
+"""
+
+import argparse
+import http.client
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_settings
+
+settings = get_settings()
+
+MODES = {
+    "per-worker": (["--no-preload"], {"WARMUP_RECORDS": "0"}),
+    "pre-fork": ([], {}),
+}
+
+
+def _request(port: int, method: str, path: str, body: str | None = None):
+    """One request on a fresh connection; return (status, seconds, body)."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    headers = {"Content-Type": "application/json"} if body else {}
+    start = time.perf_counter()
+    try:
+        conn.request(method, path, body=body, headers=headers)
+        response = conn.getresponse()
+        status, payload = response.status, response.read()
+    except (ConnectionError, http.client.HTTPException):
+        status, payload = 0, b""
+    finally:
+        conn.close()
+    return status, time.perf_counter() - start, payload
+
+
+def _memory_kb(pid: int) -> tuple[int, int]:
+    """(RSS, PSS) of a process in kB."""
+    values = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+        key, _, rest = line.partition(":")
+        if key in ("Rss", "Pss"):
+            values[key] = int(rest.split()[0])
+    return values["Rss"], values["Pss"]
+
+
+def _workers(pid: int) -> list[int]:
+    children = Path(f"/proc/{pid}/task/{pid}/children").read_text().split()
+    return [int(c) for c in children]
+
+
+def run_mode(mode: str, workers: int, port: int, body: str, n_steady: int) -> dict:
+    """Start the server in ``mode``, measure it and shut it down."""
+    args, env = MODES[mode]
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.api.server", "--workers", str(workers)]
+        + ["--port", str(port), *args],
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        ready_s, ready_pids = None, set[int]()
+        while len(ready_pids) < workers:
+            status, _, payload = _request(port, "GET", "/ready")
+            if status == 200:
+                ready_s = ready_s or time.perf_counter() - start
+                ready_pids.add(json.loads(payload)["pid"])
+            elif server.poll() is not None:
+                raise RuntimeError(f"server exited with {server.returncode}")
+            else:
+                time.sleep(0.05)
+        all_ready_s = time.perf_counter() - start
+
+        first = [
+            _request(port, "POST", "/v1/predict", body)[1] for _ in range(2 * workers)
+        ]
+        steady = [
+            _request(port, "POST", "/v1/predict", body)[1] for _ in range(n_steady)
+        ]
+        memory = np.array([_memory_kb(pid) for pid in _workers(server.pid)]) / 1024
+        return {
+            "ready_s": ready_s,
+            "all_ready_s": all_ready_s,
+            "first_ms": first[0] * 1e3,
+            "worst_first_ms": max(first) * 1e3,
+            "steady_p50_ms": float(np.median(steady)) * 1e3,
+            "rss_mb": float(memory[:, 0].mean()),
+            "pss_mb": float(memory[:, 1].mean()),
+        }
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+
+
+def main(workers: int = 4, port: int = 8181, n_steady: int = 100):
+    """Print readiness, first-request latency and memory per worker for both modes."""
+    record = pd.read_csv(settings.default_csv_path, nrows=1).drop(columns=["churn"])
+    body = json.dumps(json.loads(record.to_json(orient="records"))[0])
+    print(
+        f"{'mode':<12}{'ready (s)':>10}{'all (s)':>9}{'first (ms)':>12}{'worst (ms)':>12}"
+        f"{'p50 (ms)':>10}{'RSS/worker':>12}{'PSS/worker':>12}"
+    )
+    for mode in MODES:
+        r = run_mode(mode, workers, port, body, n_steady)
+        print(
+            f"{mode:<12}{r['ready_s']:>10.2f}{r['all_ready_s']:>9.2f}"
+            f"{r['first_ms']:>12.1f}"
+            f"{r['worst_first_ms']:>12.1f}{r['steady_p50_ms']:>10.2f}"
+            f"{r['rss_mb']:>10.0f}MB{r['pss_mb']:>10.0f}MB"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8181)
+    parser.add_argument("--steady", type=int, default=100)
+    args = parser.parse_args()
+    main(args.workers, args.port, args.steady)
@@ -0,0 +1,129 @@
+"""
+Startup benchmark with regression budgets.
+
+- ``import app.services`` (and the other entry points in ``IMPORTS``): total
+  import time from ``python -X importtime`` in a fresh interpreter, median of
+  ``--runs``, plus the slowest modules it pulled in
+- API worker cold start: wall time of a fresh interpreter that imports
+  ``app.api.main``, runs the app lifespan (model load) and scores one record
+
+Exits non-zero when a median is over its budget, so it can gate CI.
+
+Usage:
+    uv run python -m app.scripts.benchmark_startup --runs 5
+    uv run python -m app.scripts.benchmark_startup --backend onnx --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# module -> import time budget (ms)
+IMPORTS = {
+    "app.core": 600.0,
+    "app.services": 50.0,
+    "app.scripts.eda": 50.0,
+    "app.api.main": 2000.0,
+}
+# serving backend -> API worker cold start budget (s)
+COLD_START_BUDGETS = {"joblib": 8.0, "onnx": 3.0}
+
+COLD_START = """
+import asyncio
+import pandas as pd
+from app.api.main import create_app
+from app.core import get_settings
+
+async def boot():
+    app = create_app(microbatch=False)
+    async with app.router.lifespan_context(app):
+        record = pd.read_csv(get_settings().default_csv_path, nrows=1)
+        app.state.predictor.predict_records(record.to_dict("records"))
+
+asyncio.run(boot())
+"""
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """
+    Parse ``-X importtime`` output.
+
+    Returns:
+        dict[str, tuple[int, int]]: Module -> (self, cumulative) microseconds.
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def import_time(module: str) -> dict[str, tuple[int, int]]:
+    """Import ``module`` in a fresh interpreter and return its import times."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def cold_start(backend: str) -> float:
+    """Seconds from interpreter launch to the first scored record."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", COLD_START],
+        check=True,
+        capture_output=True,
+        env={**os.environ, "SERVING_BACKEND": backend},
+    )
+    return time.perf_counter() - start
+
+
+def main(runs: int = 5, backend: str = "joblib", top: int = 10) -> bool:
+    """Print import and cold start times; return whether all are in budget."""
+    ok = True
+    print(f"{'import':<20}{'median (ms)':>14}{'budget (ms)':>14}")
+    slowest: dict[str, int] = {}
+    for module, budget in IMPORTS.items():
+        samples = []
+        for _ in range(runs):
+            times = import_time(module)
+            samples.append(times[module][1] / 1000)
+        median = float(np.median(samples))
+        ok &= median <= budget
+        flag = "" if median <= budget else "  OVER BUDGET"
+        print(f"{module:<20}{median:>14.1f}{budget:>14.0f}{flag}")
+        for name, (self_us, _) in times.items():
+            slowest[name] = max(slowest.get(name, 0), self_us)
+
+    print(f"\nslowest modules by self time (ms), top {top}:")
+    for name, self_us in sorted(slowest.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {self_us / 1000:>8.1f}  {name}")
+
+    budget = COLD_START_BUDGETS[backend]
+    median = float(np.median([cold_start(backend) for _ in range(runs)]))
+    ok &= median <= budget
+    flag = "" if median <= budget else "  OVER BUDGET"
+    print(
+        f"\nAPI worker cold start ({backend}): {median:.2f}s (budget {budget:.1f}s){flag}"
+    )
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--backend", choices=sorted(COLD_START_BUDGETS), default="joblib"
+    )
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    sys.exit(0 if main(args.runs, args.backend, args.top) else 1)
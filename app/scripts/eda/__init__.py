@@ -3,25 +3,59 @@ EDA subpackage for churn analysis.
 
 This package provides modules for:
 - Loading datasets
+- Single-pass streaming statistics (quantile and cardinality sketches)
 - Summarization and feature screening
 - Outlier detection
 - Plotting (univariate, pairwise, correlations)
+- Parallel figure rendering from pre-aggregated data
 - Missingness analysis
 - Dimensionality reduction (PCA, t-SNE, UMAP)
 - Business-oriented analysis and reporting
+
+Names are resolved on first access, so importing the package (or one light
+submodule such as ``stats``) does not import matplotlib or scikit-learn.
 """
 
-from .business import (
-    churn_driver_waterfall,
-    clv_based_analysis,
-    cohort_analysis,
-    executive_summary,
-    funnel_analysis,
-    segmentation_analysis,
-)
-from .dimensionality import plot_pca, plot_tsne, plot_umap
-from .loader import load_dataset
-from .missingness import missingness_heatmap, missingness_summary
-from .outliers import detect_outliers
-from .plots import plot_correlations, plot_pairwise_interactions, plot_univariate
-from .summarization import find_unnecessary_columns, summarize
+import importlib
+
+# public name -> submodule that defines it
+_EXPORTS = {
+    "churn_driver_waterfall": "business",
+    "clv_based_analysis": "business",
+    "cohort_analysis": "business",
+    "executive_summary": "business",
+    "funnel_analysis": "business",
+    "segmentation_analysis": "business",
+    "plot_pca": "dimensionality",
+    "plot_tsne": "dimensionality",
+    "plot_umap": "dimensionality",
+    "FigureSpec": "figures",
+    "render_figures": "figures",
+    "load_dataset": "loader",
+    "missingness_heatmap": "missingness",
+    "missingness_summary": "missingness",
+    "cap_outliers": "outliers",
+    "detect_outliers": "outliers",
+    "iqr_bounds": "outliers",
+    "plot_correlations": "plots",
+    "plot_pairwise_interactions": "plots",
+    "plot_univariate": "plots",
+    "DatasetStats": "stats",
+    "compute_stats": "stats",
+    "find_unnecessary_columns": "summarization",
+    "summarize": "summarization",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
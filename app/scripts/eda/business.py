@@ -12,11 +12,23 @@ import json
 from pathlib import Path
 from typing import List, Optional
 
-import matplotlib.pyplot as plt
 import pandas as pd
-import seaborn as sns
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
+
+from app.services.feature_store import CLV_LABELS, COHORT_BINS, COHORT_LABELS
+
+from .figures import FigureSpec, render_figure
+
+# -----------------------------
+# Helpers
+# -----------------------------
+
+
+def _is_yes(values: pd.Series) -> pd.Series:
+    """Boolean mask of positive values: compact bool/0-1 columns or yes/no strings."""
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        return values > 0
+    return values.astype(str).str.lower() == "yes"
+
 
 # -----------------------------
 # Business-Oriented Visualizations
@@ -44,20 +56,20 @@ def churn_driver_waterfall(df: pd.DataFrame, target: str, outdir: Path):
         )
         corr = df[numeric_cols].sum().sort_values()  # fallback numeric proxy
 
-    import matplotlib.pyplot as plt
-
-    plt.figure(figsize=(10, 5))
-    plt.bar(
-        corr.index,
-        corr.values,
-        color=["red" if x < 0 else "green" for x in corr.values],
+    render_figure(
+        FigureSpec(
+            "bar",
+            outdir / "churn_driver_waterfall.png",
+            {"labels": corr.index.tolist(), "values": corr.to_numpy()},
+            title="Churn Driver Waterfall",
+            ylabel="Correlation with churn (numeric proxy)",
+            figsize=(10, 5),
+            options={
+                "colors": ["red" if x < 0 else "green" for x in corr.values],
+                "rotate": 45,
+            },
+        )
     )
-    plt.xticks(rotation=45, ha="right")
-    plt.title("Churn Driver Waterfall")
-    plt.ylabel("Correlation with churn (numeric proxy)")
-    plt.tight_layout()
-    plt.savefig(outdir / "churn_driver_waterfall.png", dpi=300)
-    plt.close()
 
 
 def clv_based_analysis(df: pd.DataFrame, clv_col: str, target: str, outdir: Path):
@@ -73,24 +85,24 @@ def clv_based_analysis(df: pd.DataFrame, clv_col: str, target: str, outdir: Path
         print(f"[INFO] '{clv_col}' used for CLV analysis instead of missing column.")
 
     df = df.copy()
-    df["clv_segment"] = pd.qcut(
-        df[clv_col], q=4, labels=["Low", "Medium", "High", "Top"]
-    )
+    df["clv_segment"] = pd.qcut(df[clv_col], q=4, labels=CLV_LABELS)
 
     # Ensure target column exists and is numeric-friendly
     if target in df.columns:
-        df[target] = df[target].apply(lambda x: 1 if str(x).lower() == "yes" else 0)
-
-    summary = df.groupby("clv_segment")[target].mean()
-    import matplotlib.pyplot as plt
-
-    plt.figure(figsize=(8, 5))
-    summary.plot(kind="bar", color="skyblue")
-    plt.title("Churn by CLV Segment")
-    plt.ylabel("Churn Rate")
-    plt.tight_layout()
-    plt.savefig(outdir / "clv_churn_analysis.png", dpi=300)
-    plt.close()
+        df[target] = _is_yes(df[target]).astype("int8")
+
+    summary = df.groupby("clv_segment", observed=False)[target].mean()
+    render_figure(
+        FigureSpec(
+            "bar",
+            outdir / "clv_churn_analysis.png",
+            {"labels": summary.index.tolist(), "values": summary.to_numpy()},
+            title="Churn by CLV Segment",
+            ylabel="Churn Rate",
+            figsize=(8, 5),
+            options={"colors": "skyblue"},
+        )
+    )
 
 
 def executive_summary(summary_dict: dict, recs_dict: dict, outdir: Path):
@@ -119,24 +131,30 @@ def cohort_analysis(
     if outdir:
         outdir.mkdir(parents=True, exist_ok=True)
 
-    bins = [0, 12, 24, 48, 1000]
-    labels = ["0-12m", "13-24m", "25-48m", "48m+"]
-    df["cohort"] = pd.cut(df[account_length_col], bins=bins, labels=labels, right=False)
-    cohort_data = df.groupby("cohort")[_target].apply(lambda x: (x == "yes").mean())
+    df["cohort"] = pd.cut(
+        df[account_length_col], bins=COHORT_BINS, labels=COHORT_LABELS, right=False
+    )
+    cohort_data = _is_yes(df[_target]).groupby(df["cohort"], observed=False).mean()
 
     if outdir:
-        plt.figure(figsize=(8, 5))
-        sns.barplot(x=cohort_data.index, y=cohort_data.values, palette="coolwarm")
-        plt.title("Cohort Analysis by Account Length")
-        plt.ylabel("Churn Rate")
-        plt.xlabel("Account Length Cohort")
-        plt.tight_layout()
-        plt.savefig(outdir / "cohort_analysis.png", dpi=300)
-        plt.close()
+        render_figure(_cohort_figure(cohort_data, outdir))
 
     return cohort_data
 
 
+def _cohort_figure(cohort_data: pd.Series, outdir: Path) -> FigureSpec:
+    return FigureSpec(
+        "bar",
+        outdir / "cohort_analysis.png",
+        {"labels": cohort_data.index.tolist(), "values": cohort_data.to_numpy()},
+        title="Cohort Analysis by Account Length",
+        xlabel="Account Length Cohort",
+        ylabel="Churn Rate",
+        figsize=(8, 5),
+        options={"palette": "coolwarm"},
+    )
+
+
 def funnel_analysis(
     df: pd.DataFrame,
     steps_cols: Optional[List[str]] = None,
@@ -159,10 +177,7 @@ def funnel_analysis(
     current_df = df.copy()
 
     for step in steps_cols:
-        if current_df[step].dtype == "object":
-            current_df = current_df[current_df[step].astype(str).str.lower() == "yes"]
-        else:
-            current_df = current_df[current_df[step] > 0]
+        current_df = current_df[_is_yes(current_df[step])]
         funnel_counts.append(len(current_df))
 
     funnel_df = pd.DataFrame(
@@ -174,20 +189,27 @@ def funnel_analysis(
     )
 
     if outdir:
-        plt.figure(figsize=(6, 4))
-        sns.barplot(x="conversion_rate", y="step", data=funnel_df, palette="viridis")
-        plt.xlabel("Conversion Rate")
-        plt.ylabel("Funnel Step")
-        plt.title("Customer Funnel Analysis")
-        plt.xlim(0, 1)
-        plt.tight_layout()
-        plt.savefig(outdir / "funnel_analysis.png", dpi=300)
-        plt.close()
+        render_figure(_funnel_figure(funnel_df, outdir))
 
     print("[INFO] Funnel analysis completed")
     return funnel_df
 
 
+def _funnel_figure(funnel_df: pd.DataFrame, outdir: Path) -> FigureSpec:
+    return FigureSpec(
+        "bar",
+        outdir / "funnel_analysis.png",
+        {
+            "labels": funnel_df["step"].tolist(),
+            "values": funnel_df["conversion_rate"].to_numpy(),
+        },
+        title="Customer Funnel Analysis",
+        xlabel="Conversion Rate",
+        ylabel="Funnel Step",
+        options={"palette": "viridis", "horizontal": True, "xlim": (0, 1)},
+    )
+
+
 def segmentation_analysis(
     df: pd.DataFrame,
     segment_cols: Optional[List[str]] = None,
@@ -196,6 +218,9 @@ def segmentation_analysis(
     n_clusters: int = 4,
 ):
     """Customer segmentation using KMeans and churn analysis."""
+    from sklearn.cluster import KMeans
+    from sklearn.preprocessing import StandardScaler
+
     if outdir:
         outdir.mkdir(parents=True, exist_ok=True)
 
@@ -228,14 +253,25 @@ def segmentation_analysis(
     )
 
     if outdir:
-        plt.figure(figsize=(8, 5))
-        churn_summary.plot(kind="bar", stacked=True, colormap="coolwarm", ax=plt.gca())
-        plt.title("Churn Rate per Customer Segment")
-        plt.ylabel("Proportion")
-        plt.xlabel("Segment")
-        plt.tight_layout()
-        plt.savefig(outdir / "segmentation_churn_analysis.png", dpi=300)
-        plt.close()
+        render_figure(_segmentation_figure(churn_summary, target, outdir))
 
     print("[INFO] Segmentation analysis completed")
     return df_seg
+
+
+def _segmentation_figure(
+    churn_summary: pd.DataFrame, target: str, outdir: Path
+) -> FigureSpec:
+    return FigureSpec(
+        "stacked_bar",
+        outdir / "segmentation_churn_analysis.png",
+        {
+            "labels": churn_summary.index.tolist(),
+            "series": {c: churn_summary[c].to_numpy() for c in churn_summary.columns},
+        },
+        title="Churn Rate per Customer Segment",
+        xlabel="Segment",
+        ylabel="Proportion",
+        figsize=(8, 5),
+        options={"palette": "coolwarm", "legend_title": target},
+    )
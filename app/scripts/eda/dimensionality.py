@@ -2,80 +2,265 @@
 """
 Dimensionality reduction for EDA: PCA, t-SNE, optional UMAP.
 
-Automatically maps categorical targets to numeric/color for plotting.
+Points are drawn as class-shaded density images (see ``render.py``).
+
+t-SNE and UMAP have a scalable mode for large datasets:
+- stratified subsampling that keeps the target ratio (``max_samples``)
+- optional standardization and PCA pre-reduction (``scale``, ``pca_components``)
+- ``n_jobs`` for the neighbour searches
+- UMAP fit on the sample, then ``transform`` of the remaining rows
+- embeddings cached as ``.npy`` under ``cache_dir``, so re-styling a plot
+  does not re-fit
+Each fit logs its wall time and peak RSS.
+
+scikit-learn, matplotlib and UMAP are imported when a plot or fit runs, not
+when the module is imported.
 """
 
+import hashlib
+import importlib.util
+import json
+import time
+from contextlib import contextmanager
 from pathlib import Path
-import matplotlib.pyplot as plt
-from sklearn.decomposition import PCA
-from sklearn.manifold import TSNE
 
-# Try to import UMAP optionally
-try:
-    import umap
+import numpy as np
+import pandas as pd
 
-    UMAP_AVAILABLE = True
-except ImportError:
-    UMAP_AVAILABLE = False
+from app.core import get_logger, get_settings
+from app.utils.memory import peak_rss_mb, reset_peak_rss
 
+# UMAP is optional; only look it up here, import it on first use
+UMAP_AVAILABLE = importlib.util.find_spec("umap") is not None
 
-def _get_color_array(df, target):
-    """Convert categorical target to numeric/color for plotting."""
-    if target is None or target not in df.columns:
-        return None
-    if df[target].dtype == "object":
-        # Map 'yes'/'no' or other string categories to integers
-        return df[target].map({k: i for i, k in enumerate(df[target].unique())})
-    return df[target]
+settings = get_settings()
+logger = get_logger(__name__)
 
 
 # ----------------------
 # PCA
 # ----------------------
 def plot_pca(df, target=None, outdir: Path = Path(".")):
+    from sklearn.decomposition import PCA
+
     numeric_cols = df.select_dtypes(include="number").columns
     pca = PCA(n_components=2)
     X_pca = pca.fit_transform(df[numeric_cols])
-    plt.figure(figsize=(6, 6))
-    colors = _get_color_array(df, target)
-    plt.scatter(X_pca[:, 0], X_pca[:, 1], c=colors, cmap="coolwarm", alpha=0.7)
-    plt.title("PCA: 2D projection")
-    outdir.mkdir(parents=True, exist_ok=True)
-    plt.savefig(outdir / "pca_2d.png", dpi=300)
-    plt.close()
+    _plot_embedding(
+        df,
+        target,
+        X_pca,
+        np.arange(len(df)),
+        "PCA: 2D projection",
+        outdir / "pca_2d.png",
+    )
+
+
+# ----------------------
+# Scalable embeddings
+# ----------------------
+def stratified_sample_index(
+    y: pd.Series | None, n_rows: int, max_samples: int, random_state: int = 42
+) -> np.ndarray:
+    """
+    Return sorted row positions of a sample of at most ``max_samples`` rows.
+
+    With labels ``y`` every class keeps its share of rows (at least one row
+    per class); otherwise rows are drawn uniformly.
+    """
+    if max_samples >= n_rows:
+        return np.arange(n_rows)
+    rng = np.random.default_rng(random_state)
+    if y is None:
+        return np.sort(rng.choice(n_rows, size=max_samples, replace=False))
+
+    codes, _ = pd.factorize(y, use_na_sentinel=False)
+    counts = np.bincount(codes)
+    quota = np.maximum(1, np.floor(counts * max_samples / n_rows)).astype("int64")
+    # Hand out the rows lost to flooring, largest remainders first.
+    remainder = counts * max_samples / n_rows - quota
+    for k in np.argsort(-remainder)[: max(0, max_samples - quota.sum())]:
+        quota[k] += 1
+    picks = [
+        rng.choice(np.flatnonzero(codes == k), size=min(q, c), replace=False)
+        for k, (q, c) in enumerate(zip(quota, counts, strict=True))
+    ]
+    return np.sort(np.concatenate(picks))
+
+
+def _feature_matrix(df: pd.DataFrame, target: str | None, scale: bool) -> np.ndarray:
+    """Numeric features (target excluded) as float32, NaNs median-filled."""
+    cols = [c for c in df.select_dtypes(include="number").columns if c != target]
+    X = np.empty((len(df), len(cols)), dtype="float32", order="F")
+    for i, col in enumerate(cols):
+        X[:, i] = df[col].to_numpy(dtype="float32", na_value=np.nan)
+    missing = np.isnan(X)
+    if missing.any():
+        X[missing] = np.take(np.nanmedian(X, axis=0), np.nonzero(missing)[1])
+    if scale:
+        std = X.std(axis=0)
+        X -= X.mean(axis=0)
+        X /= np.where(std > 0, std, 1)
+    return np.ascontiguousarray(X)
+
+
+@contextmanager
+def _track(label: str, n_rows: int):
+    """Log wall time and peak RSS (MB) of a block."""
+    reset_peak_rss()  # else an earlier, larger block's peak is reported
+    start = time.perf_counter()
+    yield
+    peak_mb = peak_rss_mb()
+    logger.info(
+        "[%s][EDA] %s on %d rows in %.2fs (peak RSS %.0f MB)",
+        settings.env,
+        label,
+        n_rows,
+        time.perf_counter() - start,
+        peak_mb,
+    )
+
+
+def compute_embedding(
+    df: pd.DataFrame,
+    method: str,
+    target: str | None = None,
+    max_samples: int | None = None,
+    pca_components: int | None = None,
+    scale: bool = False,
+    n_jobs: int | None = None,
+    transform_rest: bool = True,
+    cache_dir: Path | None = None,
+    random_state: int = 42,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute (or load from cache) a 2-D t-SNE or UMAP embedding.
+
+    Args:
+        df (pd.DataFrame): Dataset; numeric columns other than ``target`` are used.
+        method (str): ``"tsne"`` or ``"umap"``.
+        target (str | None): Label used for stratified sampling.
+        max_samples (int | None): Fit on at most this many rows.
+        pca_components (int | None): Reduce to this many PCA components first.
+        scale (bool): Standardize features before reduction.
+        n_jobs (int | None): Parallel jobs for the neighbour searches.
+        transform_rest (bool): UMAP only; project the rows left out of the
+            sample with the fitted model.
+        cache_dir (Path | None): Folder for ``.npy`` embedding caches.
+        random_state (int): Seed for sampling and the reducer.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: ``(n, 2)`` embedding and the row
+        positions of ``df`` it covers.
+    """
+    if method not in ("tsne", "umap"):
+        raise ValueError(f"Unknown embedding method: {method}")
+    X = _feature_matrix(df, target, scale)
+    y = df[target] if target is not None and target in df.columns else None
+
+    cache_files = None
+    if cache_dir is not None:
+        params = {
+            "method": method,
+            "max_samples": max_samples,
+            "pca_components": pca_components,
+            "scale": scale,
+            "transform_rest": transform_rest,
+            "random_state": random_state,
+        }
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode())
+        digest.update(np.ascontiguousarray(X).data)
+        if y is not None:
+            digest.update(pd.util.hash_pandas_object(y, index=False).to_numpy())
+        key = f"{method}-{digest.hexdigest()[:16]}"
+        cache_files = (cache_dir / f"{key}.npy", cache_dir / f"{key}.index.npy")
+        if all(f.exists() for f in cache_files):
+            logger.info("[%s][EDA] Loaded cached %s embedding", settings.env, method)
+            return np.load(cache_files[0]), np.load(cache_files[1])
+
+    from sklearn.decomposition import PCA
+
+    sample = stratified_sample_index(y, len(X), max_samples or len(X), random_state)
+    with _track(f"{method} fit", len(sample)):
+        pca = None
+        if pca_components and pca_components < X.shape[1]:
+            pca = PCA(n_components=pca_components, random_state=random_state)
+            pca.fit(X[sample])
+        fit_X = pca.transform(X[sample]) if pca is not None else X[sample]
+
+        if method == "tsne":
+            from sklearn.manifold import TSNE
+
+            embedding = TSNE(
+                n_components=2, random_state=random_state, n_jobs=n_jobs
+            ).fit_transform(fit_X)
+            index = sample
+        else:
+            import umap
+
+            reducer = umap.UMAP(random_state=random_state, n_jobs=n_jobs or 1)
+            embedding = reducer.fit_transform(fit_X)
+            index = sample
+
+    if method == "umap" and transform_rest and len(sample) < len(X):
+        rest = np.setdiff1d(np.arange(len(X)), sample, assume_unique=True)
+        with _track("umap transform", len(rest)):
+            rest_X = pca.transform(X[rest]) if pca is not None else X[rest]
+            embedding = np.vstack([embedding, reducer.transform(rest_X)])
+            index = np.concatenate([sample, rest])
+
+    embedding = embedding.astype("float32")
+    if cache_files is not None:
+        cache_files[0].parent.mkdir(parents=True, exist_ok=True)
+        np.save(cache_files[0], embedding)
+        np.save(cache_files[1], index)
+    return embedding, index
+
+
+def _plot_embedding(df, target, embedding, index, title, path: Path):
+    """Draw a 2-D embedding as a class-shaded density image."""
+    import matplotlib.pyplot as plt
+
+    from .render import draw_density
+
+    labels = None
+    if target is not None and target in df.columns:
+        labels = df[target].to_numpy()[index]
+    fig, ax = plt.subplots(figsize=(6, 6))
+    draw_density(ax, embedding[:, 0], embedding[:, 1], labels)
+    ax.set_title(title)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
 
 
 # ----------------------
 # t-SNE
 # ----------------------
-def plot_tsne(df, target=None, outdir: Path = Path(".")):
-    numeric_cols = df.select_dtypes(include="number").columns
-    tsne = TSNE(n_components=2, random_state=42)
-    X_tsne = tsne.fit_transform(df[numeric_cols])
-    plt.figure(figsize=(6, 6))
-    colors = _get_color_array(df, target)
-    plt.scatter(X_tsne[:, 0], X_tsne[:, 1], c=colors, cmap="coolwarm", alpha=0.7)
-    plt.title("t-SNE: 2D projection")
-    outdir.mkdir(parents=True, exist_ok=True)
-    plt.savefig(outdir / "tsne_2d.png", dpi=300)
-    plt.close()
+def plot_tsne(df, target=None, outdir: Path = Path("."), **embedding_kwargs):
+    """
+    Save a 2-D t-SNE plot.
+
+    ``embedding_kwargs`` are passed to ``compute_embedding`` (``max_samples``,
+    ``pca_components``, ``scale``, ``n_jobs``, ``cache_dir``, ...); without
+    them every row is fitted exactly as before.
+    """
+    embedding, index = compute_embedding(df, "tsne", target, **embedding_kwargs)
+    _plot_embedding(
+        df, target, embedding, index, "t-SNE: 2D projection", outdir / "tsne_2d.png"
+    )
 
 
 # ----------------------
 # UMAP (optional)
 # ----------------------
-def plot_umap(df, target=None, outdir: Path = Path(".")):
+def plot_umap(df, target=None, outdir: Path = Path("."), **embedding_kwargs):
+    """Save a 2-D UMAP plot; see ``plot_tsne`` for ``embedding_kwargs``."""
     if not UMAP_AVAILABLE:
         print("[INFO] UMAP not available, skipping UMAP plots.")
         return
 
-    numeric_cols = df.select_dtypes(include="number").columns
-    reducer = umap.UMAP(random_state=42)
-    X_umap = reducer.fit_transform(df[numeric_cols])
-    plt.figure(figsize=(6, 6))
-    colors = _get_color_array(df, target)
-    plt.scatter(X_umap[:, 0], X_umap[:, 1], c=colors, cmap="coolwarm", alpha=0.7)
-    plt.title("UMAP: 2D projection")
-    outdir.mkdir(parents=True, exist_ok=True)
-    plt.savefig(outdir / "umap_2d.png", dpi=300)
-    plt.close()
+    embedding, index = compute_embedding(df, "umap", target, **embedding_kwargs)
+    _plot_embedding(
+        df, target, embedding, index, "UMAP: 2D projection", outdir / "umap_2d.png"
+    )
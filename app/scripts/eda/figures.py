@@ -0,0 +1,192 @@
+"""
+Figure rendering pool for EDA plots.
+
+Plot functions aggregate their data first (histogram counts, value counts,
+group means) and describe each figure as a small ``FigureSpec``. Specs are
+rendered by worker processes using the Agg backend; each worker draws the
+figure, writes the PNG and returns its timing. Only the aggregates cross
+process boundaries, never the DataFrame.
+"""
+
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.core import get_logger, get_settings
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+@dataclass
+class FigureSpec:
+    """
+    One figure to render.
+
+    ``kind`` selects the renderer (see ``RENDERERS``) and ``data`` holds its
+    pre-aggregated inputs; ``options`` carries labels and styling.
+    """
+
+    kind: str
+    path: Path
+    data: dict[str, Any]
+    title: str = ""
+    xlabel: str | None = None
+    ylabel: str | None = None
+    figsize: tuple[float, float] = (6, 4)
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+# --------------------------
+# Aggregation helpers
+# --------------------------
+def histogram_data(values, bins: int = 30, kde: bool = True) -> dict[str, Any]:
+    """
+    Histogram counts of ``values`` plus an optional binned KDE curve.
+
+    The KDE is a Gaussian-smoothed 512-bin histogram (Scott's bandwidth),
+    scaled to the histogram's counts, so it costs O(n) rather than O(n * grid).
+    """
+    values = np.asarray(values, dtype="float64")
+    values = values[np.isfinite(values)]
+    counts, edges = np.histogram(values, bins=bins)
+    data: dict[str, Any] = {"counts": counts, "edges": edges}
+    std = values.std() if len(values) > 1 else 0.0
+    if kde and std > 0:
+        grid_counts, grid_edges = np.histogram(values, bins=512)
+        step = grid_edges[1] - grid_edges[0]
+        bandwidth = std * len(values) ** (-1 / 5)
+        radius = max(1, int(np.ceil(4 * bandwidth / step)))
+        offsets = np.arange(-radius, radius + 1) * step
+        kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+        kernel /= kernel.sum()
+        smooth = np.convolve(grid_counts, kernel)[radius : radius + len(grid_counts)]
+        data["kde_x"] = (grid_edges[:-1] + grid_edges[1:]) / 2
+        data["kde_y"] = smooth * (edges[1] - edges[0]) / step
+    return data
+
+
+# --------------------------
+# Renderers
+# --------------------------
+def _render_hist(ax, spec: FigureSpec) -> None:
+    data = spec.data
+    ax.stairs(data["counts"], data["edges"], fill=True, alpha=0.6)
+    if "kde_x" in data:
+        ax.plot(data["kde_x"], data["kde_y"])
+    ax.set_ylabel(spec.ylabel or "Count")
+
+
+def _render_bar(ax, spec: FigureSpec) -> None:
+    labels = [str(x) for x in spec.data["labels"]]
+    values = spec.data["values"]
+    colors = spec.options.get("colors")
+    if colors is None and "palette" in spec.options:
+        colors = _palette(spec.options["palette"], len(values))
+    if spec.options.get("horizontal"):
+        ax.barh(labels, values, color=colors)
+        ax.invert_yaxis()
+    else:
+        ax.bar(labels, values, color=colors)
+    if spec.options.get("rotate"):
+        ax.tick_params(axis="x", labelrotation=spec.options["rotate"])
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment("right")
+
+
+def _render_stacked_bar(ax, spec: FigureSpec) -> None:
+    labels = [str(x) for x in spec.data["labels"]]
+    series = spec.data["series"]  # {name: values}
+    colors = _palette(spec.options.get("palette", "coolwarm"), len(series))
+    bottom = np.zeros(len(labels))
+    for color, (name, values) in zip(colors, series.items(), strict=True):
+        ax.bar(labels, values, bottom=bottom, label=str(name), color=color)
+        bottom += np.asarray(values, dtype="float64")
+    ax.legend(title=spec.options.get("legend_title"))
+
+
+def _palette(name: str, n: int) -> list:
+    import matplotlib.pyplot as plt
+
+    return list(plt.get_cmap(name)(np.linspace(0, 1, max(n, 1))))
+
+
+RENDERERS: dict[str, Callable[[Any, FigureSpec], None]] = {
+    "hist": _render_hist,
+    "bar": _render_bar,
+    "stacked_bar": _render_stacked_bar,
+}
+
+
+def render_figure(spec: FigureSpec) -> tuple[Path, float]:
+    """Draw and save one figure; return its path and render seconds."""
+    import matplotlib.pyplot as plt
+
+    start = time.perf_counter()
+    fig, ax = plt.subplots(figsize=spec.figsize)
+    RENDERERS[spec.kind](ax, spec)
+    ax.set_title(spec.title)
+    if spec.xlabel is not None:
+        ax.set_xlabel(spec.xlabel)
+    if spec.ylabel is not None:
+        ax.set_ylabel(spec.ylabel)
+    if "xlim" in spec.options:
+        ax.set_xlim(*spec.options["xlim"])
+    fig.tight_layout()
+    spec.path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(spec.path, dpi=spec.options.get("dpi", settings.figure_dpi))
+    plt.close(fig)
+    return spec.path, time.perf_counter() - start
+
+
+# --------------------------
+# Pool
+# --------------------------
+def _init_worker() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def render_figures(
+    specs: list[FigureSpec], workers: int | None = None
+) -> dict[Path, float]:
+    """
+    Render figures, in parallel worker processes when ``workers > 1``.
+
+    Args:
+        specs (list[FigureSpec]): Figures to render.
+        workers (int | None): Process count; defaults to
+            ``settings.figure_workers`` or the CPU count, and to 1 inside a
+            worker process (e.g. a parallel EDA stage), so pools are never
+            nested. 1 renders in-process.
+
+    Returns:
+        dict[Path, float]: Render seconds per output file.
+    """
+    if not workers:
+        nested = multiprocessing.parent_process() is not None
+        workers = 1 if nested else settings.figure_workers or os.cpu_count() or 1
+    workers = min(workers, len(specs))
+    start = time.perf_counter()
+    if workers <= 1:
+        timings = dict(render_figure(spec) for spec in specs)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            timings = dict(pool.map(render_figure, specs))
+    logger.info(
+        "[%s][EDA] Rendered %d figures with %d worker(s) in %.2fs (%.2fs CPU)",
+        settings.env,
+        len(specs),
+        max(workers, 1),
+        time.perf_counter() - start,
+        sum(timings.values()),
+    )
+    return timings
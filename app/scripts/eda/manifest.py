@@ -0,0 +1,142 @@
+"""
+Content-hash manifest for incremental EDA runs.
+
+A stage's fingerprint combines the hashes of the columns it reads, its
+parameters, the source code of its functions and the fingerprints of the
+stages it depends on. When the fingerprint recorded in the manifest matches
+and the stage's artifacts still exist, the stage is skipped.
+"""
+
+import hashlib
+import inspect
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import joblib
+import pandas as pd
+
+if TYPE_CHECKING:
+    from app.scripts.eda.pipeline import Stage
+
+MANIFEST_VERSION = 1
+
+
+def _sha256(*parts: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def column_digests(df: pd.DataFrame) -> dict[str, str]:
+    """Hash every column once (name, dtype and values)."""
+    return {
+        str(col): _sha256(
+            str(col).encode(),
+            str(df[col].dtype).encode(),
+            pd.util.hash_pandas_object(df[col], index=False).to_numpy().tobytes(),
+        )
+        for col in df.columns
+    }
+
+
+def code_digest(func: Any) -> str:
+    """Hash the source of a function or module (falls back to its name)."""
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = (
+            f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', func)}"
+        )
+    return _sha256(source.encode())
+
+
+def stage_fingerprint(
+    stage: "Stage",
+    df: pd.DataFrame,
+    digests: dict[str, str],
+    target: str,
+    dep_fingerprints: dict[str, str],
+) -> str:
+    """Fingerprint one stage from its inputs, parameters, code and deps."""
+    columns = stage.columns(df, target) if stage.columns else list(df.columns)
+    payload = {
+        "columns": {str(c): digests[str(c)] for c in columns},
+        "target": target,
+        "params": stage.params,
+        "code": [code_digest(f) for f in (stage.func, *stage.code)],
+        "deps": {d: dep_fingerprints.get(d, "") for d in stage.deps},
+    }
+    return _sha256(json.dumps(payload, sort_keys=True, default=str).encode())
+
+
+def _artifact_exists(path: Path) -> bool:
+    """A file must exist; a folder must exist and be non-empty."""
+    if path.is_dir():
+        return any(path.iterdir())
+    return path.exists()
+
+
+class StageManifest:
+    """
+    Fingerprints, timings and cached return values of EDA stages.
+
+    Stored as JSON at ``path``; non-``None`` stage return values are kept with
+    joblib in a ``.eda_cache`` folder next to it so skipped stages can still
+    feed their dependents.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.values_dir = self.path.parent / ".eda_cache"
+        self.stages: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self.stages = data.get("stages", {})
+
+    def fingerprint(self, name: str) -> str:
+        """Return the recorded fingerprint of a stage, or an empty string."""
+        return self.stages.get(name, {}).get("fingerprint", "")
+
+    def is_current(self, stage: "Stage", fingerprint: str) -> bool:
+        """True when the recorded fingerprint matches and artifacts exist."""
+        entry = self.stages.get(stage.name)
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return False
+        if entry.get("has_value") and not self._value_path(stage.name).exists():
+            return False
+        return all(_artifact_exists(Path(p)) for p in stage.outputs)
+
+    def load_value(self, name: str) -> Any:
+        """Return the stored return value of a stage (``None`` if it had none)."""
+        if not self.stages.get(name, {}).get("has_value"):
+            return None
+        return joblib.load(self._value_path(name))
+
+    def record(self, stage: "Stage", fingerprint: str, seconds: float, value: Any):
+        """Record a successful run of ``stage``."""
+        if value is not None:
+            self.values_dir.mkdir(parents=True, exist_ok=True)
+            joblib.dump(value, self._value_path(stage.name))
+        self.stages[stage.name] = {
+            "fingerprint": fingerprint,
+            "seconds": round(seconds, 4),
+            "outputs": [str(p) for p in stage.outputs],
+            "has_value": value is not None,
+            "updated": datetime.now(UTC).isoformat(timespec="seconds"),
+        }
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "stages": self.stages}, f, indent=2)
+        tmp.replace(self.path)
+
+    def _value_path(self, name: str) -> Path:
+        return self.values_dir / f"{name}.joblib"
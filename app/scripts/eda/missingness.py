@@ -4,30 +4,62 @@ Missingness analysis utilities.
 """
 
 from pathlib import Path
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import pandas as pd
 
+from .stats import DatasetStats, compute_stats
+
 
 # --------------------------
 # Missingness Summary
 # --------------------------
-def missingness_summary(df: pd.DataFrame) -> dict:
+def missingness_summary(
+    df: pd.DataFrame | None, stats: DatasetStats | None = None
+) -> dict:
     """Return missingness ratio per column."""
-    return df.isna().mean().sort_values(ascending=False).to_dict()
+    stats = stats or compute_stats(df)
+    return stats.missing_ratio().sort_values(ascending=False).to_dict()
 
 
 # --------------------------
 # Missingness Heatmap
 # --------------------------
-def missingness_heatmap(df: pd.DataFrame, outdir: Path | None = None):
-    """Save a heatmap visualizing missing values per feature."""
+def missingness_heatmap(
+    df: pd.DataFrame, outdir: Path | None = None, max_blocks: int = 400
+):
+    """
+    Save a bitmap of missing values per feature.
+
+    Rows are grouped into at most ``max_blocks`` contiguous blocks and each
+    cell shows the fraction missing in that block, so the image has a fixed
+    size however many rows there are. A bar above it gives each column's
+    overall missing ratio.
+    """
+    import matplotlib.pyplot as plt
+
+    from .render import missing_bitmap
+
     outdir = Path(outdir) if outdir else Path.cwd()
     outdir.mkdir(parents=True, exist_ok=True)
 
-    plt.figure(figsize=(12, 8))
-    sns.heatmap(df.isna(), cbar=False, cmap="viridis", yticklabels=False)
-    plt.title("Missing Values Heatmap")
-    plt.tight_layout()
-    plt.savefig(outdir / "missingness_heatmap.png", dpi=300)
-    plt.close()
+    fractions, starts = missing_bitmap(df, max_blocks)
+    fig, (ax_bar, ax_map) = plt.subplots(
+        2, 1, figsize=(12, 8), sharex=True, height_ratios=(1, 4)
+    )
+    ax_bar.bar(np.arange(df.shape[1]), df.isna().mean().to_numpy(), width=0.9)
+    ax_bar.set_ylabel("missing")
+    image = ax_map.imshow(
+        fractions,
+        aspect="auto",
+        interpolation="nearest",
+        cmap="viridis",
+        vmin=0,
+        vmax=1,
+        extent=(-0.5, df.shape[1] - 0.5, len(df), 0),
+    )
+    ax_map.set_xticks(np.arange(df.shape[1]), df.columns, rotation=90)
+    ax_map.set_ylabel(f"row ({len(starts)} blocks)")
+    fig.colorbar(image, ax=[ax_bar, ax_map], label="fraction missing")
+    fig.suptitle("Missing Values Heatmap")
+    fig.savefig(outdir / "missingness_heatmap.png", dpi=300, bbox_inches="tight")
+    plt.close(fig)
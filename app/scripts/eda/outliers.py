@@ -1,18 +1,122 @@
 """
 Detect outliers in numeric columns using IQR method.
+
+Quartiles of every numeric column come from one vectorized call on a
+column-major float32 block (see ``app.services.preprocessing.column_quantiles``),
+and outliers are counted by broadcasting the fences over the block in row
+chunks. Counts can be split by a grouping column (the fences
+stay global, so groups are compared against the same yardstick).
 """
 
+import numpy as np
 import pandas as pd
 
+from app.services.preprocessing import OutlierCapper, iqr_fences
+
+from .stats import DatasetStats
+
+MASK_CHUNK_ROWS = 1 << 16
+
+
+def numeric_block(
+    df: pd.DataFrame, exclude: list[str] | None = None
+) -> tuple[list[str], np.ndarray]:
+    """Return numeric column names and a column-major float32 block of their values."""
+    cols = [
+        c
+        for c in df.select_dtypes(include="number").columns
+        if c not in (exclude or [])
+    ]
+    # Filled column by column: each write is contiguous and nothing is
+    # copied twice (DataFrame.to_numpy would interleave into row-major order).
+    block = np.empty((len(df), len(cols)), dtype="float32", order="F")
+    for i, col in enumerate(cols):
+        series = df[col]
+        if pd.api.types.is_extension_array_dtype(series):
+            block[:, i] = series.to_numpy(dtype="float32", na_value=np.nan)
+        else:
+            block[:, i] = series.to_numpy()  # cast on assignment, no temp copy
+    return cols, block
+
+
+def iqr_bounds(df: pd.DataFrame, whisker: float = 1.5) -> pd.DataFrame:
+    """Return ``q1``, ``q3``, ``lower`` and ``upper`` per numeric column."""
+    cols, block = numeric_block(df)
+    q1, q3, lower, upper = iqr_fences(block, whisker)
+    return pd.DataFrame(
+        {"q1": q1, "q3": q3, "lower": lower, "upper": upper}, index=cols
+    )
+
+
+def detect_outliers(
+    df: pd.DataFrame | None,
+    stats: DatasetStats | None = None,
+    by: str | None = None,
+    whisker: float = 1.5,
+) -> dict:
+    """
+    Return dictionary with count of outliers per numeric column.
+
+    Args:
+        df (pd.DataFrame | None): Dataset; may be ``None`` when ``stats`` is given.
+        stats (DatasetStats | None): Precomputed streaming statistics; counts
+            are then read from its quantile sketches.
+        by (str | None): Column to split counts by, e.g. ``"state"``; the
+            result is then ``{group: {column: count}}``.
+        whisker (float): Fence distance in IQRs.
+
+    Returns:
+        dict: Outlier counts per column (per group when ``by`` is set).
+    """
+    if stats is not None and by is None:
+        return {col: stats.iqr_outliers(col, whisker) for col in stats.numeric_columns}
+    if df is None:
+        raise ValueError("detect_outliers needs a DataFrame unless stats is given")
+
+    cols, block = numeric_block(df, exclude=[by] if by else None)
+    _, _, lower, upper = iqr_fences(block, whisker)
+
+    if by is None:
+        counts = np.zeros(len(cols), dtype="int64")
+        for start in range(0, len(block), MASK_CHUNK_ROWS):
+            rows = block[start : start + MASK_CHUNK_ROWS]
+            counts += ((rows < lower) | (rows > upper)).sum(axis=0)
+        return dict(zip(cols, counts.tolist(), strict=True))
+
+    codes, groups = pd.factorize(df[by], sort=True)
+    flat = np.zeros(len(groups) * len(cols), dtype="int64")
+    for start in range(0, len(block), MASK_CHUNK_ROWS):
+        rows = block[start : start + MASK_CHUNK_ROWS]
+        row_idx, col_idx = np.nonzero((rows < lower) | (rows > upper))
+        group_idx = codes[start + row_idx]
+        keep = group_idx >= 0  # rows with a missing group
+        flat += np.bincount(
+            group_idx[keep] * len(cols) + col_idx[keep], minlength=len(flat)
+        )
+    table = flat.reshape(len(groups), len(cols))
+    return {
+        group: dict(zip(cols, row.tolist(), strict=True))
+        for group, row in zip(groups.tolist(), table, strict=True)
+    }
+
+
+def cap_outliers(
+    df: pd.DataFrame,
+    whisker: float = 1.5,
+    quantiles: tuple[float, float] | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Return a copy of ``df`` with numeric columns clipped to their IQR fences.
 
-def detect_outliers(df: pd.DataFrame) -> dict:
-    """Return dictionary with count of outliers per numeric column."""
-    outliers = {}
-    numeric_cols = df.select_dtypes(include="number").columns
-    for col in numeric_cols:
-        q1 = df[col].quantile(0.25)
-        q3 = df[col].quantile(0.75)
-        iqr = q3 - q1
-        mask = (df[col] < (q1 - 1.5 * iqr)) | (df[col] > (q3 + 1.5 * iqr))
-        outliers[col] = int(mask.sum())
-    return outliers
+    ``quantiles=(0.01, 0.99)`` winsorizes at those quantiles instead. For use
+    inside a model pipeline, see ``app.services.preprocessing.OutlierCapper``.
+    """
+    columns = columns or df.select_dtypes(include="number").columns.tolist()
+    capper = OutlierCapper(whisker=whisker, quantiles=quantiles)
+    capped = capper.fit_transform(
+        df[columns].to_numpy(dtype="float64", na_value=np.nan)
+    )
+    out = df.copy()
+    out[columns] = pd.DataFrame(capped, columns=columns, index=df.index)
+    return out
@@ -0,0 +1,328 @@
+"""
+Dependency-aware task graph for EDA stages.
+
+Independent stages run concurrently in a process pool. The DataFrame is
+written once as memory-mappable ``.npy`` columns (see
+``app.services.data_cache.write_frame``) and each worker maps it instead of
+receiving a pickled copy. Only the small return values of stages cross
+process boundaries.
+"""
+
+import os
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pandas as pd
+
+from app.core import get_logger, get_settings
+from app.core.metrics import EDA_STAGE_SECONDS
+from app.scripts.eda.manifest import StageManifest, column_digests, stage_fingerprint
+from app.services.data_cache import read_frame, write_frame
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+SHM_DIR = Path("/dev/shm")
+
+_worker_frame: pd.DataFrame | None = None
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One EDA step.
+
+    ``func(df, target, deps)`` receives the dataset, the target column and a
+    dict with the return values of the stages listed in ``deps``.
+
+    For incremental runs, ``columns(df, target)`` names the columns the stage
+    reads (all by default), ``params`` holds its settings, ``outputs`` lists
+    the artifacts it writes and ``code`` lists extra functions (e.g. the plot
+    function it calls) or whole modules whose source is part of its
+    fingerprint.
+    """
+
+    name: str
+    func: Callable[[pd.DataFrame, str, dict[str, Any]], Any]
+    deps: tuple[str, ...] = ()
+    columns: Callable[[pd.DataFrame, str], list[str]] | None = None
+    params: dict[str, Any] = field(default_factory=dict)
+    outputs: tuple[Path, ...] = ()
+    code: tuple[Callable | ModuleType, ...] = ()
+
+
+@dataclass
+class StageResult:
+    """Outcome of one stage: ``ok``, ``cached``, ``failed`` or ``skipped``."""
+
+    name: str
+    status: str
+    seconds: float = 0.0
+    value: Any = field(default=None, repr=False)
+    error: str | None = None
+
+
+# --------------------------
+# Stage selection
+# --------------------------
+def select_stages(
+    stages: list[Stage],
+    only: Iterable[str] | None = None,
+    skip: Iterable[str] | None = None,
+) -> list[Stage]:
+    """
+    Filter stages by name.
+
+    ``only`` keeps the named stages plus everything they depend on; ``skip``
+    drops the named stages and every stage that depends on them.
+    """
+    by_name = {stage.name: stage for stage in stages}
+    unknown = [n for n in [*(only or []), *(skip or [])] if n not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown EDA stages: {unknown}")
+
+    keep = set(by_name)
+    if only:
+        keep = set()
+        todo = list(only)
+        while todo:
+            name = todo.pop()
+            if name not in keep:
+                keep.add(name)
+                todo.extend(by_name[name].deps)
+
+    dropped = set(skip or [])
+    changed = True
+    while changed:
+        changed = False
+        for stage in stages:
+            if stage.name not in dropped and dropped.intersection(stage.deps):
+                dropped.add(stage.name)
+                changed = True
+
+    return [s for s in stages if s.name in keep and s.name not in dropped]
+
+
+# --------------------------
+# Execution
+# --------------------------
+def _init_worker(frame_dir: str) -> None:
+    global _worker_frame
+    import matplotlib
+
+    matplotlib.use("Agg")
+    _worker_frame = read_frame(frame_dir)
+
+
+def _call_stage(
+    stage: Stage, df: pd.DataFrame, target: str, deps: dict[str, Any]
+) -> tuple[Any, float]:
+    start = time.perf_counter()
+    value = stage.func(df, target, deps)
+    return value, time.perf_counter() - start
+
+
+def _run_in_worker(
+    stage: Stage, target: str, deps: dict[str, Any]
+) -> tuple[Any, float]:
+    assert _worker_frame is not None
+    return _call_stage(stage, _worker_frame, target, deps)
+
+
+def _fingerprints(
+    stages: list[Stage], df: pd.DataFrame, target: str, manifest: StageManifest
+) -> dict[str, str]:
+    """Fingerprint stages in dependency order (deps outside the run use the manifest)."""
+    digests = column_digests(df)
+    fingerprints: dict[str, str] = {}
+    pending = list(stages)
+    names = {stage.name for stage in stages}
+    while pending:
+        for stage in list(pending):
+            if any(d in names and d not in fingerprints for d in stage.deps):
+                continue
+            deps = {
+                d: fingerprints.get(d) or manifest.fingerprint(d) for d in stage.deps
+            }
+            fingerprints[stage.name] = stage_fingerprint(
+                stage, df, digests, target, deps
+            )
+            pending.remove(stage)
+    return fingerprints
+
+
+def run_stages(
+    stages: list[Stage],
+    df: pd.DataFrame,
+    target: str,
+    workers: int | None = None,
+    manifest: StageManifest | None = None,
+    force: bool = False,
+) -> dict[str, StageResult]:
+    """
+    Run stages in dependency order, in parallel where the graph allows.
+
+    Args:
+        stages (list[Stage]): Stages to run; dependencies outside this list
+            are treated as already satisfied with a ``None`` value.
+        df (pd.DataFrame): Dataset shared by every stage.
+        target (str): Target column name.
+        workers (int | None): Process pool size; 1 runs in-process.
+            Defaults to the CPU count.
+        manifest (StageManifest | None): When given, stages whose fingerprint
+            and artifacts are unchanged are skipped (status ``cached``), and
+            the manifest is updated and saved after the run.
+        force (bool): Re-run every stage even if its fingerprint matches.
+
+    Returns:
+        dict[str, StageResult]: Results keyed by stage name, in finish order.
+    """
+    workers = workers or os.cpu_count() or 1
+    names = {stage.name for stage in stages}
+    waiting = {stage.name: stage for stage in stages}
+    results: dict[str, StageResult] = {}
+
+    fingerprints: dict[str, str] = {}
+    cached: set[str] = set()
+    if manifest is not None:
+        fingerprints = _fingerprints(stages, df, target, manifest)
+        if not force:
+            cached = {
+                s.name for s in stages if manifest.is_current(s, fingerprints[s.name])
+            }
+
+    def ready() -> list[Stage]:
+        return [
+            stage
+            for stage in waiting.values()
+            if all(d in results or d not in names for d in stage.deps)
+        ]
+
+    def dep_values(stage: Stage) -> dict[str, Any]:
+        values = {}
+        for d in stage.deps:
+            if d in results:
+                values[d] = results[d].value
+            elif manifest is not None:
+                values[d] = manifest.load_value(d)
+            else:
+                values[d] = None
+        return values
+
+    def settle(stage: Stage, outcome: StageResult) -> None:
+        results[stage.name] = outcome
+        logger.info(
+            "[%s][EDA] Stage '%s' %s in %.2fs",
+            settings.env,
+            stage.name,
+            outcome.status,
+            outcome.seconds,
+        )
+        EDA_STAGE_SECONDS.labels(stage=stage.name, status=outcome.status).observe(
+            outcome.seconds
+        )
+        if outcome.status == "ok" and manifest is not None:
+            manifest.record(
+                stage, fingerprints[stage.name], outcome.seconds, outcome.value
+            )
+        if outcome.status in ("failed", "skipped"):
+            _skip_dependents(stage.name, waiting, results)
+
+    def take_ready() -> list[Stage]:
+        """Pop ready stages, settling the cached ones on the spot."""
+        to_run = []
+        batch = ready()
+        while batch:
+            for stage in batch:
+                del waiting[stage.name]
+                if stage.name in results:
+                    continue
+                if stage.name in cached:
+                    assert manifest is not None
+                    value = manifest.load_value(stage.name)
+                    settle(stage, StageResult(stage.name, "cached", value=value))
+                else:
+                    to_run.append(stage)
+            batch = ready()  # cached stages may unblock their dependents
+        return to_run
+
+    try:
+        if workers <= 1 or len(names - cached) <= 1:
+            while waiting:
+                batch = take_ready()
+                if not batch:
+                    break
+                for stage in batch:
+                    try:
+                        value, seconds = _call_stage(
+                            stage, df, target, dep_values(stage)
+                        )
+                        settle(stage, StageResult(stage.name, "ok", seconds, value))
+                    except Exception as exc:  # noqa: BLE001 - only dependents skip
+                        settle(
+                            stage, StageResult(stage.name, "failed", error=repr(exc))
+                        )
+        else:
+            _run_pool(stages, df, target, workers, take_ready, dep_values, settle)
+    finally:
+        if manifest is not None:
+            manifest.save()
+    return results
+
+
+def _run_pool(stages, df, target, workers, take_ready, dep_values, settle) -> None:
+    """Process-pool scheduling loop used by ``run_stages``."""
+    frame_root = SHM_DIR if SHM_DIR.is_dir() else None
+    with tempfile.TemporaryDirectory(prefix="eda-frame-", dir=frame_root) as tmp:
+        write_frame(df, tmp)
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(stages) or 1),
+            initializer=_init_worker,
+            initargs=(tmp,),
+        ) as pool:
+            running: dict[Future, Stage] = {}
+            while True:
+                for stage in take_ready():
+                    future = pool.submit(
+                        _run_in_worker, stage, target, dep_values(stage)
+                    )
+                    running[future] = stage
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    try:
+                        value, seconds = future.result()
+                        settle(stage, StageResult(stage.name, "ok", seconds, value))
+                    except Exception as exc:  # noqa: BLE001 - only dependents skip
+                        settle(
+                            stage, StageResult(stage.name, "failed", error=repr(exc))
+                        )
+
+
+def _skip_dependents(
+    name: str, waiting: dict[str, Stage], results: dict[str, StageResult]
+) -> None:
+    for stage in list(waiting.values()):
+        if name in stage.deps and stage.name not in results:
+            results[stage.name] = StageResult(
+                stage.name, "skipped", error=f"dependency '{name}' did not succeed"
+            )
+            _skip_dependents(stage.name, waiting, results)
+
+
+def format_timings(results: dict[str, StageResult], wall_seconds: float) -> str:
+    """Return a plain-text timing table, slowest stage first."""
+    rows = sorted(results.values(), key=lambda r: r.seconds, reverse=True)
+    width = max([len(r.name) for r in rows] + [5])
+    lines = [f"{'stage':<{width}}  {'status':<8}{'seconds':>10}"]
+    lines += [f"{r.name:<{width}}  {r.status:<8}{r.seconds:>10.2f}" for r in rows]
+    lines.append(f"{'wall':<{width}}  {'':<8}{wall_seconds:>10.2f}")
+    return "\n".join(lines)
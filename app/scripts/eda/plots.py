@@ -1,46 +1,81 @@
 """
 Plotting utilities for EDA: univariate, correlations, pairwise interactions.
+matplotlib and seaborn are imported by the functions that draw with them.
 """
 
 from pathlib import Path
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import pandas as pd
 
+from .figures import FigureSpec, histogram_data, render_figures
 
-def plot_univariate(df: pd.DataFrame, target: str, outdir: Path):
-    """Save univariate plots for numeric and categorical features."""
-    outdir.mkdir(parents=True, exist_ok=True)
+
+def univariate_figures(df: pd.DataFrame, target: str, outdir: Path) -> list[FigureSpec]:
+    """Aggregate every column into histogram / top-category figure specs."""
     num_cols = df.select_dtypes(include="number").columns.tolist()
     cat_cols = df.select_dtypes(exclude="number").columns.tolist()
+    specs = []
 
-    for col in num_cols[:10]:
-        plt.figure(figsize=(6, 4))
-        sns.histplot(df[col].dropna(), kde=True, bins=30)
-        plt.title(f"Distribution of {col}")
-        plt.tight_layout()
-        plt.savefig(outdir / f"{col}_dist.png", dpi=300)
-        plt.close()
-
-    for col in cat_cols[:10]:
-        plt.figure(figsize=(6, 4))
-        df[col].value_counts().head(20).plot(kind="bar")
-        plt.title(f"Top categories of {col}")
-        plt.tight_layout()
-        plt.savefig(outdir / f"{col}_bar.png", dpi=300)
-        plt.close()
+    for col in num_cols:
+        specs.append(
+            FigureSpec(
+                "hist",
+                outdir / f"{col}_dist.png",
+                histogram_data(df[col].to_numpy(dtype="float64", na_value=np.nan)),
+                title=f"Distribution of {col}",
+                xlabel=col,
+            )
+        )
+
+    for col in cat_cols:
+        counts = df[col].value_counts().head(20)
+        specs.append(
+            FigureSpec(
+                "bar",
+                outdir / f"{col}_bar.png",
+                {"labels": counts.index.tolist(), "values": counts.to_numpy()},
+                title=f"Top categories of {col}",
+                xlabel=col,
+                options={"rotate": 90},
+            )
+        )
 
     if target in df.columns:
-        plt.figure(figsize=(6, 4))
-        df[target].value_counts().plot(kind="bar")
-        plt.title(f"{target} distribution")
-        plt.tight_layout()
-        plt.savefig(outdir / f"{target}_distribution.png", dpi=300)
-        plt.close()
+        counts = df[target].value_counts()
+        specs.append(
+            FigureSpec(
+                "bar",
+                outdir / f"{target}_distribution.png",
+                {"labels": counts.index.tolist(), "values": counts.to_numpy()},
+                title=f"{target} distribution",
+                xlabel=target,
+                options={"rotate": 90},
+            )
+        )
+    return specs
+
+
+def plot_univariate(
+    df: pd.DataFrame, target: str, outdir: Path, workers: int | None = None
+) -> dict[Path, float]:
+    """
+    Save univariate plots for every numeric and categorical feature.
+
+    Columns are aggregated here and the figures drawn by ``render_figures``
+    in ``workers`` processes.
+
+    Returns:
+        dict[Path, float]: Render seconds per saved plot.
+    """
+    outdir.mkdir(parents=True, exist_ok=True)
+    return render_figures(univariate_figures(df, target, outdir), workers=workers)
 
 
 def plot_correlations(df: pd.DataFrame, outdir: Path):
     """Plot correlation heatmap for numeric features."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     outdir.mkdir(parents=True, exist_ok=True)
     corr = df.select_dtypes(include="number").corr()
     plt.figure(figsize=(10, 8))
@@ -52,17 +87,26 @@ def plot_correlations(df: pd.DataFrame, outdir: Path):
 
 
 def plot_pairwise_interactions(
-    df: pd.DataFrame, target: str, outdir: Path, sample_size: int = 500
+    df: pd.DataFrame, target: str, outdir: Path, sample_size: int | None = None
 ):
-    """Plot pair plots to detect interaction effects."""
+    """
+    Plot pairwise density grids to detect interaction effects.
+
+    Every row is binned (optionally only a ``sample_size`` sample); panels are
+    images, so the cost does not grow with the row count.
+    """
+    import matplotlib.pyplot as plt
+
+    from .render import pairwise_density_grid
+
     outdir.mkdir(parents=True, exist_ok=True)
-    num_cols = df.select_dtypes(include="number").columns.tolist()
+    num_cols = [c for c in df.select_dtypes(include="number").columns if c != target]
     cols_to_plot = num_cols[:5]  # limit to first 5 numeric for clarity
-    if target in df.columns:
-        cols_to_plot.append(target)
 
-    df_sampled = df[cols_to_plot].sample(n=min(sample_size, len(df)), random_state=42)
-    sns.pairplot(df_sampled, hue=target, corner=True)
-    plt.tight_layout()
-    plt.savefig(outdir / "pairwise_interactions.png", dpi=300)
-    plt.close()
+    if sample_size is not None and sample_size < len(df):
+        df = df.sample(n=sample_size, random_state=42)
+    labels = df[target] if target in df.columns else None
+    fig = pairwise_density_grid(df, cols_to_plot, labels)
+    fig.tight_layout()
+    fig.savefig(outdir / "pairwise_interactions.png", dpi=300)
+    plt.close(fig)
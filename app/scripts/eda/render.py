@@ -0,0 +1,209 @@
+"""
+Aggregated rendering for large-N EDA plots.
+
+Instead of one matplotlib artist per row, data is binned first and drawn as a
+single image, so render time and file size stay roughly constant as the row
+count grows:
+- missingness as a row-block x column bitmap of missing fractions
+- scatters as 2-D histograms, shaded per class datashader-style
+- pairwise panels as density grids with per-class 1-D histograms
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.colors import LogNorm
+from matplotlib.patches import Patch
+
+MAX_CLASSES = 10
+
+
+# --------------------------
+# Aggregation
+# --------------------------
+def missing_bitmap(
+    df: pd.DataFrame, max_blocks: int = 400
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fraction of missing values per (row block, column).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: ``(n_blocks, n_cols)`` fractions and
+        the first row of each block.
+    """
+    isna = df.isna().to_numpy(dtype="uint8")
+    n_blocks = max(1, min(len(df), max_blocks))
+    starts = np.linspace(0, len(df), n_blocks, endpoint=False).astype("int64")
+    if not len(df):
+        return np.zeros((1, df.shape[1])), starts
+    counts = np.add.reduceat(isna, starts, axis=0)
+    sizes = np.diff(np.append(starts, len(df)))[:, None]
+    return counts / sizes, starts
+
+
+def _codes(labels, n_rows: int) -> tuple[np.ndarray, list]:
+    """Class codes per row (all zeros without labels or with too many classes)."""
+    if labels is None:
+        return np.zeros(n_rows, dtype="int64"), []
+    codes, classes = pd.factorize(pd.Series(labels), sort=True)
+    if len(classes) > MAX_CLASSES:
+        return np.zeros(n_rows, dtype="int64"), []
+    return codes, classes.tolist()
+
+
+def density_grid(
+    x, y, labels=None, bins: int = 200
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, list]:
+    """
+    Bin points into a per-class 2-D histogram.
+
+    Returns:
+        tuple: ``(n_classes, bins, bins)`` counts, x edges, y edges and the
+        class names (empty without labels).
+    """
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    codes, classes = _codes(labels, len(x))
+    valid = np.isfinite(x) & np.isfinite(y) & (codes >= 0)
+    x, y, codes = x[valid], y[valid], codes[valid]
+    x_range = _padded_range(x)
+    y_range = _padded_range(y)
+    n_classes = max(1, len(classes))
+    counts = np.empty((n_classes, bins, bins))
+    for k in range(n_classes):
+        counts[k], x_edges, y_edges = np.histogram2d(
+            x[codes == k], y[codes == k], bins=bins, range=(x_range, y_range)
+        )
+    return counts, x_edges, y_edges, classes
+
+
+def _padded_range(values: np.ndarray) -> tuple[float, float]:
+    if not len(values):
+        return 0.0, 1.0
+    low, high = float(values.min()), float(values.max())
+    return (low - 0.5, high + 0.5) if low == high else (low, high)
+
+
+def class_colors(n_classes: int, cmap: str = "coolwarm") -> np.ndarray:
+    """RGB colors for ``n_classes`` classes spread over ``cmap``."""
+    return plt.get_cmap(cmap)(np.linspace(0, 1, max(n_classes, 1)))[:, :3]
+
+
+def shade(counts: np.ndarray, colors: np.ndarray, min_alpha: float = 0.25):
+    """
+    Blend per-class counts into an RGBA image.
+
+    Each bin's color is the count-weighted mix of class colors; opacity grows
+    with the log of the total count, and empty bins are transparent.
+    """
+    total = counts.sum(axis=0)
+    filled = total > 0
+    rgb = np.tensordot(counts, colors, axes=(0, 0))
+    rgb[filled] /= total[filled][:, None]
+    alpha = np.zeros_like(total)
+    if filled.any():
+        scaled = np.log1p(total[filled]) / np.log1p(total.max())
+        alpha[filled] = min_alpha + (1 - min_alpha) * scaled
+    return np.dstack([rgb, alpha]).transpose(1, 0, 2)  # (y, x, rgba)
+
+
+# --------------------------
+# Drawing
+# --------------------------
+def draw_density(ax, x, y, labels=None, bins: int = 200, cmap: str = "coolwarm"):
+    """Draw a scatter as one binned image; classes are blended by count."""
+    counts, x_edges, y_edges, classes = density_grid(x, y, labels, bins)
+    extent = (x_edges[0], x_edges[-1], y_edges[0], y_edges[-1])
+    if classes:
+        colors = class_colors(len(classes), cmap)
+        ax.imshow(
+            shade(counts, colors),
+            origin="lower",
+            extent=extent,
+            aspect="auto",
+            interpolation="nearest",
+        )
+        ax.legend(
+            handles=[
+                Patch(color=c, label=str(k))
+                for k, c in zip(classes, colors, strict=True)
+            ],
+            loc="best",
+            fontsize="small",
+        )
+    else:
+        grid = np.ma.masked_equal(counts[0].T, 0)
+        ax.imshow(
+            grid,
+            origin="lower",
+            extent=extent,
+            aspect="auto",
+            interpolation="nearest",
+            cmap="viridis",
+            norm=LogNorm(vmin=1, vmax=max(grid.max(), 1)),
+        )
+
+
+def draw_histograms(ax, values, labels=None, bins: int = 50, cmap: str = "coolwarm"):
+    """Draw per-class 1-D histograms as step lines (one artist per class)."""
+    values = np.asarray(values, dtype="float64")
+    codes, classes = _codes(labels, len(values))
+    valid = np.isfinite(values) & (codes >= 0)
+    edges = np.histogram_bin_edges(values[valid], bins=bins)
+    colors = class_colors(max(len(classes), 1), cmap)
+    for k in range(max(len(classes), 1)):
+        hist, _ = np.histogram(values[valid & (codes == k)], bins=edges)
+        ax.stairs(hist, edges, color=colors[k] if classes else "C0")
+
+
+def pairwise_density_grid(
+    df: pd.DataFrame,
+    columns: list[str],
+    labels=None,
+    bins: int = 100,
+    cmap: str = "coolwarm",
+):
+    """
+    Lower-triangle pair grid of density images with histograms on the diagonal.
+
+    Returns:
+        matplotlib.figure.Figure: The figure (caller saves and closes it).
+    """
+    n = len(columns)
+    fig, axes = plt.subplots(n, n, figsize=(2.2 * n, 2.2 * n), squeeze=False)
+    for i, row_col in enumerate(columns):
+        for j, col in enumerate(columns):
+            ax = axes[i, j]
+            if j > i:
+                ax.set_visible(False)
+                continue
+            if i == j:
+                draw_histograms(ax, df[col], labels, cmap=cmap)
+            else:
+                counts, x_edges, y_edges, classes = density_grid(
+                    df[col], df[row_col], labels, bins
+                )
+                colors = class_colors(max(len(classes), 1), cmap)
+                ax.imshow(
+                    shade(counts, colors),
+                    origin="lower",
+                    extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+                    aspect="auto",
+                    interpolation="nearest",
+                )
+            if i == n - 1:
+                ax.set_xlabel(col, fontsize="small")
+            if j == 0:
+                ax.set_ylabel(row_col, fontsize="small")
+            ax.tick_params(labelsize="x-small")
+    _, classes = _codes(labels, len(df))
+    if classes:
+        colors = class_colors(len(classes), cmap)
+        fig.legend(
+            handles=[
+                Patch(color=c, label=str(k))
+                for k, c in zip(classes, colors, strict=True)
+            ],
+            loc="upper right",
+        )
+    return fig
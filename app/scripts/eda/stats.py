@@ -0,0 +1,386 @@
+"""
+Single-pass streaming statistics for EDA.
+
+One chunked pass over a DataFrame (or an iterator of chunks, e.g.
+``pd.read_csv(..., chunksize=...)``) collects, per column:
+- row and missing counts
+- running moments (mean, variance via Chan/Welford merging), min and max
+- a KLL-style quantile sketch for numeric columns
+- a HyperLogLog distinct-count sketch
+plus value counts of the target column.
+
+Sketches stay exact until ``exact_limit`` values (quantiles) or distinct
+values (cardinality) have been seen, so small datasets give the same numbers
+as pandas; beyond that they switch to bounded-memory approximations.
+``summarize``, ``find_unnecessary_columns``, ``detect_outliers`` and
+``missingness_summary`` are views over the resulting ``DatasetStats``.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+EXACT_LIMIT = 1 << 16
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+# -----------------------------
+# Sketches
+# -----------------------------
+class QuantileSketch:
+    """
+    Mergeable KLL-style quantile sketch.
+
+    Values are kept exactly until more than ``exact_limit`` have been added;
+    then level buffers are compacted (sort, keep every other item, double its
+    weight) so memory stays around ``O(k log n)``.
+    """
+
+    def __init__(self, k: int = 1024, exact_limit: int = EXACT_LIMIT, seed: int = 0):
+        self.k = k
+        self.exact_limit = exact_limit
+        self.n = 0
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def exact(self) -> bool:
+        """True while every value is still stored with weight 1."""
+        return len(self.levels) == 1
+
+    def update(self, values: np.ndarray) -> None:
+        """Add non-missing values."""
+        values = np.asarray(values, dtype="float64")
+        if not len(values):
+            return
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.n += len(values)
+        if self.n > self.exact_limit:
+            self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch into this one."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self.n += other.n
+        if self.n > self.exact_limit:
+            self._compress()
+
+    def _capacity(self, h: int) -> int:
+        depth = len(self.levels)
+        return max(2, int(np.ceil(self.k * (2 / 3) ** (depth - h - 1))))
+
+    def _compress(self) -> None:
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                level = np.sort(level)
+                even = len(level) - len(level) % 2
+                offset = int(self._rng.integers(2))
+                promoted = level[offset:even:2]
+                self.levels[h] = level[even:]
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
+
+    def _weighted(self) -> tuple[np.ndarray, np.ndarray]:
+        values = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level), 2**h, dtype="float64")
+                for h, level in enumerate(self.levels)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        return values[order], weights[order]
+
+    def quantile(self, q: float | list[float]) -> np.ndarray:
+        """Quantiles (linear interpolation while exact, like pandas)."""
+        qs = np.atleast_1d(np.asarray(q, dtype="float64"))
+        if self.n == 0:
+            return np.full(len(qs), np.nan)
+        if self.exact:
+            return np.quantile(self.levels[0], qs)
+        values, weights = self._weighted()
+        cumulative = np.cumsum(weights)
+        idx = np.searchsorted(cumulative, qs * cumulative[-1], side="left")
+        return values[np.minimum(idx, len(values) - 1)]
+
+    def count_outside(self, lower: float, upper: float) -> float:
+        """Number of values ``< lower`` or ``> upper`` (estimated once compacted)."""
+        values, weights = (self.levels[0], None) if self.exact else self._weighted()
+        mask = (values < lower) | (values > upper)
+        return float(mask.sum() if weights is None else weights[mask].sum())
+
+
+class DistinctSketch:
+    """
+    HyperLogLog distinct counter over 64-bit value hashes.
+
+    The exact set of hashes is kept until it exceeds ``exact_limit``.
+    """
+
+    def __init__(self, p: int = 14, exact_limit: int = EXACT_LIMIT):
+        self.p = p
+        self.exact_limit = exact_limit
+        self.registers = np.zeros(1 << p, dtype="uint8")
+        self.hashes: np.ndarray | None = np.empty(0, dtype="uint64")
+
+    @property
+    def exact(self) -> bool:
+        """True while the distinct count is exact."""
+        return self.hashes is not None
+
+    def update(self, hashes: np.ndarray) -> None:
+        """Add 64-bit hashes of non-missing values."""
+        if not len(hashes):
+            return
+        hashes = np.asarray(hashes, dtype="uint64")
+        if self.hashes is not None:
+            self.hashes = np.union1d(self.hashes, hashes)
+            if len(self.hashes) > self.exact_limit:
+                self.hashes = None
+
+        shift = np.uint64(64 - self.p)
+        idx = (hashes >> shift).astype("int64")
+        rest = hashes & np.uint64((1 << (64 - self.p)) - 1)
+        bit_length = np.zeros(len(rest), dtype="int64")
+        nonzero = rest > 0
+        bit_length[nonzero] = np.floor(np.log2(rest[nonzero].astype("float64"))) + 1
+        rank = (64 - self.p) - bit_length + 1
+        np.maximum.at(self.registers, idx, rank.astype("uint8"))
+
+    def merge(self, other: "DistinctSketch") -> None:
+        """Fold another sketch into this one."""
+        np.maximum(self.registers, other.registers, out=self.registers)
+        if self.hashes is not None and other.hashes is not None:
+            self.hashes = np.union1d(self.hashes, other.hashes)
+            if len(self.hashes) > self.exact_limit:
+                self.hashes = None
+        else:
+            self.hashes = None
+
+    def count(self) -> int:
+        """Distinct count (exact, or the HyperLogLog estimate)."""
+        if self.hashes is not None:
+            return len(self.hashes)
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype("float64"))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+        return round(estimate)
+
+
+# -----------------------------
+# Per-column and dataset stats
+# -----------------------------
+@dataclass
+class ColumnStats:
+    """Streaming statistics for one column."""
+
+    dtype: str
+    numeric: bool
+    count: int = 0
+    missing: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = np.inf
+    max: float = -np.inf
+    quantiles: QuantileSketch | None = None
+    distinct: DistinctSketch = field(default_factory=DistinctSketch)
+
+    def update(self, series: pd.Series) -> None:
+        """Fold one chunk of the column in."""
+        if not self.numeric:
+            isna = series.isna().to_numpy()
+            present = series[~isna] if isna.any() else series
+            self.missing += int(isna.sum())
+            self.count += len(present)
+            # HyperLogLog ignores repeats, so only hash each chunk's uniques.
+            uniques = np.asarray(present.unique(), dtype=object)
+            self.distinct.update(pd.util.hash_array(uniques))
+            return
+
+        values = series.to_numpy(dtype="float64", na_value=np.nan)
+        isna = np.isnan(values)
+        if isna.any():
+            values = values[~isna]
+        self.missing += int(isna.sum())
+        n = len(values)
+        if not n:
+            return
+        self.distinct.update(pd.util.hash_array(pd.unique(values)))
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta**2 * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        if self.quantiles is None:
+            self.quantiles = QuantileSketch()
+        self.quantiles.update(values)
+
+    @property
+    def rows(self) -> int:
+        return self.count + self.missing
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (``ddof=1``, like pandas)."""
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+
+@dataclass
+class DatasetStats:
+    """Result of one streaming pass over a dataset."""
+
+    n_rows: int
+    columns: dict[str, ColumnStats]
+    target: str | None = None
+    target_counts: dict = field(default_factory=dict)
+    n_chunks: int = 0
+
+    @property
+    def dtypes(self) -> dict[str, str]:
+        return {name: col.dtype for name, col in self.columns.items()}
+
+    @property
+    def numeric_columns(self) -> list[str]:
+        return [name for name, col in self.columns.items() if col.numeric]
+
+    def missing_ratio(self) -> pd.Series:
+        """Missing-value ratio per column, in column order."""
+        n = max(self.n_rows, 1)
+        return pd.Series(
+            {name: col.missing / n for name, col in self.columns.items()},
+            dtype="float64",
+        )
+
+    def nunique(self) -> pd.Series:
+        """Distinct non-missing values per column."""
+        return pd.Series(
+            {name: col.distinct.count() for name, col in self.columns.items()},
+            dtype="int64",
+        )
+
+    def nunique_exact(self, name: str) -> bool:
+        return self.columns[name].distinct.exact
+
+    def quantiles(self, name: str, qs: list[float]) -> np.ndarray:
+        sketch = self.columns[name].quantiles
+        return sketch.quantile(qs) if sketch else np.full(len(qs), np.nan)
+
+    def iqr_outliers(self, name: str, whisker: float = 1.5) -> int:
+        """Count values outside ``[q1 - w*iqr, q3 + w*iqr]``."""
+        sketch = self.columns[name].quantiles
+        if sketch is None:
+            return 0
+        q1, q3 = sketch.quantile([0.25, 0.75])
+        iqr = q3 - q1
+        return round(sketch.count_outside(q1 - whisker * iqr, q3 + whisker * iqr))
+
+    def describe(self) -> pd.DataFrame:
+        """Count, mean, std, min, quartiles and max of the numeric columns."""
+        rows = {}
+        for name in self.numeric_columns:
+            col = self.columns[name]
+            q1, q2, q3 = self.quantiles(name, [0.25, 0.5, 0.75])
+            rows[name] = {
+                "count": col.count,
+                "mean": col.mean if col.count else np.nan,
+                "std": col.std,
+                "min": col.min if col.count else np.nan,
+                "25%": q1,
+                "50%": q2,
+                "75%": q3,
+                "max": col.max if col.count else np.nan,
+            }
+        return pd.DataFrame.from_dict(rows, orient="index")
+
+
+class StatsAccumulator:
+    """Fold DataFrame chunks into a ``DatasetStats``."""
+
+    def __init__(self, target: str | None = None):
+        self.target = target
+        self.n_rows = 0
+        self.n_chunks = 0
+        self.columns: dict[str, ColumnStats] = {}
+        self.target_counts: Counter = Counter()
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        for name in chunk.columns:
+            series = chunk[name]
+            col = self.columns.get(name)
+            numeric = pd.api.types.is_numeric_dtype(
+                series
+            ) and not pd.api.types.is_bool_dtype(series)
+            if col is None:
+                col = self.columns[name] = ColumnStats(str(series.dtype), numeric)
+                col.missing += self.n_rows  # column absent from earlier chunks
+            elif col.dtype != str(series.dtype):
+                col.dtype = "float64" if col.numeric and numeric else "object"
+                col.numeric = col.numeric and numeric
+            col.update(series)
+        if self.target is not None and self.target in chunk.columns:
+            self.target_counts.update(chunk[self.target].value_counts().to_dict())
+        self.n_rows += len(chunk)
+        self.n_chunks += 1
+
+    def result(self) -> DatasetStats:
+        counts = dict(
+            sorted(self.target_counts.items(), key=lambda kv: kv[1], reverse=True)
+        )
+        return DatasetStats(
+            n_rows=self.n_rows,
+            columns=self.columns,
+            target=self.target,
+            target_counts=counts,
+            n_chunks=self.n_chunks,
+        )
+
+
+def iter_frame_chunks(
+    df: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterable[pd.DataFrame]:
+    """Yield row slices of ``df`` without copying."""
+    for start in range(0, max(len(df), 1), chunk_size):
+        yield df.iloc[start : start + chunk_size]
+
+
+def compute_stats(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    target: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> DatasetStats:
+    """
+    Compute ``DatasetStats`` in one chunked pass.
+
+    Args:
+        data (pd.DataFrame | Iterable[pd.DataFrame]): A DataFrame, or an
+            iterator of chunks such as ``pd.read_csv(path, chunksize=...)``.
+        target (str | None): Column whose value counts are collected.
+        chunk_size (int): Rows per chunk when ``data`` is a DataFrame.
+
+    Returns:
+        DatasetStats: Statistics for every column.
+    """
+    chunks = (
+        iter_frame_chunks(data, chunk_size) if isinstance(data, pd.DataFrame) else data
+    )
+    accumulator = StatsAccumulator(target=target)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.result()
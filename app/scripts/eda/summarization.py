@@ -1,37 +1,63 @@
 """
 Summarize dataset and detect unnecessary features.
+
+Both functions are views over ``DatasetStats`` (see ``stats.py``); pass a
+precomputed ``stats`` to reuse one streaming pass across several reports.
 """
 
 import pandas as pd
 
+from .stats import DatasetStats, compute_stats
+
 
-def summarize(df: pd.DataFrame, target: str) -> dict:
+def summarize(
+    df: pd.DataFrame | None, target: str, stats: DatasetStats | None = None
+) -> dict:
     """Return dataset summary: shape, dtypes, missing, target distribution."""
-    summary = {}
-    summary["n_rows"], summary["n_cols"] = df.shape
-    summary["dtypes"] = df.dtypes.astype(str).to_dict()
-    summary["missing_ratio"] = df.isna().mean().sort_values(ascending=False).to_dict()
-
-    if target in df.columns:
-        counts = df[target].value_counts().to_dict()
-        pct = df[target].value_counts(normalize=True).to_dict()
+    stats = stats or compute_stats(df, target)
+    summary: dict = {}
+    summary["n_rows"], summary["n_cols"] = stats.n_rows, len(stats.columns)
+    summary["dtypes"] = stats.dtypes
+    summary["missing_ratio"] = (
+        stats.missing_ratio().sort_values(ascending=False).to_dict()
+    )
+
+    if target in stats.columns:
+        counts = stats.target_counts
+        total = sum(counts.values())
+        pct = {k: v / total for k, v in counts.items()} if total else {}
         summary["target_distribution"] = {"counts": counts, "percent": pct}
 
     return summary
 
 
-def find_unnecessary_columns(df: pd.DataFrame, target: str, missing_thresh=0.5) -> dict:
+def find_unnecessary_columns(
+    df: pd.DataFrame | None,
+    target: str,
+    missing_thresh=0.5,
+    stats: DatasetStats | None = None,
+) -> dict:
     """Detect ID-like, constant, high-missing, and high-cardinality categorical columns."""
+    stats = stats or compute_stats(df, target)
     recs = {}
-    nunique = df.nunique()
-    missing_ratio = df.isna().mean()
-
-    recs["id_like"] = [c for c in df.columns if nunique[c] == len(df) and c != target]
-    recs["constant"] = [c for c in df.columns if nunique[c] == 1]
-    recs["high_missing"] = [c for c in df.columns if missing_ratio[c] > missing_thresh]
+    nunique = stats.nunique()
+    missing_ratio = stats.missing_ratio()
+    # A HyperLogLog estimate is only within ~2% of the true count.
+    id_like_min = {
+        c: stats.n_rows if stats.nunique_exact(c) else 0.98 * stats.n_rows
+        for c in stats.columns
+    }
+
+    recs["id_like"] = [
+        c for c in stats.columns if nunique[c] >= id_like_min[c] and c != target
+    ]
+    recs["constant"] = [c for c in stats.columns if nunique[c] == 1]
+    recs["high_missing"] = [
+        c for c in stats.columns if missing_ratio[c] > missing_thresh
+    ]
     recs["high_cardinality"] = [
         c
-        for c in df.select_dtypes(include="object").columns
-        if nunique[c] > 100 and c != target
+        for c, dtype in stats.dtypes.items()
+        if dtype in ("object", "category") and nunique[c] > 100 and c != target
     ]
     return recs
@@ -0,0 +1,49 @@
+"""
+Export the serving preprocessor + model to ONNX and check parity.
+
+The joblib artifacts named in settings are converted into one ONNX graph,
+written next to them as ``<serving_model_name>.onnx``; both backends then
+score the training CSV and the largest absolute probability difference is
+reported (the export fails above ``--tolerance``).
+
+Usage:
+    uv run --extra onnx python -m app.scripts.export_onnx
+    uv run --extra onnx python -m app.scripts.export_onnx --tolerance 1e-5
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_settings
+from app.services.model_loader import load_model
+from app.services.onnx_backend import OnnxChurnPredictor, export_onnx
+from app.services.predictor import ChurnPredictor
+
+settings = get_settings()
+
+
+def main(tolerance: float = 1e-5) -> float:
+    """Export the serving model and return the max probability difference."""
+    artifact_dir = settings.serving_artifact_dir
+    preprocessor = load_model(settings.serving_preprocessor_name, artifact_dir)
+    model = load_model(settings.serving_model_name, artifact_dir)
+    path = export_onnx(preprocessor, model, settings.serving_model_name)
+
+    df = pd.read_csv(settings.default_csv_path)
+    expected = ChurnPredictor(preprocessor, model).predict_proba(df)
+    actual = OnnxChurnPredictor.load().predict_proba(df)
+    max_diff = float(np.abs(actual - expected).max())
+    print(f"Exported {path} ({path.stat().st_size / 1e6:.2f} MB)")
+    print(f"Max |p_onnx - p_joblib| over {len(df)} rows: {max_diff:.2e}")
+    if max_diff > tolerance:
+        raise SystemExit(f"Parity check failed: {max_diff:.2e} > {tolerance:.0e}")
+    return max_diff
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tolerance", type=float, default=1e-5)
+    args = parser.parse_args()
+    main(args.tolerance)
@@ -0,0 +1,88 @@
+"""
+Build and query the local feature store.
+
+``build`` materializes a customer CSV into the store: the first run (or
+``--full``) writes every row, later runs derive features only for new and
+changed rows and rewrite only the chunks they touch. A CSV without the key
+column is keyed by row number. ``--clv-col`` names the value column of the
+CLV segments (default: ``monthly_charges``, else ``account_length``). ``get`` prints one customer's stored row and
+how long the indexed lookup took.
+
+Usage:
+    uv run python -m app.scripts.feature_store build
+    uv run python -m app.scripts.feature_store build --source customers.csv --key id
+    uv run python -m app.scripts.feature_store build --clv-col total_day_charge
+    uv run python -m app.scripts.feature_store get 42
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from app.core import get_logger, get_settings
+from app.services.data_cache import read_csv_cached
+from app.services.feature_store import FeatureStore
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+def build(
+    store: FeatureStore,
+    source: str,
+    key: str,
+    full: bool,
+    clv_col: str | None = None,
+) -> dict[str, int]:
+    """Materialize ``source`` into ``store``."""
+    df = read_csv_cached(source)
+    if key not in df.columns:
+        logger.warning(
+            "[%s][FEATURE_STORE] '%s' not in %s; keying rows by row number",
+            settings.env,
+            key,
+            source,
+        )
+        df = df.assign(**{key: np.arange(len(df))})
+    return store.materialize(df, key=key, clv_col=clv_col, full=full)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--root", default=settings.feature_store_path)
+    sub = parser.add_subparsers(dest="command", required=True)
+    bld = sub.add_parser("build", help="Materialize a CSV into the store")
+    bld.add_argument("--source", default=settings.default_csv_path)
+    bld.add_argument("--key", default=settings.feature_store_key)
+    bld.add_argument("--full", action="store_true", help="Rebuild every row")
+    bld.add_argument("--clv-col", default=None, help="Value column of CLV segments")
+    get = sub.add_parser("get", help="Print one customer's features")
+    get.add_argument("key")
+    get.add_argument("--columns", nargs="*", default=None)
+    sub.add_parser("info", help="Print the store manifest summary")
+    args = parser.parse_args()
+
+    store = FeatureStore(args.root)
+    if args.command == "build":
+        print(build(store, args.source, args.key, args.full, args.clv_col))
+    elif args.command == "get":
+        start = time.perf_counter()
+        record = store.get(args.key, args.columns)
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        if record is None:
+            parser.exit(1, f"unknown key: {args.key}\n")
+        print(json.dumps(record, indent=2, default=str))
+        print(f"lookup: {elapsed_us:.0f} us")
+    else:
+        manifest = store.manifest()
+        print(
+            f"v{store.version}: {manifest.get('rows', 0)} rows in "
+            f"{len(manifest.get('chunks', {}))} chunks, key "
+            f"'{manifest.get('key')}', columns: {', '.join(manifest.get('columns', []))}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Manage the versioned model registry.
+
+``register`` stores the current serving artifacts (preprocessor, model and,
+if exported, the ONNX graph) as a new version; ``promote`` makes a version
+live, which running API workers with ``SERVING_REGISTRY=true`` pick up within
+``registry_poll_seconds``.
+
+Usage:
+    uv run python -m app.scripts.registry list
+    uv run python -m app.scripts.registry register --promote
+    uv run python -m app.scripts.registry promote v2
+"""
+
+import argparse
+from pathlib import Path
+
+from app.core import get_settings
+from app.services.model_loader import load_model
+from app.services.model_registry import ModelRegistry
+
+settings = get_settings()
+
+
+def register(registry: ModelRegistry, name: str, promote: bool) -> str:
+    """Register the serving artifacts named in settings as a new version."""
+    artifact_dir = settings.serving_artifact_dir
+    artifacts: dict = {
+        "preprocessor": load_model(settings.serving_preprocessor_name, artifact_dir),
+        "model": load_model(settings.serving_model_name, artifact_dir),
+    }
+    onnx_path = Path(artifact_dir) / f"{settings.serving_model_name}.onnx"
+    if onnx_path.exists():
+        artifacts["model_onnx"] = onnx_path
+    metadata = {"source": str(artifact_dir), "model": settings.serving_model_name}
+    return registry.register(name, artifacts, metadata=metadata, promote=promote)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--name", default=settings.registry_model_name)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="List versions")
+    reg = sub.add_parser("register", help="Register the serving artifacts")
+    reg.add_argument("--promote", action="store_true", help="Make it live")
+    prom = sub.add_parser("promote", help="Make a version live")
+    prom.add_argument("version")
+    args = parser.parse_args()
+
+    registry = ModelRegistry()
+    if args.command == "register":
+        print(register(registry, args.name, args.promote))
+    elif args.command == "promote":
+        registry.promote(args.name, args.version)
+    else:
+        manifest = registry.manifest(args.name)
+        for version, info in manifest["versions"].items():
+            live = " (live)" if version == manifest["live"] else ""
+            print(f"{version}{live}  {info['created_at']}  {', '.join(info['files'])}")
+
+
+if __name__ == "__main__":
+    main()
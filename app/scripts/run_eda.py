@@ -10,18 +10,31 @@ Features:
 - Advanced dimensionality reduction: PCA, t-SNE, UMAP
 - Business-oriented analysis: churn drivers, CLV-based segmentation, executive summary
 
+Stages run as a dependency-aware task graph; independent stages run in
+parallel worker processes that memory-map the dataset. Fingerprints and
+timings are kept in reports/eda_manifest.json, and a stage is skipped when its
+input columns, parameters and code are unchanged and its artifacts exist.
+Stage durations and outcomes are also written to reports/eda_metrics.prom in
+the Prometheus textfile format.
+
 Usage:
-    uv run python -m app.scripts.eda --target churn
+    uv run python -m app.scripts.run_eda --target churn
+    uv run python -m app.scripts.run_eda --only tsne umap --workers 2
+    uv run python -m app.scripts.run_eda --skip tsne umap pairwise
 """
 
 import json
+import time
 from pathlib import Path
 
+from app.core import metrics
 from app.scripts.eda import (
     churn_driver_waterfall,
     clv_based_analysis,
     detect_outliers,
+    dimensionality,
     executive_summary,
+    figures,
     find_unnecessary_columns,
     load_dataset,
     missingness_heatmap,
@@ -31,21 +44,30 @@ from app.scripts.eda import (
     plot_tsne,
     plot_umap,
     plot_univariate,
+    render,
     summarize,
 )
+from app.scripts.eda.manifest import StageManifest
+from app.scripts.eda.pipeline import Stage, format_timings, run_stages, select_stages
+from app.scripts.eda.plots import univariate_figures
+from app.scripts.eda.stats import (
+    ColumnStats,
+    DistinctSketch,
+    QuantileSketch,
+    StatsAccumulator,
+    compute_stats,
+)
 
 ROOT = Path(__file__).resolve().parents[1]
 REPORTS_DIR = ROOT / "reports"
-REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
 # Separate subfolders for plots
 UNIVARIATE_DIR = REPORTS_DIR / "plots" / "univariate"
 PAIRWISE_DIR = REPORTS_DIR / "plots" / "pairwise"
 DIMENSIONALITY_DIR = REPORTS_DIR / "plots" / "dimensionality"
 BUSINESS_DIR = REPORTS_DIR / "plots" / "business"
-
-for d in [UNIVARIATE_DIR, PAIRWISE_DIR, DIMENSIONALITY_DIR, BUSINESS_DIR]:
-    d.mkdir(parents=True, exist_ok=True)
+MANIFEST_PATH = REPORTS_DIR / "eda_manifest.json"
+METRICS_PATH = REPORTS_DIR / "eda_metrics.prom"  # node-exporter textfile format
 
 
 def _to_json_safe(obj):
@@ -64,38 +86,224 @@ def _to_json_safe(obj):
         return str(obj)
 
 
-def main(target: str = "churn"):
-    """Perform EDA"""
-    df = load_dataset()
+# -----------------------------
+# Stages
+# -----------------------------
+def stage_stats(df, target, _deps):
+    """One streaming pass shared by the summary and screening stages."""
+    return compute_stats(df, target=target)
+
 
-    # Summary
-    summary = summarize(df, target=target)
-    summary["outliers"] = detect_outliers(df)
-    summary["missingness"] = missingness_summary(df)
+def stage_summary(df, target, deps):
+    """Dataset summary with outliers and missingness."""
+    stats = deps.get("stats")
+    summary = summarize(df, target=target, stats=stats)
+    if target in df.columns:
+        # Totals and the per-target split share the exact fences; the sketch
+        # fences in ``stats`` are approximate above EXACT_LIMIT rows.
+        summary["outliers"] = detect_outliers(df)
+        summary["outliers_by_target"] = detect_outliers(df, by=target)
+    else:
+        summary["outliers"] = detect_outliers(df, stats=stats)
+    summary["missingness"] = missingness_summary(df, stats=stats)
     with open(REPORTS_DIR / "eda_summary.json", "w", encoding="utf-8") as f:
         json.dump(_to_json_safe(summary), f, indent=2)
+    return summary
 
-    # Feature screening
-    recs = find_unnecessary_columns(df, target=target)
+
+def stage_screening(df, target, deps):
+    """Feature screening recommendations."""
+    recs = find_unnecessary_columns(df, target=target, stats=deps.get("stats"))
     with open(REPORTS_DIR / "eda_feature_screening.json", "w", encoding="utf-8") as f:
         json.dump(_to_json_safe(recs), f, indent=2)
+    return recs
+
 
-    # Plots
+def stage_univariate(df, target, _deps):
     plot_univariate(df, target=target, outdir=UNIVARIATE_DIR)
+
+
+def stage_pairwise(df, target, _deps):
     plot_pairwise_interactions(df, target=target, outdir=PAIRWISE_DIR)
-    missingness_heatmap(df, outdir=REPORTS_DIR / "plots" / "missingness")
 
-    # Dimensionality reduction
+
+def stage_missingness(df, _target, _deps):
+    missingness_heatmap(df, outdir=MISSINGNESS_DIR)
+
+
+def stage_pca(df, target, _deps):
     plot_pca(df, target=target, outdir=DIMENSIONALITY_DIR / "pca")
-    plot_tsne(df, target=target, outdir=DIMENSIONALITY_DIR / "tsne")
-    plot_umap(df, target=target, outdir=DIMENSIONALITY_DIR / "umap")
 
-    # Business reports
+
+def stage_tsne(df, target, _deps):
+    plot_tsne(df, target=target, outdir=DIMENSIONALITY_DIR / "tsne", **EMBEDDING_PARAMS)
+
+
+def stage_umap(df, target, _deps):
+    plot_umap(df, target=target, outdir=DIMENSIONALITY_DIR / "umap", **EMBEDDING_PARAMS)
+
+
+def stage_churn_drivers(df, target, _deps):
     churn_driver_waterfall(df, target=target, outdir=BUSINESS_DIR)
+
+
+def stage_clv(df, target, _deps):
     clv_based_analysis(
         df, clv_col="monthly_charges", target=target, outdir=BUSINESS_DIR
     )
-    executive_summary(summary_dict=summary, recs_dict=recs, outdir=BUSINESS_DIR)
+
+
+def stage_executive_summary(_df, _target, deps):
+    executive_summary(
+        summary_dict=deps["summary"] or {},
+        recs_dict=deps["screening"] or {},
+        outdir=BUSINESS_DIR,
+    )
+
+
+def _numeric_and_target(df, target):
+    """Columns read by the numeric-only plots."""
+    cols = df.select_dtypes(include="number").columns.tolist()
+    return cols + [target] if target in df.columns and target not in cols else cols
+
+
+def _no_columns(_df, _target):
+    return []
+
+
+MISSINGNESS_DIR = REPORTS_DIR / "plots" / "missingness"
+
+# Scalable t-SNE/UMAP: stratified sample, scaled + PCA-reduced features,
+# embeddings cached so plot-only changes skip the fit.
+EMBEDDING_PARAMS = {
+    "max_samples": 5000,
+    "pca_components": 10,
+    "scale": True,
+    "n_jobs": -1,
+    "cache_dir": REPORTS_DIR / ".eda_cache" / "embeddings",
+}
+
+# Modules in ``code`` (render, figures, dimensionality) are fingerprinted by
+# their whole source, so a change to any helper in them reruns the stage.
+STAGES = [
+    Stage(
+        "stats",
+        stage_stats,
+        code=(
+            compute_stats,
+            StatsAccumulator,
+            ColumnStats,
+            QuantileSketch,
+            DistinctSketch,
+        ),
+    ),
+    Stage(
+        "summary",
+        stage_summary,
+        deps=("stats",),
+        code=(summarize, detect_outliers, missingness_summary, _to_json_safe),
+        outputs=(REPORTS_DIR / "eda_summary.json",),
+    ),
+    Stage(
+        "screening",
+        stage_screening,
+        deps=("stats",),
+        code=(find_unnecessary_columns, _to_json_safe),
+        outputs=(REPORTS_DIR / "eda_feature_screening.json",),
+    ),
+    Stage(
+        "univariate",
+        stage_univariate,
+        code=(plot_univariate, univariate_figures, figures),
+        outputs=(UNIVARIATE_DIR,),
+    ),
+    Stage(
+        "pairwise",
+        stage_pairwise,
+        columns=_numeric_and_target,
+        code=(plot_pairwise_interactions, render),
+        outputs=(PAIRWISE_DIR / "pairwise_interactions.png",),
+    ),
+    Stage(
+        "missingness",
+        stage_missingness,
+        code=(missingness_heatmap, render),
+        outputs=(MISSINGNESS_DIR / "missingness_heatmap.png",),
+    ),
+    Stage(
+        "pca",
+        stage_pca,
+        columns=_numeric_and_target,
+        code=(plot_pca, render),
+        outputs=(DIMENSIONALITY_DIR / "pca" / "pca_2d.png",),
+    ),
+    Stage(
+        "tsne",
+        stage_tsne,
+        columns=_numeric_and_target,
+        params=EMBEDDING_PARAMS,
+        code=(dimensionality, render),
+        outputs=(DIMENSIONALITY_DIR / "tsne" / "tsne_2d.png",),
+    ),
+    Stage(
+        "umap",
+        stage_umap,
+        columns=_numeric_and_target,
+        params=EMBEDDING_PARAMS,
+        code=(dimensionality, render),
+        outputs=(DIMENSIONALITY_DIR / "umap" / "umap_2d.png",),
+    ),
+    Stage(
+        "churn_drivers",
+        stage_churn_drivers,
+        columns=_numeric_and_target,
+        code=(churn_driver_waterfall, figures),
+        outputs=(BUSINESS_DIR / "churn_driver_waterfall.png",),
+    ),
+    Stage(
+        "clv",
+        stage_clv,
+        columns=_numeric_and_target,
+        params={"clv_col": "monthly_charges"},
+        code=(clv_based_analysis, figures),
+        outputs=(BUSINESS_DIR / "clv_churn_analysis.png",),
+    ),
+    Stage(
+        "executive_summary",
+        stage_executive_summary,
+        deps=("summary", "screening"),
+        columns=_no_columns,
+        code=(executive_summary,),
+        outputs=(BUSINESS_DIR / "executive_summary.json",),
+    ),
+]
+
+
+def main(
+    target: str = "churn",
+    workers: int | None = None,
+    only: list[str] | None = None,
+    skip: list[str] | None = None,
+    force: bool = False,
+):
+    """Perform EDA, skipping stages whose inputs, params and code are unchanged."""
+    for d in [UNIVARIATE_DIR, PAIRWISE_DIR, DIMENSIONALITY_DIR, BUSINESS_DIR]:
+        d.mkdir(parents=True, exist_ok=True)
+    df = load_dataset()
+    stages = select_stages(STAGES, only=only, skip=skip)
+    manifest = StageManifest(MANIFEST_PATH)
+
+    start = time.perf_counter()
+    results = run_stages(
+        stages, df, target=target, workers=workers, manifest=manifest, force=force
+    )
+    print(format_timings(results, time.perf_counter() - start))
+    if metrics.enabled():
+        metrics.write_textfile(METRICS_PATH)
+
+    failed = [r.name for r in results.values() if r.status == "failed"]
+    if failed:
+        raise RuntimeError(f"EDA stages failed: {failed}")
 
 
 if __name__ == "__main__":
@@ -103,5 +311,29 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--target", type=str, default="churn")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Process pool size (1: serial)"
+    )
+    parser.add_argument(
+        "--only", nargs="+", default=None, help="Run these stages and their deps"
+    )
+    parser.add_argument(
+        "--skip", nargs="+", default=None, help="Skip these stages and dependents"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Re-run stages even if unchanged"
+    )
+    parser.add_argument("--list", action="store_true", help="List stages and exit")
     args = parser.parse_args()
-    main(target=args.target)
+    if args.list:
+        for stage in STAGES:
+            deps = f" (after {', '.join(stage.deps)})" if stage.deps else ""
+            print(f"{stage.name}{deps}")
+    else:
+        main(
+            target=args.target,
+            workers=args.workers,
+            only=args.only,
+            skip=args.skip,
+            force=args.force,
+        )
@@ -0,0 +1,55 @@
+"""
+Batch-score a customer file with the saved preprocessor and model.
+
+Reads the input in fixed-size chunks and writes predictions incrementally,
+so files larger than RAM can be scored.
+
+Usage:
+    uv run python -m app.scripts.score customers.csv predictions.csv
+    uv run python -m app.scripts.score customers.csv predictions.parquet --workers 4
+    uv run python -m app.scripts.score customers.csv predictions.csv --resume
+"""
+
+import argparse
+
+from app.core import get_settings
+from app.services.batch_scoring import score_file
+
+settings = get_settings()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse CLI arguments and score the input file."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("input", help="Input CSV with raw customer features")
+    parser.add_argument("output", help="Output file (.csv or .parquet)")
+    parser.add_argument("--chunk-size", type=int, default=settings.score_chunk_size)
+    parser.add_argument("--workers", type=int, default=1, help="Process pool size")
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Write chunks as they finish instead of in input order",
+    )
+    parser.add_argument("--start-row", type=int, default=None)
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue after the rows already present in the output CSV",
+    )
+    parser.add_argument("--id-column", type=str, default="id")
+    args = parser.parse_args(argv)
+
+    return score_file(
+        args.input,
+        args.output,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        ordered=not args.unordered,
+        start_row=args.start_row,
+        resume=args.resume,
+        id_column=args.id_column or None,
+    )
+
+
+if __name__ == "__main__":
+    main()
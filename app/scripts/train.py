@@ -0,0 +1,103 @@
+"""
+Train the churn MLP with streamed mini-batches and early stopping.
+
+Loads the compact training set, fits the serving preprocessor
+(``build_preprocessor``) on a stratified training split, trains
+``MLPClassifier`` epoch by epoch (see ``app.services.training``) and saves
+through ``model_loader``:
+- ``<name>_preprocessor``: the fitted preprocessor
+- ``<name>``: the best model so far, checkpointed after every improvement
+
+``<name>`` defaults to the stem of ``settings.model_path``. Each epoch prints
+losses, validation AUC, throughput and peak RSS.
+
+Usage:
+    uv run python -m app.scripts.train --epochs 20 --batch-size 64
+    uv run python -m app.scripts.train --threads 1 --patience 5
+"""
+
+import argparse
+from pathlib import Path
+
+from app.core import get_logger, get_settings
+from app.services.data_loader import load_train
+from app.services.model_loader import save_model
+from app.services.preprocessing import build_preprocessor
+from app.services.training import (
+    EpochStats,
+    build_training_data,
+    feature_columns,
+    train_mlp,
+)
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+HEADER = (
+    f"{'epoch':>5}{'loss':>9}{'val loss':>10}{'val AUC':>9}"
+    f"{'seconds':>9}{'samples/s':>11}{'peak RSS':>10}"
+)
+
+
+def _print_epoch(stats: EpochStats) -> None:
+    print(
+        f"{stats.epoch:>5}{stats.train_loss:>9.4f}{stats.val_loss:>10.4f}"
+        f"{stats.val_auc:>9.4f}{stats.seconds:>9.2f}"
+        f"{stats.samples_per_second:>11.0f}{stats.peak_rss_mb:>8.0f}MB"
+    )
+
+
+def main(
+    target: str = "churn",
+    epochs: int | None = None,
+    batch_size: int | None = None,
+    threads: int | None = None,
+    patience: int | None = None,
+    model_name: str | None = None,
+):
+    """Train, checkpoint and print per-epoch metrics."""
+    model_name = model_name or Path(settings.model_path).stem
+    df = load_train()
+    num_cols, cat_cols = feature_columns(df, target)
+    preprocessor = build_preprocessor(num_cols, cat_cols)
+    data = build_training_data(df, target, preprocessor)
+    save_model(preprocessor, f"{model_name}_preprocessor")
+
+    print(HEADER)
+    result = train_mlp(
+        data,
+        epochs=epochs,
+        batch_size=batch_size,
+        threads=threads,
+        patience=patience,
+        checkpoint_name=model_name,
+        on_epoch=_print_epoch,
+    )
+    best = result.history[result.best_epoch - 1]
+    print(
+        f"best epoch {result.best_epoch}: val loss {best.val_loss:.4f}, "
+        f"val AUC {best.val_auc:.4f}; saved as '{model_name}'"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--target", type=str, default="churn")
+    parser.add_argument("--epochs", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument(
+        "--threads", type=int, default=None, help="BLAS threads (0: default)"
+    )
+    parser.add_argument(
+        "--patience", type=int, default=None, help="Early stopping patience"
+    )
+    parser.add_argument("--model-name", type=str, default=None)
+    args = parser.parse_args()
+    main(
+        target=args.target,
+        epochs=args.epochs,
+        batch_size=args.batch_size,
+        threads=args.threads,
+        patience=args.patience,
+        model_name=args.model_name,
+    )
@@ -1,18 +1,36 @@
 """
 Service-level loaders for data and models.
 Convenient imports for app-wide usage.
+
+Names are resolved on first access, so ``import app.services`` stays cheap and
+pandas, scikit-learn and joblib load only when a loader is used.
 """
 
-from .data_loader import get_splits, load_sample_submission, load_test, load_train
-from .model_loader import load_model, save_model
+import importlib
 
-__all__ = [
+# public name -> submodule that defines it
+_EXPORTS = {
     # Data loader
-    "load_train",
-    "load_test",
-    "load_sample_submission",
-    "get_splits",
+    "load_train": "data_loader",
+    "load_test": "data_loader",
+    "load_sample_submission": "data_loader",
+    "get_splits": "data_loader",
+    "split_indices": "data_loader",
     # Model loader
-    "load_model",
-    "save_model",
-]
+    "load_model": "model_loader",
+    "save_model": "model_loader",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,267 @@
+"""
+FILE: app/services/batch_scoring.py
+Streaming, chunked batch scoring for customer files larger than RAM.
+
+The input CSV is read ``chunk_size`` rows at a time; each chunk goes through
+the saved preprocessor and model and is appended to the output straight away,
+so peak memory is bounded by the chunk size times the number of chunks in
+flight. Chunks can be spread over a process pool.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from app.core import get_logger, get_settings
+from app.services.predictor import ChurnPredictor, load_predictor
+
+# --------------------------
+# Settings and Logger
+# --------------------------
+settings = get_settings()
+logger = get_logger(__name__)
+
+_worker_predictor: ChurnPredictor | None = None
+
+
+# --------------------------
+# Chunk scoring
+# --------------------------
+def score_chunk(
+    predictor: ChurnPredictor, chunk: pd.DataFrame, id_column: str | None = "id"
+) -> pd.DataFrame:
+    """Score one chunk and return its output rows (row offset, id, scores)."""
+    probabilities = predictor.predict_proba(chunk)
+    out = pd.DataFrame({"row": chunk.index.to_numpy()})
+    if id_column and id_column in chunk.columns:
+        out[id_column] = chunk[id_column].to_numpy()
+    out["churn_probability"] = probabilities
+    out["churn"] = probabilities >= settings.prediction_threshold
+    return out
+
+
+def _init_worker(predictor: ChurnPredictor | None) -> None:
+    global _worker_predictor
+    _worker_predictor = predictor or load_predictor()
+
+
+def _score_in_worker(
+    index: int, chunk: pd.DataFrame, id_column: str | None
+) -> tuple[int, pd.DataFrame]:
+    assert _worker_predictor is not None
+    return index, score_chunk(_worker_predictor, chunk, id_column)
+
+
+# --------------------------
+# Input / output
+# --------------------------
+def iter_chunks(
+    path: str | Path, chunk_size: int, start_row: int = 0
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield CSV chunks whose index is the 0-based input row number.
+
+    Resumed rows are skipped with a predicate rather than a ``range``, which
+    pandas would expand into a set of every skipped line number.
+    """
+    reader = pd.read_csv(
+        path,
+        chunksize=chunk_size,
+        skiprows=(lambda line: 0 < line <= start_row) if start_row else None,
+    )
+    offset = start_row
+    for chunk in reader:
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        yield chunk
+
+
+def count_written_rows(path: str | Path) -> int:
+    """
+    Count complete data rows in an existing output CSV.
+
+    A trailing partial line (from an interrupted run) is truncated first.
+    """
+    path = Path(path)
+    if not path.exists() or path.stat().st_size == 0:
+        return 0
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        # Walk back block by block to the last newline.
+        pos = end
+        while pos > 0:
+            start = max(0, pos - (1 << 16))
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b"\n")
+            if newline != -1:
+                pos = start + newline + 1
+                break
+            pos = start
+        if pos != end:
+            f.truncate(pos)
+        f.seek(0)
+        lines = sum(block.count(b"\n") for block in iter(lambda: f.read(1 << 20), b""))
+    return max(0, lines - 1)  # minus header
+
+
+class _OutputWriter:
+    """Append scored chunks to a CSV or Parquet file."""
+
+    def __init__(self, path: Path, append: bool):
+        self.path = path
+        self.format = "parquet" if path.suffix == ".parquet" else "csv"
+        # An empty file (e.g. a run killed before its first chunk) still
+        # needs the header.
+        self._append = append and path.exists() and path.stat().st_size > 0
+        self._parquet: Any = None
+        if self.format == "parquet" and append:
+            raise ValueError("Resuming is only supported for CSV output")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._append and path.exists():
+            path.unlink()
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self.format == "csv":
+            frame.to_csv(self.path, mode="a", header=not self._append, index=False)
+            self._append = True
+            return
+
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Parquet output requires pyarrow") from exc
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if self._parquet is None:
+            self._parquet = pq.ParquetWriter(self.path, table.schema)
+        self._parquet.write_table(table)
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+# --------------------------
+# Entry point
+# --------------------------
+def score_file(
+    input_path: str | Path,
+    output_path: str | Path,
+    chunk_size: int | None = None,
+    workers: int = 1,
+    ordered: bool = True,
+    start_row: int | None = None,
+    resume: bool = False,
+    id_column: str | None = "id",
+    predictor: ChurnPredictor | None = None,
+) -> int:
+    """
+    Score ``input_path`` chunk by chunk and write predictions to ``output_path``.
+
+    Args:
+        input_path (str | Path): Customer CSV with the raw feature columns.
+        output_path (str | Path): ``.csv`` or ``.parquet`` output file.
+        chunk_size (int | None): Rows per chunk. Defaults to
+            ``settings.score_chunk_size``.
+        workers (int): Processes to spread chunks over; 1 scores in-process.
+        ordered (bool): Write chunks in input order. Otherwise chunks are
+            written as they finish (use the ``row`` column to re-order).
+        start_row (int | None): Skip this many input rows and append.
+        resume (bool): Continue after the rows already in ``output_path``.
+        id_column (str | None): Input column copied to the output, if present.
+        predictor (ChurnPredictor | None): Predictor to use; loaded from
+            settings when omitted.
+
+    Returns:
+        int: Number of rows scored in this run.
+    """
+    chunk_size = chunk_size or settings.score_chunk_size
+    output_path = Path(output_path)
+    if resume and start_row is None:
+        start_row = count_written_rows(output_path)
+    if (resume or start_row) and workers > 1 and not ordered:
+        raise ValueError("Resuming requires ordered output")
+    start_row = start_row or 0
+
+    writer = _OutputWriter(output_path, append=resume or start_row > 0)
+    chunks = iter_chunks(input_path, chunk_size, start_row)
+    logger.info(
+        "[%s][BATCH_SCORE] Scoring %s from row %d (chunk=%d, workers=%d)",
+        settings.env,
+        input_path,
+        start_row,
+        chunk_size,
+        workers,
+    )
+
+    n_rows = 0
+    try:
+        if workers <= 1:
+            model = predictor or load_predictor()
+            for chunk in chunks:
+                writer.write(score_chunk(model, chunk, id_column))
+                n_rows += len(chunk)
+        else:
+            n_rows = _score_parallel(
+                chunks, writer, workers, ordered, id_column, predictor
+            )
+    finally:
+        writer.close()
+
+    logger.info(
+        "[%s][BATCH_SCORE] Wrote %d rows to %s", settings.env, n_rows, output_path
+    )
+    return n_rows
+
+
+def _score_parallel(
+    chunks: Iterator[pd.DataFrame],
+    writer: _OutputWriter,
+    workers: int,
+    ordered: bool,
+    id_column: str | None,
+    predictor: ChurnPredictor | None,
+) -> int:
+    """Score chunks in a process pool with at most ``2 * workers`` in flight."""
+    max_pending = 2 * workers
+    pending: set[Future] = set()
+    done_out_of_order: dict[int, pd.DataFrame] = {}
+    next_index = 0
+    n_rows = 0
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(predictor,)
+    ) as pool:
+        submitted = 0
+        exhausted = False
+        while pending or not exhausted:
+            # Buffered out-of-order results count against the window too.
+            while not exhausted and len(pending) + len(done_out_of_order) < max_pending:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                    break
+                pending.add(pool.submit(_score_in_worker, submitted, chunk, id_column))
+                submitted += 1
+            if not pending:
+                break
+
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, frame = future.result()
+                n_rows += len(frame)
+                if not ordered:
+                    writer.write(frame)
+                    continue
+                done_out_of_order[index] = frame
+            while next_index in done_out_of_order:
+                writer.write(done_out_of_order.pop(next_index))
+                next_index += 1
+
+    return n_rows
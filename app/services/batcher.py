@@ -0,0 +1,133 @@
+"""
+FILE: app/services/batcher.py
+Asyncio request coalescer for single-record predictions.
+
+Concurrent ``submit`` calls are queued and scored together: a batch is
+flushed once it holds ``max_batch_size`` records or ``max_wait_ms`` has passed
+since its first record arrived. Scoring runs in a worker thread so the event
+loop keeps accepting requests while a batch is in flight.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+
+from app.core import get_logger, get_settings
+from app.core.metrics import BATCH_SIZE
+
+# --------------------------
+# Settings and Logger
+# --------------------------
+settings = get_settings()
+logger = get_logger(__name__)
+
+_Item = tuple[Any, asyncio.Future]
+
+
+class MicroBatcher:
+    """Collect concurrent records and score them with one batch call."""
+
+    def __init__(
+        self,
+        score_batch: Callable[[Sequence[Any]], np.ndarray],
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+    ):
+        self.score_batch = score_batch
+        self.max_batch_size = max_batch_size or settings.microbatch_max_size
+        self.max_wait = (
+            settings.microbatch_max_wait_ms if max_wait_ms is None else max_wait_ms
+        ) / 1000
+        self._queue: asyncio.Queue[_Item] | None = None
+        self._worker: asyncio.Task | None = None
+        self._stopped = False
+        self._batch_size = BATCH_SIZE.labels(kind="microbatch")
+
+    async def start(self) -> None:
+        """Start the background batching loop on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._stopped = False
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the batching loop and fail any records queued or in flight."""
+        self._stopped = True
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batcher stopped"))
+
+    async def submit(self, record: Any) -> float:
+        """Queue one record and wait for its score."""
+        if self._queue is None:
+            raise RuntimeError("MicroBatcher.start() has not been called")
+        if self._stopped:
+            raise RuntimeError("Batcher stopped")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future))
+        return await future
+
+    async def _collect(self, batch: list[_Item]) -> None:
+        """Fill ``batch`` in place so a cancelled loop can still fail it."""
+        assert self._queue is not None
+        batch.append(await self._queue.get())
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            # Drain what is already queued before waiting on the clock.
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+
+    async def _run(self) -> None:
+        batch: list[_Item] = []
+        try:
+            while True:
+                batch = []
+                await self._collect(batch)
+                await self._score(batch)
+        finally:
+            # Records already dequeued (collecting or scoring) when stop()
+            # cancelled the loop would otherwise wait forever.
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Batcher stopped"))
+
+    async def _score(self, batch: list[_Item]) -> None:
+        records = [record for record, _ in batch]
+        self._batch_size.observe(len(records))
+        try:
+            scores = await asyncio.to_thread(self.score_batch, records)
+        except Exception as exc:  # noqa: BLE001 - fan any failure out to every caller
+            logger.error(
+                "[%s][MICROBATCH] Batch of %d failed: %s",
+                settings.env,
+                len(batch),
+                exc,
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        logger.debug("[%s][MICROBATCH] Scored batch of %d", settings.env, len(batch))
+        for (_, future), score in zip(batch, scores.tolist()):
+            if not future.done():
+                future.set_result(score)
@@ -0,0 +1,450 @@
+"""
+FILE: app/services/cross_validation.py
+Stratified k-fold cross-validation of the serving preprocessing plus a model.
+
+``sklearn.model_selection.cross_validate`` on a ``Pipeline`` refits the whole
+``ColumnTransformer`` on every training fold and pickles the DataFrame to
+every worker. Here the frame is encoded once (``encode_frame``: numerics in
+the float dtype the imputer would work in, categoricals as integer codes over
+their sorted categories) and each fold's preprocessing is derived from
+per-fold sufficient statistics (``fold_params``):
+
+- imputer medians: one sort per column, then the middle of the values
+  outside the held-out fold
+- scaler mean and variance: per-fold count, mean and M2 of the observed
+  values, merged over the training folds together with the imputed medians
+- one-hot categories: per-fold category counts; a category is kept when it
+  occurs outside the held-out fold
+
+Folds are plain index arrays (``stratified_folds``). The encoded arrays are
+written once to memory-mapped files, so joblib workers receive a file
+reference plus the fold indices and parameters, build their own matrices, fit
+a clone of the model and score it. Scores match ``cross_validate`` on
+``build_preprocessor(num_cols, cat_cols, engineered=False)`` with the same
+folds.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_logger, get_settings
+from app.services.data_loader import binary_target, serving_view
+from app.services.training import feature_columns
+
+# --------------------------
+# Settings and Logger
+# --------------------------
+settings = get_settings()
+logger = get_logger(__name__)
+
+MISSING = "missing"  # fill value of the categorical imputer
+SPARSE_THRESHOLD = 0.3  # ColumnTransformer default
+
+
+# --------------------------
+# Folds
+# --------------------------
+def fold_ids(
+    target: pd.Series | np.ndarray, n_splits: int, random_state: int = 42
+) -> np.ndarray:
+    """
+    Stratified fold number of every row.
+
+    Rows of each class are shuffled and dealt round-robin; the deal continues
+    across classes, so fold sizes differ by at most one row.
+    """
+    labels = np.asarray(target)
+    rng = np.random.default_rng(random_state)
+    folds = np.empty(len(labels), dtype="int32")
+    offset = 0
+    for label in np.unique(labels):
+        rows = rng.permutation(np.flatnonzero(labels == label))
+        folds[rows] = (offset + np.arange(len(rows))) % n_splits
+        offset += len(rows)
+    return folds
+
+
+def stratified_folds(
+    target: pd.Series | np.ndarray,
+    n_splits: int | None = None,
+    random_state: int = 42,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Stratified k-fold splits as sorted row-index arrays.
+
+    Args:
+        target (pd.Series | np.ndarray): Labels to stratify on.
+        n_splits (int | None): Number of folds. Defaults to ``settings.cv_folds``.
+        random_state (int): Seed of the shuffle.
+
+    Returns:
+        list[tuple[np.ndarray, np.ndarray]]: ``(train, test)`` row positions
+        per fold; also accepted as ``cv=`` by scikit-learn.
+    """
+    n_splits = n_splits or settings.cv_folds
+    folds = fold_ids(target, n_splits, random_state)
+    return [
+        (np.flatnonzero(folds != k), np.flatnonzero(folds == k))
+        for k in range(n_splits)
+    ]
+
+
+# --------------------------
+# Encoding
+# --------------------------
+@dataclass
+class EncodedFrame:
+    """Feature columns encoded once for every fold."""
+
+    numeric: np.ndarray  # (n_rows, n_num) float32/float64, NaN where missing
+    codes: np.ndarray  # (n_rows, n_cat) int32 positions in ``categories``
+    categories: list[np.ndarray]  # sorted categories per categorical column
+    num_cols: list[str]
+    cat_cols: list[str]
+
+
+def _numeric_dtype(frame: pd.DataFrame) -> np.dtype:
+    """
+    Float dtype ``SimpleImputer`` validates ``frame`` to: the common dtype of
+    the columns when that is a float (float32 for compact ``load_train``
+    frames), else float64.
+    """
+    if frame.shape[1] == 0:
+        return np.dtype("float64")
+    try:
+        dtype = np.result_type(*frame.dtypes)
+    except TypeError:  # pandas extension dtypes
+        return np.dtype("float64")
+    return dtype if dtype.kind == "f" else np.dtype("float64")
+
+
+def encode_frame(
+    df: pd.DataFrame, num_cols: list[str], cat_cols: list[str]
+) -> EncodedFrame:
+    """
+    Encode the feature columns as the serving preprocessor sees them.
+
+    Bool flags become ``yes``/``no`` and missing categoricals ``"missing"``,
+    as in ``build_preprocessor``; categories are sorted like
+    ``OneHotEncoder``'s. Numerics keep the float dtype scikit-learn would
+    impute and scale them in, so compact frames round like the pipeline.
+    """
+    view = serving_view(df, num_cols + cat_cols)
+    dtype = _numeric_dtype(view[num_cols])
+    numeric = np.empty((len(df), len(num_cols)), dtype=dtype)
+    for j, col in enumerate(num_cols):
+        numeric[:, j] = pd.to_numeric(view[col], errors="coerce")
+    codes = np.empty((len(df), len(cat_cols)), dtype="int32")
+    categories = []
+    for j, col in enumerate(cat_cols):
+        values = view[col].astype(object).where(view[col].notna(), MISSING)
+        codes[:, j], uniques = pd.factorize(values, sort=True)
+        categories.append(np.asarray(uniques, dtype=object))
+    return EncodedFrame(numeric, codes, categories, list(num_cols), list(cat_cols))
+
+
+# --------------------------
+# Per-fold parameters
+# --------------------------
+class FoldParams(NamedTuple):
+    """Preprocessing fitted on one fold's training rows."""
+
+    median: np.ndarray  # imputer fill value per numeric column
+    mean: np.ndarray  # scaler mean per numeric column
+    scale: np.ndarray  # scaler std per numeric column (1 where constant)
+    onehot: list[np.ndarray]  # code -> one-hot output column, -1 if dropped
+    n_features: int
+    sparse: bool  # CSR output, as ColumnTransformer's sparse_threshold decides
+
+
+def _merge(
+    a: tuple[np.ndarray, np.ndarray, np.ndarray],
+    b: tuple[np.ndarray, np.ndarray, np.ndarray],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Merge ``(count, mean, M2)`` of two disjoint groups (Chan et al.)."""
+    n_a, mean_a, m2_a = a
+    n_b, mean_b, m2_b = b
+    n = n_a + n_b
+    safe = np.where(n == 0, 1, n)
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / safe
+    m2 = m2_a + m2_b + delta**2 * n_a * n_b / safe
+    return n, mean, m2
+
+
+def _fold_moments(
+    numeric: np.ndarray, folds: np.ndarray, n_splits: int
+) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Count, mean and M2 of the observed values of each fold."""
+    moments = []
+    for k in range(n_splits):
+        # float64 accumulation, as StandardScaler does for float32 input
+        block = numeric[folds == k].astype("float64")
+        observed = ~np.isnan(block)
+        count = observed.sum(axis=0).astype("float64")
+        mean = np.where(observed, block, 0).sum(axis=0) / np.where(count, count, 1)
+        m2 = (np.where(observed, block - mean, 0) ** 2).sum(axis=0)
+        moments.append((count, mean, m2))
+    return moments
+
+
+def _fold_medians(
+    numeric: np.ndarray, folds: np.ndarray, n_observed: list[np.ndarray]
+) -> np.ndarray:
+    """
+    ``(n_splits, n_num)`` medians of the observed values outside each fold.
+
+    Each column is sorted once; the two middle training values are then
+    found by counting the training rows along the sorted order.
+
+    Args:
+        numeric (np.ndarray): Encoded numeric columns.
+        folds (np.ndarray): Fold number per row.
+        n_observed (list[np.ndarray]): Observed (non-NaN) training values per
+            column, one array per fold.
+    """
+    order = np.argsort(numeric, axis=0)  # NaNs sort last
+    ordered = np.take_along_axis(numeric, order, axis=0)
+    ordered_folds = folds[order]
+    medians = np.full((len(n_observed), numeric.shape[1]), np.nan)
+    for k, counts in enumerate(n_observed):
+        kept = np.cumsum(ordered_folds != k, axis=0)
+        for j, n in enumerate(counts.astype("int64")):
+            if n:
+                lo, hi = np.searchsorted(kept[:, j], [(n - 1) // 2 + 1, n // 2 + 1])
+                medians[k, j] = (ordered[lo, j] + ordered[hi, j]) / 2
+    return medians
+
+
+def fold_params(
+    encoded: EncodedFrame, folds: np.ndarray, n_splits: int
+) -> list[FoldParams]:
+    """
+    Preprocessing parameters of every fold from per-fold sufficient statistics.
+
+    Args:
+        encoded (EncodedFrame): Output of ``encode_frame``.
+        folds (np.ndarray): Fold number per row (``fold_ids``).
+        n_splits (int): Number of folds.
+
+    Returns:
+        list[FoldParams]: Parameters fitted on the rows outside fold ``k``.
+    """
+    numeric = encoded.numeric
+    moments = _fold_moments(numeric, folds, n_splits)
+    n_observed = sum(count for count, _, _ in moments)
+    medians = _fold_medians(
+        numeric, folds, [n_observed - count for count, _, _ in moments]
+    )
+    fold_sizes = np.bincount(folds, minlength=n_splits)
+    counts = [
+        np.bincount(
+            folds * len(cats) + encoded.codes[:, j], minlength=n_splits * len(cats)
+        ).reshape(n_splits, len(cats))
+        for j, cats in enumerate(encoded.categories)
+    ]
+    zeros = np.zeros(numeric.shape[1])
+    # every training row has one kept category per categorical column
+    nonzero = numeric.shape[1] + len(counts)
+
+    params = []
+    for k in range(n_splits):
+        n_train = len(folds) - fold_sizes[k]
+        observed = (zeros, zeros, zeros)
+        for i in range(n_splits):
+            if i != k:
+                observed = _merge(observed, moments[i])
+        imputed = (n_train - observed[0], medians[k], zeros)
+        _, mean, m2 = _merge(observed, imputed)
+        scale = np.sqrt(m2 / n_train)
+        scale[scale < 10 * np.finfo("float64").eps] = 1.0
+
+        onehot, offset = [], numeric.shape[1]
+        for count in counts:
+            kept = (count.sum(axis=0) - count[k]) > 0
+            mapping = np.full(len(kept), -1, dtype="int64")
+            mapping[kept] = offset + np.arange(kept.sum())
+            onehot.append(mapping)
+            offset += int(kept.sum())
+        sparse = bool(counts) and nonzero / offset < SPARSE_THRESHOLD
+        params.append(FoldParams(medians[k], mean, scale, onehot, offset, sparse))
+    return params
+
+
+# --------------------------
+# Fold fits
+# --------------------------
+def _onehot_hits(
+    codes: np.ndarray, rows: np.ndarray, params: FoldParams
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row and output-column positions of the ones of the one-hot block."""
+    hit_row, hit_column = [np.empty(0, "int64")], [np.empty(0, "int64")]
+    for j, mapping in enumerate(params.onehot):
+        columns = mapping[codes[rows, j]]
+        hit = columns >= 0
+        hit_row.append(np.flatnonzero(hit))
+        hit_column.append(columns[hit])
+    return np.concatenate(hit_row), np.concatenate(hit_column)
+
+
+def design_matrix(
+    numeric: np.ndarray, codes: np.ndarray, rows: np.ndarray, params: FoldParams
+) -> Any:
+    """
+    Float64 matrix of ``rows`` as the fold's fitted preprocessor outputs it:
+    scaled numerics, then the kept one-hot columns; CSR when ``params.sparse``.
+    Numerics are imputed and scaled in place in ``numeric``'s dtype, like
+    ``SimpleImputer`` and ``StandardScaler`` transform them.
+    """
+    from scipy import sparse
+
+    block = numeric[rows]
+    missing = np.isnan(block)
+    block[missing] = params.median[np.nonzero(missing)[1]]
+    block -= params.mean
+    block /= params.scale
+
+    hit_row, hit_column = _onehot_hits(codes, rows, params)
+
+    if params.sparse:
+        n_num = block.shape[1]
+        onehot = sparse.csr_matrix(
+            (np.ones(len(hit_row)), (hit_row, hit_column - n_num)),
+            shape=(len(rows), params.n_features - n_num),
+        )
+        return sparse.hstack([block, onehot]).tocsr()
+    out = np.zeros((len(rows), params.n_features), dtype="float64")
+    out[:, : block.shape[1]] = block
+    out[hit_row, hit_column] = 1.0
+    return out
+
+
+def _fit_fold(
+    estimator: Any,
+    numeric: np.ndarray,
+    codes: np.ndarray,
+    target: np.ndarray,
+    train_idx: np.ndarray,
+    test_idx: np.ndarray,
+    params: FoldParams,
+    scorers: dict[str, Any],
+) -> dict[str, float]:
+    """Fit a clone of ``estimator`` on one fold and score the held-out rows."""
+    from sklearn.base import clone
+
+    start = time.perf_counter()
+    model = clone(estimator).fit(
+        design_matrix(numeric, codes, train_idx, params), target[train_idx]
+    )
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    x_test = design_matrix(numeric, codes, test_idx, params)
+    scores = {
+        name: float(scorer(model, x_test, target[test_idx]))
+        for name, scorer in scorers.items()
+    }
+    return {"fit_time": fit_time, "score_time": time.perf_counter() - start, **scores}
+
+
+def cross_validate_frame(
+    estimator: Any,
+    df: pd.DataFrame,
+    target: str = "churn",
+    num_cols: list[str] | None = None,
+    cat_cols: list[str] | None = None,
+    scoring: str | list[str] = "roc_auc",
+    n_splits: int | None = None,
+    n_jobs: int | None = None,
+    random_state: int = 42,
+) -> dict[str, np.ndarray]:
+    """
+    Cross-validate ``estimator`` behind the serving preprocessing.
+
+    Equivalent to ``cross_validate(Pipeline([("pre",
+    build_preprocessor(num_cols, cat_cols, engineered=False)), ("model",
+    estimator)]), ...)`` on the ``stratified_folds`` splits, without refitting
+    the preprocessor per fold or copying the frame to workers.
+
+    Args:
+        estimator (Any): Unfitted scikit-learn classifier.
+        df (pd.DataFrame): Labelled dataset (compact dtypes or raw strings).
+        target (str): Label column.
+        num_cols (list[str] | None): Numeric features. Defaults to
+            ``feature_columns``.
+        cat_cols (list[str] | None): Categorical features. Defaults to
+            ``feature_columns``.
+        scoring (str | list[str]): scikit-learn scorer name(s).
+        n_splits (int | None): Number of folds. Defaults to ``settings.cv_folds``.
+        n_jobs (int | None): Parallel fold fits. Defaults to ``settings.cv_jobs``.
+        random_state (int): Seed of the folds.
+
+    Returns:
+        dict[str, np.ndarray]: ``fit_time``, ``score_time`` and
+        ``test_score`` (one scorer) or ``test_<name>`` per scorer, one value
+        per fold, like ``cross_validate``.
+    """
+    from joblib import Parallel, delayed
+    from sklearn.metrics import get_scorer
+
+    if target not in df.columns:
+        raise ValueError(f"Target column '{target}' not found in DataFrame")
+    if num_cols is None or cat_cols is None:
+        default_num, default_cat = feature_columns(df, target)
+        num_cols = default_num if num_cols is None else num_cols
+        cat_cols = default_cat if cat_cols is None else cat_cols
+    n_splits = n_splits or settings.cv_folds
+    n_jobs = settings.cv_jobs if n_jobs is None else n_jobs
+    names = [scoring] if isinstance(scoring, str) else list(scoring)
+    scorers = {name: get_scorer(name) for name in names}
+
+    y = binary_target(df[target])
+    folds = fold_ids(y, n_splits, random_state)
+    encoded = encode_frame(df, num_cols, cat_cols)
+    params = fold_params(encoded, folds, n_splits)
+    logger.info(
+        "[%s][CV] %d folds over %d rows, %d features, n_jobs=%d",
+        settings.env,
+        n_splits,
+        len(y),
+        params[0].n_features,
+        n_jobs,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="churn_cv_") as tmp:
+        arrays = {}
+        for name, array in (("numeric", encoded.numeric), ("codes", encoded.codes)):
+            path = Path(tmp) / f"{name}.npy"
+            np.save(path, array)
+            arrays[name] = np.load(path, mmap_mode="r")
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_fit_fold)(
+                estimator,
+                arrays["numeric"],
+                arrays["codes"],
+                y,
+                np.flatnonzero(folds != k),
+                np.flatnonzero(folds == k),
+                params[k],
+                scorers,
+            )
+            for k in range(n_splits)
+        )
+        del arrays
+
+    out = {
+        "fit_time": np.array([r["fit_time"] for r in results]),
+        "score_time": np.array([r["score_time"] for r in results]),
+    }
+    for name in names:
+        key = "test_score" if isinstance(scoring, str) else f"test_{name}"
+        out[key] = np.array([r[name] for r in results])
+    return out
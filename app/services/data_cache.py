@@ -0,0 +1,392 @@
+"""
+FILE: app/services/data_cache.py
+Persistent columnar cache for raw CSV datasets.
+
+Each source CSV is parsed once with explicit dtypes and stored as one ``.npy``
+file per column plus a JSON manifest under ``settings.processed_csv_path``.
+Later processes memory-map the column files instead of re-parsing text.
+A cache entry is reused while the source file's mtime, size and SHA-256 match.
+
+``CHURN_DTYPES`` is the compact schema of the churn dataset: yes/no flags as
+bool, ``state``/``area_code`` as categoricals and narrow numerics, about 8x
+less memory than the dtypes ``pd.read_csv`` infers (see ``memory_report``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_logger, get_settings
+from app.utils.io import read_manifest, write_manifest
+
+# --------------------------
+# Settings and Logger
+# --------------------------
+settings = get_settings()
+logger = get_logger(__name__)
+
+CACHE_DIR = Path(settings.processed_csv_path) / "cache"
+CACHE_FORMAT_VERSION = 1
+
+# Declared dtypes for the churn dataset; columns not listed keep inferred dtypes.
+# "bool" columns hold "yes"/"no" strings in the CSV. Integer widths are the
+# narrowest that hold the domain (calls per period, minutes, messages) with
+# room for elementwise sums; a column whose values do not fit is widened.
+CHURN_DTYPES: dict[str, str] = {
+    "id": "int32",
+    "state": "category",
+    "area_code": "category",
+    "international_plan": "bool",
+    "voice_mail_plan": "bool",
+    "churn": "bool",
+    "account_length": "int16",
+    "number_vmail_messages": "int16",
+    "total_day_minutes": "float32",
+    "total_day_calls": "int16",
+    "total_day_charge": "float32",
+    "total_eve_minutes": "float32",
+    "total_eve_calls": "int16",
+    "total_eve_charge": "float32",
+    "total_night_minutes": "float32",
+    "total_night_calls": "int16",
+    "total_night_charge": "float32",
+    "total_intl_minutes": "float32",
+    "total_intl_calls": "int16",
+    "total_intl_charge": "float32",
+    "number_customer_service_calls": "int16",
+}
+YES_NO = {"yes": True, "no": False}
+
+
+# --------------------------
+# Public API
+# --------------------------
+def read_csv_cached(
+    path: str | Path, dtypes: dict[str, str] | None = None
+) -> pd.DataFrame:
+    """
+    Read a CSV through the columnar cache.
+
+    Args:
+        path (str | Path): Source CSV file.
+        dtypes (dict[str, str] | None): Column dtypes applied after parsing.
+            Defaults to ``CHURN_DTYPES``.
+
+    Returns:
+        pd.DataFrame: Parsed (or memory-mapped) dataset.
+    """
+    path = Path(path)
+    dtypes = CHURN_DTYPES if dtypes is None else dtypes
+    if not settings.data_cache_enabled:
+        return _parse_csv(path, dtypes)
+
+    cache_path = cache_path_for(path)
+    manifest = read_manifest(cache_path)
+    if manifest is not None and _is_fresh(manifest, cache_path, path, dtypes):
+        logger.info("[%s][DATA_CACHE] Cache hit for %s", settings.env, path.name)
+        return read_columns(cache_path, manifest)
+
+    df = _parse_csv(path, dtypes)
+    try:
+        write_frame(df, cache_path, _fingerprint(path, dtypes))
+        logger.info("[%s][DATA_CACHE] Cached %s to %s", settings.env, path, cache_path)
+    except OSError as exc:
+        logger.warning(
+            "[%s][DATA_CACHE] Could not write cache for %s: %s", settings.env, path, exc
+        )
+    return df
+
+
+def cache_path_for(path: str | Path) -> Path:
+    """Return the cache directory used for a source CSV."""
+    resolved = Path(path).resolve()
+    key = hashlib.sha256(str(resolved).encode("utf-8")).hexdigest()[:12]
+    return CACHE_DIR / f"{resolved.stem}-{key}"
+
+
+def invalidate_cache(path: str | Path) -> None:
+    """Remove the cache entry for a source CSV, if any."""
+    shutil.rmtree(cache_path_for(path), ignore_errors=True)
+
+
+def write_frame(df: pd.DataFrame, path: str | Path, source: dict | None = None):
+    """
+    Store a DataFrame as memory-mappable ``.npy`` columns plus a manifest.
+
+    Args:
+        df (pd.DataFrame): Frame to store; the index is not kept.
+        path (str | Path): Target directory (replaced atomically).
+        source (dict | None): Extra metadata kept in the manifest.
+    """
+    _write_columns(df, Path(path), source or {})
+
+
+def read_frame(path: str | Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Memory-map a frame written by ``write_frame``.
+
+    Args:
+        path (str | Path): Directory written by ``write_frame``.
+        columns (list[str] | None): Subset of columns to map; all by default.
+
+    Returns:
+        pd.DataFrame: Frame backed by copy-on-write memory maps.
+    """
+    path = Path(path)
+    manifest = read_manifest(path)
+    if manifest is None:
+        raise FileNotFoundError(f"No columnar frame found at: {path}")
+    return read_columns(path, manifest, columns)
+
+
+def read_columns(
+    cache_path: Path, manifest: dict, columns: list[str] | None = None
+) -> pd.DataFrame:
+    """
+    Memory-map the columns listed in a ``write_frame`` manifest (copy-on-write).
+
+    Args:
+        cache_path (Path): Directory holding the ``.npy`` column files.
+        manifest (dict): Its manifest (``app.utils.io.read_manifest``).
+        columns (list[str] | None): Subset of columns to map; all by default.
+
+    Returns:
+        pd.DataFrame: Frame backed by the memory maps.
+    """
+    entries = manifest["columns"]
+    if columns is not None:
+        by_name = {entry["name"]: entry for entry in entries}
+        missing = [col for col in columns if col not in by_name]
+        if missing:
+            raise KeyError(f"Columns not in cache: {missing}")
+        entries = [by_name[col] for col in columns]
+
+    data = {}
+    for entry in entries:
+        # asarray drops the memmap subclass but keeps the mapped buffer.
+        values = np.asarray(np.load(cache_path / entry["file"], mmap_mode="c"))
+        if entry["kind"] == "category":
+            data[entry["name"]] = pd.Categorical.from_codes(
+                values, categories=entry["categories"]
+            )
+        elif entry["kind"] == "object":
+            data[entry["name"]] = pd.Categorical.from_codes(
+                values, categories=entry["categories"]
+            ).astype(object)
+        else:
+            data[entry["name"]] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def apply_dtypes(
+    df: pd.DataFrame, dtypes: dict[str, str], downcast: bool = True
+) -> pd.DataFrame:
+    """
+    Cast the declared columns present in ``df``.
+
+    ``"bool"`` columns are parsed from ``yes``/``no`` strings. Integer and
+    boolean columns holding missing values fall back to float32, and integer
+    columns whose values exceed the declared width are widened to the
+    narrowest integer type that holds them.
+
+    Args:
+        df (pd.DataFrame): Parsed frame.
+        dtypes (dict[str, str]): Declared dtype per column.
+        downcast (bool): Also narrow undeclared int64/float64 columns
+            (integers to the narrowest width holding their range, floats to
+            float32).
+
+    Returns:
+        pd.DataFrame: Frame with compact dtypes.
+    """
+    casts: dict[str, Any] = {}
+    for col, dtype in dtypes.items():
+        if col not in df.columns:
+            continue
+        if dtype == "bool":
+            df = df.assign(**{col: _parse_yes_no(df[col])})
+            continue
+        if dtype != "category" and np.dtype(dtype).kind in "iu":
+            if df[col].isna().any():
+                dtype = "float32"
+            elif (fitted := _fit_integer(df[col], dtype)) != dtype:
+                logger.warning(
+                    "[%s][DATA_CACHE] Column '%s' does not fit %s, using %s",
+                    settings.env,
+                    col,
+                    dtype,
+                    fitted,
+                )
+                dtype = fitted
+        casts[col] = dtype
+    if downcast:
+        for col in df.columns.difference(list(dtypes)):
+            kind = df[col].dtype.kind
+            if kind in "iu" and df[col].dtype.itemsize > 1:
+                casts[col] = _fit_integer(df[col], "int8")
+            elif kind == "f" and df[col].dtype.itemsize > 4:
+                casts[col] = "float32"
+    return df.astype(casts) if casts else df
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> str:
+    """
+    Per-column memory of a frame before and after ``apply_dtypes``.
+
+    Args:
+        before (pd.DataFrame): Frame as parsed (e.g. plain ``pd.read_csv``).
+        after (pd.DataFrame): The same data with compact dtypes.
+
+    Returns:
+        str: Table of dtype and deep memory per column, plus the totals.
+    """
+    old = before.memory_usage(deep=True, index=False)
+    new = after.memory_usage(deep=True, index=False)
+    width = max(len(str(c)) for c in [*before.columns, "total"])
+    lines = [f"{'column':<{width}}  {'before':>10}  {'after':>10}  {'KiB':>9}"]
+    for col in before.columns:
+        dtypes = f"{before[col].dtype}"[:10], f"{after[col].dtype}"[:10]
+        lines.append(
+            f"{col:<{width}}  {dtypes[0]:>10}  {dtypes[1]:>10}  "
+            f"{old[col] / 1024:>9.1f} -> {new[col] / 1024:.1f}"
+        )
+    total_old, total_new = old.sum(), new.sum()
+    lines.append(
+        f"{'total':<{width}}  {'':>10}  {'':>10}  "
+        f"{total_old / 1024:>9.1f} -> {total_new / 1024:.1f} "
+        f"({total_old / max(total_new, 1):.1f}x smaller)"
+    )
+    return "\n".join(lines)
+
+
+# --------------------------
+# Helpers
+# --------------------------
+def _parse_csv(path: Path, dtypes: dict[str, str]) -> pd.DataFrame:
+    # Categories are built while parsing, so the strings are never held as objects.
+    categories = {
+        col: "category" for col, dtype in dtypes.items() if dtype == "category"
+    }
+    return apply_dtypes(pd.read_csv(path, dtype=categories), dtypes)
+
+
+def _parse_yes_no(series: pd.Series) -> pd.Series:
+    """``yes``/``no`` strings (any case) as bool; missing values stay NaN."""
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    lowered = series.astype("string").str.strip().str.lower()
+    unknown = lowered.notna() & ~lowered.isin(list(YES_NO))
+    if unknown.any():
+        raise ValueError(
+            f"Column '{series.name}' has values other than yes/no: "
+            f"{sorted(lowered[unknown].unique())[:5]}"
+        )
+    if lowered.isna().any():
+        return lowered.map(YES_NO, na_action="ignore").astype("float32")
+    return lowered.map(YES_NO).astype(bool)
+
+
+def _fit_integer(series: pd.Series, dtype: str) -> str:
+    """``dtype`` if it holds every value of ``series``, else the narrowest that does."""
+    if series.empty:
+        return dtype
+    low, high = series.min(), series.max()
+    candidates = [dtype, "int8", "int16", "int32", "int64"]
+    if low >= 0 and np.dtype(dtype).kind == "u":
+        candidates = [dtype, "uint8", "uint16", "uint32", "uint64"]
+    for candidate in candidates:
+        info = np.iinfo(candidate)
+        if (
+            info.min <= low
+            and high <= info.max
+            and (candidate == dtype or info.bits >= np.iinfo(dtype).bits)
+        ):
+            return candidate
+    return "int64"
+
+
+def _file_digest(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _dtypes_key(dtypes: dict[str, str]) -> str:
+    return json.dumps(dtypes, sort_keys=True)
+
+
+def _fingerprint(path: Path, dtypes: dict[str, str]) -> dict:
+    stat = path.stat()
+    return {
+        "format_version": CACHE_FORMAT_VERSION,
+        "source": str(path.resolve()),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": _file_digest(path),
+        "dtypes": _dtypes_key(dtypes),
+    }
+
+
+def _is_fresh(
+    manifest: dict, cache_path: Path, path: Path, dtypes: dict[str, str]
+) -> bool:
+    """Check the cached fingerprint: mtime/size first, content hash if they moved."""
+    source = manifest.get("source", {})
+    if source.get("format_version") != CACHE_FORMAT_VERSION or source.get(
+        "dtypes"
+    ) != _dtypes_key(dtypes):
+        return False
+
+    stat = path.stat()
+    if stat.st_size != source.get("size"):
+        return False
+    if stat.st_mtime_ns == source.get("mtime_ns"):
+        return True
+    if _file_digest(path) != source.get("sha256"):
+        return False
+
+    # Touched but unchanged: refresh mtime so the next check stays cheap.
+    source["mtime_ns"] = stat.st_mtime_ns
+    try:
+        write_manifest(cache_path, manifest)
+    except OSError:
+        pass
+    return True
+
+
+def _write_columns(df: pd.DataFrame, cache_path: Path, source: dict) -> None:
+    """Write one ``.npy`` file per column, then swap the directory into place."""
+    tmp = cache_path.with_name(f"{cache_path.name}.tmp-{os.getpid()}")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    columns = []
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        entry: dict = {"name": col, "file": f"{i}.npy"}
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            entry["kind"] = "category"
+            entry["categories"] = series.cat.categories.tolist()
+            values = series.cat.codes.to_numpy()
+        elif isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufcmM":
+            entry["kind"] = "numeric"
+            values = series.to_numpy()
+        else:
+            # Strings and extension dtypes are dictionary-encoded; -1 marks NaN.
+            codes, uniques = pd.factorize(series)
+            entry["kind"] = "object"
+            entry["categories"] = uniques.tolist()
+            values = codes
+        np.save(tmp / entry["file"], values, allow_pickle=False)
+        columns.append(entry)
+
+    write_manifest(tmp, {"source": source, "columns": columns})
+    shutil.rmtree(cache_path, ignore_errors=True)
+    tmp.rename(cache_path)
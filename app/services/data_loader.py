@@ -7,10 +7,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
 
 from app.core import get_logger, get_settings
+from app.core.metrics import DATA_LOAD_SECONDS, timed
+from app.services.data_cache import read_csv_cached
 from app.utils.decorators import log_and_cache
 
 # --------------------------
@@ -22,35 +24,37 @@ logger = get_logger(__name__)
 RAW_DATA_DIR = Path(settings.default_csv_path).parent
 PROCESSED_DATA_DIR = Path(settings.processed_csv_path)
 DEFAULT_PROCESSED_PATH = PROCESSED_DATA_DIR
-DEFAULT_PROCESSED_PATH.mkdir(parents=True, exist_ok=True)
 
 
 # --------------------------
 # Loaders
 # --------------------------
 @log_and_cache("DATA_LOAD")
+@timed(DATA_LOAD_SECONDS, source="train")
 def load_train() -> pd.DataFrame:
     """Load training dataset with labels."""
     path = settings.default_csv_path
-    df = pd.read_csv(path)
+    df = read_csv_cached(path)
     logger.info("Loaded train data: %s", df.shape)
     return df
 
 
 @log_and_cache("DATA_LOAD")
+@timed(DATA_LOAD_SECONDS, source="test")
 def load_test() -> pd.DataFrame:
     """Load test dataset without labels."""
     path = RAW_DATA_DIR / "test.csv"
-    df = pd.read_csv(path)
+    df = read_csv_cached(path)
     logger.info("Loaded test data: %s", df.shape)
     return df
 
 
 @log_and_cache("DATA_LOAD")
+@timed(DATA_LOAD_SECONDS, source="sample_submission")
 def load_sample_submission() -> pd.DataFrame:
     """Load sample submission template."""
     path = RAW_DATA_DIR / "sampleSubmission.csv"
-    df = pd.read_csv(path)
+    df = read_csv_cached(path)
     logger.info("Loaded sample submission: %s", df.shape)
     return df
 
@@ -65,6 +69,8 @@ def get_splits(
     random_state: int = 42,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
     """Return train/validation splits from a labeled dataset."""
+    from sklearn.model_selection import train_test_split
+
     if target not in df.columns:
         raise ValueError(f"Target column '{target}' not found in DataFrame")
 
@@ -80,11 +86,70 @@ def get_splits(
     )
 
 
+def split_indices(
+    target: pd.Series | np.ndarray,
+    val_size: float = 0.2,
+    random_state: int = 42,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Stratified train/validation split as sorted row-index arrays.
+
+    Unlike ``get_splits`` nothing is copied: callers index their own arrays
+    (or lay rows out once, see ``app.services.training``).
+
+    Args:
+        target (pd.Series | np.ndarray): Labels to stratify on.
+        val_size (float): Fraction of each class held out for validation.
+        random_state (int): Seed of the shuffle.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Train and validation row positions.
+    """
+    labels = np.asarray(target)
+    rng = np.random.default_rng(random_state)
+    train, val = [], []
+    for label in np.unique(labels):
+        rows = rng.permutation(np.flatnonzero(labels == label))
+        n_val = round(len(rows) * val_size)
+        val.append(rows[:n_val])
+        train.append(rows[n_val:])
+    return np.sort(np.concatenate(train)), np.sort(np.concatenate(val))
+
+
+def serving_view(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """
+    Frame of ``columns`` sharing ``df``'s arrays, with bool flags as yes/no.
+
+    The API sends ``"yes"``/``"no"``, so compact bool columns become
+    categoricals over those strings (built from codes, no string copies).
+    """
+    data = {}
+    for col in columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series):
+            series = pd.Series(
+                pd.Categorical.from_codes(
+                    series.to_numpy().view("int8"), ["no", "yes"]
+                ),
+                index=df.index,
+            )
+        data[col] = series
+    return pd.DataFrame(data, copy=False)
+
+
+def binary_target(labels: pd.Series) -> np.ndarray:
+    """Labels as int8 0/1 from bool, numeric or ``yes``/``no`` values."""
+    if pd.api.types.is_bool_dtype(labels) or pd.api.types.is_numeric_dtype(labels):
+        return (labels.to_numpy() > 0).astype("int8")
+    return (labels.astype(str).str.lower() == "yes").to_numpy().astype("int8")
+
+
 # --------------------------
 # Optional processed data helpers
 # --------------------------
 def save_processed_train(df: pd.DataFrame, filename: str = "train_processed.csv"):
     """Save processed training dataset."""
+    DEFAULT_PROCESSED_PATH.mkdir(parents=True, exist_ok=True)
     path = DEFAULT_PROCESSED_PATH / filename
     df.to_csv(path, index=False)
     logger.info("Saved processed train data to: %s", path)
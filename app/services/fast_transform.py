@@ -0,0 +1,215 @@
+"""
+FILE: app/services/fast_transform.py
+Compiled single-record path through a fitted serving preprocessor.
+
+``compile_preprocessor`` walks a fitted ``ColumnTransformer`` once and turns
+each branch into plain arrays and dicts:
+- ``SimpleImputer`` -> fill values, ``StandardScaler`` -> offset and scale
+  arrays, applied with the same float64 operations as scikit-learn
+- ``OneHotEncoder`` -> one ``{category: output index}`` dict per column
+- derived-feature transformers (``app.services.preprocessing``) -> their
+  ``transform_record``
+
+Records (mappings of raw feature values) are then written straight into a
+preallocated dense row, with no DataFrame or ColumnTransformer dispatch, and
+the result is identical to ``preprocessor.transform``.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from sklearn.compose import ColumnTransformer
+    from sklearn.preprocessing import OneHotEncoder
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+# --------------------------
+# Compiled branches
+# --------------------------
+class _NumericBranch:
+    """Raw or derived numeric columns followed by fill / center / scale ops."""
+
+    def __init__(
+        self,
+        columns: list[str],
+        derived: Any,
+        ops: list[tuple[str, np.ndarray]],
+    ):
+        self.columns = columns
+        self.derived = derived
+        self.ops = ops
+        self.width = len(derived.features_) if derived is not None else len(columns)
+
+    def fill(self, record: Mapping[str, Any], out: np.ndarray) -> None:
+        if self.derived is not None:
+            values = np.array(self.derived.transform_record(record), dtype="float64")
+        else:
+            get = record.get
+            values = np.array(
+                [np.nan if (v := get(c)) is None else v for c in self.columns],
+                dtype="float64",
+            )
+        for op, arg in self.ops:
+            if op == "fill":
+                missing = np.isnan(values)
+                if missing.any():
+                    values[missing] = arg[missing]
+            elif op == "center":
+                values -= arg
+            else:
+                values /= arg
+        out[:] = values
+
+
+class _OneHotBranch:
+    """Categorical columns one-hot encoded through per-column dict lookups."""
+
+    def __init__(
+        self,
+        columns: list[str],
+        fill_values: list | None,
+        encoder: OneHotEncoder,
+    ):
+        self.columns = columns
+        self.fill_values = fill_values
+        self.handle_unknown = encoder.handle_unknown
+        self.lookups: list[dict] = []
+        offset = 0
+        for categories in encoder.categories_:
+            self.lookups.append(
+                {_key(c): offset + i for i, c in enumerate(categories.tolist())}
+            )
+            offset += len(categories)
+        self.width = offset
+
+    def fill(self, record: Mapping[str, Any], out: np.ndarray) -> None:
+        get = record.get
+        for j, col in enumerate(self.columns):
+            value = get(col)
+            if self.fill_values is not None and _is_missing(value):
+                value = self.fill_values[j]
+            index = self.lookups[j].get(_key(value))
+            if index is not None:
+                out[index] = 1.0
+            elif self.handle_unknown == "error":
+                raise ValueError(f"Found unknown category {value!r} in column {col}")
+
+
+def _key(value: Any) -> Any:
+    """Hashable lookup key; all NaN-like values share one key."""
+    return None if _is_missing(value) else value
+
+
+# --------------------------
+# Compilation
+# --------------------------
+def _compile_branch(transformer: Any, columns: list[str]):
+    from sklearn.impute import SimpleImputer
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+    steps = transformer.steps if isinstance(transformer, Pipeline) else [transformer]
+    steps = [s[1] if isinstance(s, tuple) else s for s in steps]
+    derived = None
+    ops: list[tuple[str, np.ndarray]] = []
+    fill_values = None
+    for i, step in enumerate(steps):
+        if step == "passthrough" or step is None:
+            continue
+        if i == 0 and hasattr(step, "transform_record"):
+            derived = step
+        elif isinstance(step, SimpleImputer) and not step.add_indicator:
+            if not _is_missing(step.missing_values):
+                raise TypeError("Only NaN missing_values can be compiled")
+            if step.statistics_.dtype.kind in "fiu":
+                ops.append(("fill", step.statistics_.astype("float64")))
+            else:
+                fill_values = step.statistics_.tolist()
+        elif isinstance(step, StandardScaler):
+            # mean_ is fitted even with with_mean=False; apply only what
+            # StandardScaler.transform applies.
+            if step.with_mean:
+                ops.append(("center", step.mean_))
+            if step.with_std:
+                ops.append(("scale", step.scale_))
+        elif isinstance(step, OneHotEncoder) and i == len(steps) - 1:
+            if step.drop is not None or getattr(step, "_infrequent_enabled", False):
+                raise TypeError("OneHotEncoder with drop/infrequent categories")
+            if ops:
+                raise TypeError("Numeric ops before a OneHotEncoder")
+            return _OneHotBranch(columns, fill_values, step)
+        else:
+            raise TypeError(f"Cannot compile {type(step).__name__}")
+    if fill_values is not None:
+        raise TypeError("Categorical imputer without a OneHotEncoder")
+    return _NumericBranch(columns, derived, ops)
+
+
+class CompiledPreprocessor:
+    """
+    Dense, record-at-a-time equivalent of a fitted ``ColumnTransformer``.
+
+    Attributes:
+        width (int): Number of output features.
+        feature_names_in_ (list[str]): Raw input columns of the preprocessor.
+    """
+
+    def __init__(self, preprocessor: ColumnTransformer):
+        names = list(preprocessor.feature_names_in_)
+        self.feature_names_in_ = names
+        self._branches: list[tuple[int, int, Any]] = []
+        start = 0
+        for _name, transformer, columns in preprocessor.transformers_:
+            if transformer == "drop" or len(columns) == 0:
+                continue
+            columns = [names[c] if isinstance(c, int) else c for c in columns]
+            branch = _compile_branch(transformer, columns)
+            self._branches.append((start, start + branch.width, branch))
+            start += branch.width
+        self.width = start
+        expected = len(preprocessor.get_feature_names_out())
+        if self.width != expected:
+            raise TypeError(f"Compiled width {self.width} != {expected} features")
+
+    def transform_records(self, records: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """Transform records into an ``(n, width)`` float64 matrix."""
+        out = np.zeros((len(records), self.width), dtype="float64")
+        for i, record in enumerate(records):
+            row = out[i]
+            for start, stop, branch in self._branches:
+                branch.fill(record, row[start:stop])
+        return out
+
+    def transform_record(self, record: Mapping[str, Any]) -> np.ndarray:
+        """Transform one record into a ``(1, width)`` matrix."""
+        return self.transform_records([record])
+
+
+def compile_preprocessor(preprocessor: Any) -> CompiledPreprocessor:
+    """
+    Compile a fitted ``ColumnTransformer`` for record-at-a-time transforms.
+
+    Args:
+        preprocessor: Fitted ``ColumnTransformer`` whose branches are
+            imputers, scalers, one-hot encoders and derived-feature steps.
+
+    Returns:
+        CompiledPreprocessor: Equivalent record transformer.
+
+    Raises:
+        TypeError: If a step has no compiled equivalent.
+    """
+    from sklearn.compose import ColumnTransformer
+
+    if not isinstance(preprocessor, ColumnTransformer):
+        raise TypeError(f"Cannot compile {type(preprocessor).__name__}")
+    return CompiledPreprocessor(preprocessor)
@@ -0,0 +1,584 @@
+"""
+FILE: app/services/feature_store.py
+Local, versioned feature store for engineered churn features.
+
+Rows are keyed by ``customer_id`` (``settings.feature_store_key``) and hold
+the source columns plus the derived features of ``FEATURE_SET_VERSION``:
+the row-wise features of ``BehavioralFeatures``/``PriceContractFeatures``,
+the ``cohort`` bin of ``account_length`` and the ``clv_segment`` quartile.
+The raw churn CSV has neither ``monthly_charge`` nor a CLV column: the sum
+of its ``total_*_charge`` columns stands in for the former and, as in the
+EDA CLV analysis, ``account_length`` for the latter.
+Layout under ``settings.feature_store_path``::
+
+    v<version>/manifest.json       key, columns, chunks, CLV quartile edges
+    v<version>/index-<n>/*.npy     keys (sorted), chunk, row, row hash
+    v<version>/chunks/<n>/         one columnar frame (``data_cache.write_frame``)
+
+Chunks are memory-mapped per column, so ``load(columns)`` maps only the
+columns asked for and ``get(key)`` is a binary search in the mapped key index
+plus one row read from each mapped column. ``materialize`` compares each
+row's hash with the index: only new and changed rows get features derived,
+new rows go to new chunks and only chunks holding changed or removed rows
+are rewritten. Chunks and indexes are never modified in place: a write adds
+new ones, swaps the manifest atomically and then deletes what it no longer
+references, so a reader keeps a consistent view of the maps it has open.
+Writes assume a single writer.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_logger, get_settings
+from app.services.data_cache import read_columns, write_frame
+from app.services.preprocessing import BehavioralFeatures, PriceContractFeatures
+from app.utils.io import read_manifest, write_json_atomic
+
+# --------------------------
+# Settings and Logger
+# --------------------------
+settings = get_settings()
+logger = get_logger(__name__)
+
+STORE_FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+INDEX_FIELDS = ("keys", "chunk", "row", "hash")
+
+# --------------------------
+# Feature set
+# --------------------------
+# Bump when a definition below changes; each version is stored separately.
+FEATURE_SET_VERSION = 2
+
+# Row-wise derived features and the transformer that computes them. The
+# fitted data_usage_std_dev (an aggregate over a customer's rows) stays in
+# the serving preprocessor.
+ROW_FEATURES = {
+    "avg_daily_call_minutes": BehavioralFeatures,
+    "service_downgrade_flags": BehavioralFeatures,
+    "price_sensitivity_index": PriceContractFeatures,
+    "months_until_contract_end": PriceContractFeatures,
+}
+COHORT_BINS = [0, 12, 24, 48, 1000]
+COHORT_LABELS = ["0-12m", "13-24m", "25-48m", "48m+"]
+CLV_COLUMN = "monthly_charges"
+CLV_FALLBACK = "account_length"
+CLV_LABELS = ["Low", "Medium", "High", "Top"]
+CHARGE_COLUMNS = (
+    "total_day_charge",
+    "total_eve_charge",
+    "total_night_charge",
+    "total_intl_charge",
+)
+
+
+def clv_column(columns: Sequence[str], clv_col: str | None = None) -> str | None:
+    """
+    Value column of the ``clv_segment`` quartiles.
+
+    Args:
+        columns (Sequence[str]): Columns of the source rows.
+        clv_col (str | None): Column named by the caller; it must exist.
+            ``None`` picks ``CLV_COLUMN``, else ``CLV_FALLBACK``.
+
+    Returns:
+        str | None: The column, or ``None`` if neither default exists.
+    """
+    if clv_col is not None:
+        if clv_col not in columns:
+            raise ValueError(f"CLV column '{clv_col}' not found in DataFrame")
+        return clv_col
+    for candidate in (CLV_COLUMN, CLV_FALLBACK):
+        if candidate in columns:
+            return candidate
+    return None
+
+
+def _row_source(df: pd.DataFrame) -> Mapping[str, Any]:
+    """``df``, plus a ``monthly_charge`` summed from the charge totals if absent."""
+    if "monthly_charge" in df.columns or not set(CHARGE_COLUMNS) <= set(df.columns):
+        return df
+    source: dict[str, Any] = {col: df[col] for col in df.columns}
+    source["monthly_charge"] = sum(
+        np.asarray(df[col], dtype="float64") for col in CHARGE_COLUMNS
+    )
+    return source
+
+
+def clv_edges(values: pd.Series | np.ndarray) -> list[float]:
+    """Inner quartile edges of ``values``, as ``pd.qcut(values, 4)`` uses."""
+    return np.nanquantile(
+        np.asarray(values, dtype="float64"), [0.25, 0.5, 0.75]
+    ).tolist()
+
+
+def derive_features(
+    df: pd.DataFrame, clv_col: str | None = None, edges: list[float] | None = None
+) -> pd.DataFrame:
+    """
+    Derived features of ``df`` that its columns allow.
+
+    Args:
+        df (pd.DataFrame): Source rows.
+        clv_col (str | None): Value column of the ``clv_segment`` quartiles
+            (see ``clv_column``).
+        edges (list[float] | None): Inner quartile edges (``clv_edges``);
+            learned from ``df`` when ``None``.
+
+    Returns:
+        pd.DataFrame: One column per derived feature, aligned with ``df``.
+    """
+    source = _row_source(df)
+    columns = set(source)
+    out = {}
+    for name, cls in ROW_FEATURES.items():
+        if set(cls.REQUIRES[name]) <= columns:
+            out[name] = getattr(cls(), f"_{name}")(source).astype("float32")
+    if "account_length" in columns:
+        out["cohort"] = pd.cut(
+            df["account_length"],
+            bins=COHORT_BINS,
+            labels=COHORT_LABELS,
+            right=False,
+            ordered=False,
+        )
+    clv_col = clv_column(df.columns, clv_col)
+    if clv_col is not None:
+        edges = clv_edges(df[clv_col]) if edges is None else edges
+        out["clv_segment"] = pd.cut(
+            df[clv_col],
+            bins=[-np.inf, *edges, np.inf],
+            labels=CLV_LABELS,
+            ordered=False,
+        )
+    return pd.DataFrame(out, index=df.index)
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """64-bit content hash of every row (values only, not the index)."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _as_keys(values: Any, dtype: np.dtype) -> np.ndarray:
+    """Keys as an array comparable with an index of ``dtype``."""
+    values = np.asarray(values)
+    return values.astype(str) if dtype.kind == "U" else values.astype(dtype)
+
+
+def _search(index_keys: np.ndarray, keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Positions of ``keys`` in the sorted ``index_keys`` and which were found."""
+    pos = np.searchsorted(index_keys, keys)
+    pos[pos == len(index_keys)] = 0
+    found = index_keys[pos] == keys if len(index_keys) else np.zeros(len(keys), bool)
+    return pos, found
+
+
+def _concat(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate rows, keeping categoricals categorical across chunks."""
+    out = pd.concat(frames, ignore_index=True)
+    for col in out.columns:
+        parts = [frame[col] for frame in frames]
+        if all(isinstance(p.dtype, pd.CategoricalDtype) for p in parts) and not (
+            isinstance(out[col].dtype, pd.CategoricalDtype)
+        ):
+            out[col] = pd.api.types.union_categoricals(parts, ignore_order=True)
+    return out
+
+
+# --------------------------
+# Store
+# --------------------------
+class FeatureStore:
+    """
+    Chunked, memory-mapped feature rows of one feature-set version.
+
+    Args:
+        root (str | Path | None): Store folder. Defaults to
+            ``settings.feature_store_path``.
+        version (int): Feature-set version to read and write.
+    """
+
+    def __init__(
+        self, root: str | Path | None = None, version: int = FEATURE_SET_VERSION
+    ):
+        self.root = Path(root or settings.feature_store_path)
+        self.version = version
+        self.path = self.root / f"v{version}"
+        self._stamp: tuple[int, int] | None = None
+        self._manifest: dict = {}
+        self._index: dict[str, np.ndarray] = {}
+        self._chunks: dict[int, dict] = {}
+        self._maps: dict[tuple[int, str], np.ndarray] = {}
+
+    # -------- reads --------
+    def manifest(self) -> dict:
+        """The store manifest (empty before the first ``materialize``)."""
+        self._refresh()
+        return self._manifest
+
+    def __len__(self) -> int:
+        return int(self.manifest().get("rows", 0))
+
+    def get(self, key: Any, columns: list[str] | None = None) -> dict | None:
+        """
+        Feature row of one key as a record, or ``None`` if the key is unknown.
+
+        Reads one value from each requested column's mapped file; the maps
+        stay open for later lookups until the store changes.
+        """
+        self._refresh()
+        if not self._manifest.get("rows"):
+            return None
+        index = self._index
+        pos, found = _search(index["keys"], _as_keys([key], index["keys"].dtype))
+        if not found[0]:
+            return None
+        chunk, row = int(index["chunk"][pos[0]]), int(index["row"][pos[0]])
+        record = {}
+        for entry in self._entries(chunk, columns):
+            value = self._map(chunk, entry["file"])[row]
+            if entry["kind"] == "numeric":
+                record[entry["name"]] = value.item()
+            else:
+                record[entry["name"]] = (
+                    entry["categories"][value] if value >= 0 else None
+                )
+        return record
+
+    def lookup(
+        self, keys: Sequence[Any], columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        """
+        Feature rows of the known ``keys``, in request order, indexed by key.
+
+        Args:
+            keys (Sequence[Any]): Keys to look up; unknown keys are skipped.
+            columns (list[str] | None): Columns to read; all by default.
+        """
+        self._refresh()
+        if not self._manifest.get("rows"):
+            return pd.DataFrame(columns=columns)
+        index = self._index
+        pos, found = _search(index["keys"], _as_keys(keys, index["keys"].dtype))
+        hit = pos[found]
+        chunks, rows = index["chunk"][hit], index["row"][hit]
+
+        parts, order = [], []
+        for chunk in np.unique(chunks):
+            in_chunk = np.flatnonzero(chunks == chunk)
+            parts.append(self._take(int(chunk), rows[in_chunk], columns))
+            order.append(in_chunk)
+        if not parts:
+            return pd.DataFrame(columns=columns or self._manifest["columns"])
+        out = _concat(parts).iloc[np.argsort(np.concatenate(order))]
+        out.index = pd.Index(index["keys"][hit])
+        return out
+
+    def load(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """All feature rows, mapping only ``columns`` (all by default)."""
+        self._refresh()
+        if not self._manifest.get("rows"):
+            return pd.DataFrame(columns=columns)
+        frames = [
+            self._chunk_frame(int(chunk), columns) for chunk in self._manifest["chunks"]
+        ]
+        return _concat(frames)
+
+    # -------- writes --------
+    def materialize(
+        self,
+        df: pd.DataFrame,
+        key: str | None = None,
+        clv_col: str | None = None,
+        full: bool = False,
+    ) -> dict[str, int]:
+        """
+        Bring the store in line with ``df``, a full snapshot of the source rows.
+
+        Only rows whose content hash is new or changed get features derived;
+        keys absent from ``df`` are removed. A first build, ``full=True`` or
+        a different ``key``/``clv_col`` rebuilds everything (and refits the
+        CLV quartile edges).
+
+        Args:
+            df (pd.DataFrame): Source rows, one per key.
+            key (str | None): Key column. Defaults to ``settings.feature_store_key``.
+            clv_col (str | None): Value column of the ``clv_segment``
+                quartiles (see ``clv_column``).
+            full (bool): Rebuild instead of updating incrementally.
+
+        Returns:
+            dict[str, int]: Counts of ``added``, ``changed``, ``removed`` and
+            ``unchanged`` rows and of ``chunks_written``.
+        """
+        key = key or settings.feature_store_key
+        if key not in df.columns:
+            raise ValueError(f"Key column '{key}' not found in DataFrame")
+        if df[key].duplicated().any():
+            raise ValueError(f"Key column '{key}' has duplicate values")
+        clv_col = clv_column(df.columns, clv_col)
+
+        start = time.perf_counter()
+        df = df.reset_index(drop=True)
+        hashes = row_hashes(df)
+        manifest = self.manifest()
+        rebuild = (
+            full
+            or not manifest.get("rows")
+            or manifest.get("key") != key
+            or manifest.get("clv_col") != clv_col
+            or manifest.get("source_columns") != list(df.columns)
+        )
+        if rebuild:
+            stats = self._rebuild(df, key, clv_col, hashes)
+        else:
+            stats = self._update(df, key, hashes)
+        logger.info(
+            "[%s][FEATURE_STORE] v%d: %d added, %d changed, %d removed, "
+            "%d chunks written in %.2fs",
+            settings.env,
+            self.version,
+            stats["added"],
+            stats["changed"],
+            stats["removed"],
+            stats["chunks_written"],
+            time.perf_counter() - start,
+        )
+        return stats
+
+    def _rebuild(
+        self, df: pd.DataFrame, key: str, clv_col: str | None, hashes: np.ndarray
+    ) -> dict[str, int]:
+        previous = self._manifest  # its chunks are deleted on commit
+        self.path.mkdir(parents=True, exist_ok=True)
+        edges = clv_edges(df[clv_col]) if clv_col is not None else None
+        manifest: dict[str, Any] = {
+            "format_version": STORE_FORMAT_VERSION,
+            "feature_set_version": self.version,
+            "key": key,
+            "clv_col": clv_col,
+            "clv_edges": edges,
+            "source_columns": list(df.columns),
+            "columns": [],
+            "chunks": {},
+            "next_chunk": previous.get("next_chunk", 0),
+            "generation": previous.get("generation", 0),
+            "rows": 0,
+        }
+        entries = self._append(df, hashes, manifest)
+        self._commit(manifest, [entries])
+        return {
+            "added": len(df),
+            "changed": 0,
+            "removed": 0,
+            "unchanged": 0,
+            "chunks_written": len(manifest["chunks"]),
+        }
+
+    def _update(self, df: pd.DataFrame, key: str, hashes: np.ndarray) -> dict[str, int]:
+        manifest = dict(self._manifest, chunks=dict(self._manifest["chunks"]))
+        index = {name: np.array(values) for name, values in self._index.items()}
+        keys = _as_keys(df[key], index["keys"].dtype)
+        first_new_chunk = manifest["next_chunk"]
+
+        pos, found = _search(index["keys"], keys)
+        changed = found & (index["hash"][pos] != hashes)
+        present = np.zeros(len(index["keys"]), dtype=bool)
+        present[pos[found]] = True
+        stale = ~present  # removed keys
+        stale[pos[changed]] = True  # rows to replace
+        added = ~found
+        stats = {
+            "added": int(added.sum()),
+            "changed": int(changed.sum()),
+            "removed": int((~present).sum()),
+            "unchanged": int((found & ~changed).sum()),
+            "chunks_written": 0,
+        }
+        if not (stale.any() or added.any()):
+            return stats
+
+        # Rewrite only the chunks holding stale rows, each as a new chunk.
+        entries = []
+        touched = np.unique(index["chunk"][stale])
+        for chunk in touched:
+            keep = (index["chunk"] == chunk) & ~stale
+            replace = changed & (index["chunk"][pos] == chunk)
+            kept = self._take(int(chunk), index["row"][keep])
+            new_rows = self._feature_rows(df.iloc[np.flatnonzero(replace)], manifest)
+            del manifest["chunks"][str(chunk)]
+            if not len(kept) + len(new_rows):
+                continue
+            rows = _concat([kept, new_rows])
+            new_chunk = manifest["next_chunk"]
+            manifest["next_chunk"] += 1
+            self._write_chunk(new_chunk, rows, manifest)
+            entries.append(
+                {
+                    "keys": np.concatenate([index["keys"][keep], keys[replace]]),
+                    "chunk": np.full(len(rows), new_chunk, dtype="int32"),
+                    "row": np.arange(len(rows), dtype="int32"),
+                    "hash": np.concatenate([index["hash"][keep], hashes[replace]]),
+                }
+            )
+        untouched = ~np.isin(index["chunk"], touched)
+        entries.append({name: values[untouched] for name, values in index.items()})
+
+        if added.any():
+            entries.append(
+                self._append(df.iloc[np.flatnonzero(added)], hashes[added], manifest)
+            )
+        self._commit(manifest, entries)
+        stats["chunks_written"] = manifest["next_chunk"] - first_new_chunk
+        return stats
+
+    def _feature_rows(self, df: pd.DataFrame, manifest: dict) -> pd.DataFrame:
+        features = derive_features(df, manifest["clv_col"], manifest["clv_edges"])
+        return pd.concat([df, features], axis=1).reset_index(drop=True)
+
+    def _append(
+        self, df: pd.DataFrame, hashes: np.ndarray, manifest: dict
+    ) -> dict[str, np.ndarray]:
+        """Write ``df`` as new chunks; return their index entries."""
+        size = settings.feature_store_chunk_rows
+        keys, chunks, rows = [], [], []
+        for start in range(0, len(df), size):
+            chunk = manifest["next_chunk"]
+            manifest["next_chunk"] += 1
+            frame = self._feature_rows(df.iloc[start : start + size], manifest)
+            self._write_chunk(chunk, frame, manifest)
+            keys.append(frame[manifest["key"]].to_numpy())
+            chunks.append(np.full(len(frame), chunk, dtype="int32"))
+            rows.append(np.arange(len(frame), dtype="int32"))
+        return {
+            "keys": np.concatenate(keys) if keys else np.empty(0),
+            "chunk": np.concatenate(chunks) if chunks else np.empty(0, "int32"),
+            "row": np.concatenate(rows) if rows else np.empty(0, "int32"),
+            "hash": hashes,
+        }
+
+    def _write_chunk(self, chunk: int, frame: pd.DataFrame, manifest: dict) -> None:
+        write_frame(frame, self.path / "chunks" / str(chunk))
+        manifest["chunks"][str(chunk)] = len(frame)
+        manifest["columns"] = list(frame.columns)
+
+    def _commit(self, manifest: dict, entries: list[dict[str, np.ndarray]]) -> None:
+        """
+        Write a new sorted key index, then the manifest pointing at it, then
+        delete the chunks and index no longer referenced.
+        """
+        entries = [e for e in entries if len(e["keys"])] or [
+            {name: np.empty(0, "int64") for name in INDEX_FIELDS}
+        ]
+        index = {
+            name: np.concatenate([e[name] for e in entries]) for name in INDEX_FIELDS
+        }
+        if index["keys"].dtype == object:
+            index["keys"] = index["keys"].astype(str)
+        order = np.argsort(index["keys"], kind="stable")
+
+        manifest["generation"] = manifest.get("generation", 0) + 1
+        index_dir = self.path / f"index-{manifest['generation']}"
+        tmp = self.path / f"index.tmp-{os.getpid()}"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir()
+        for name in INDEX_FIELDS:
+            np.save(tmp / f"{name}.npy", index[name][order], allow_pickle=False)
+        tmp.rename(index_dir)
+
+        manifest["index"] = index_dir.name
+        manifest["rows"] = len(order)
+        manifest["updated_at"] = time.time()
+        write_json_atomic(self.path / MANIFEST, manifest)
+        self._stamp = None
+
+        for path in self.path.glob("index-*"):
+            if path != index_dir:
+                shutil.rmtree(path, ignore_errors=True)
+        for path in (self.path / "chunks").glob("*"):
+            if path.name not in manifest["chunks"]:
+                shutil.rmtree(path, ignore_errors=True)
+
+    # -------- cached maps --------
+    def _refresh(self) -> None:
+        """Reload the manifest and index maps when the manifest has changed."""
+        try:
+            stat = (self.path / MANIFEST).stat()
+            stamp: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_ino)
+        except OSError:
+            stamp = None
+        if stamp == self._stamp and (stamp is None or self._manifest):
+            return
+        self._stamp, self._manifest, self._index = stamp, {}, {}
+        self._chunks, self._maps = {}, {}
+        manifest = read_manifest(self.path) if stamp is not None else None
+        if manifest is None:
+            return
+        if manifest.get("format_version") != STORE_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported feature store format at {self.path}: "
+                f"{manifest.get('format_version')}"
+            )
+        self._manifest = manifest
+        self._index = {
+            name: np.load(self.path / manifest["index"] / f"{name}.npy", mmap_mode="r")
+            for name in INDEX_FIELDS
+        }
+
+    def _chunk_manifest(self, chunk: int) -> dict:
+        if chunk not in self._chunks:
+            path = self.path / "chunks" / str(chunk)
+            chunk_manifest = read_manifest(path)
+            if chunk_manifest is None:
+                raise FileNotFoundError(f"No feature chunk found at: {path}")
+            self._chunks[chunk] = chunk_manifest
+        return self._chunks[chunk]
+
+    def _entries(self, chunk: int, columns: list[str] | None) -> list[dict]:
+        entries = self._chunk_manifest(chunk)["columns"]
+        if columns is None:
+            return entries
+        by_name = {entry["name"]: entry for entry in entries}
+        missing = [col for col in columns if col not in by_name]
+        if missing:
+            raise KeyError(f"Columns not in feature store: {missing}")
+        return [by_name[col] for col in columns]
+
+    def _map(self, chunk: int, file: str) -> np.ndarray:
+        if (chunk, file) not in self._maps:
+            path = self.path / "chunks" / str(chunk) / file
+            self._maps[chunk, file] = np.load(path, mmap_mode="r")
+        return self._maps[chunk, file]
+
+    def _take(
+        self, chunk: int, rows: np.ndarray, columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        """``rows`` of one chunk, copied out of the cached column maps."""
+        data = {}
+        for entry in self._entries(chunk, columns):
+            values = self._map(chunk, entry["file"])[rows]
+            if entry["kind"] == "numeric":
+                data[entry["name"]] = values
+                continue
+            codes = pd.Categorical.from_codes(values, categories=entry["categories"])
+            data[entry["name"]] = (
+                codes if entry["kind"] == "category" else codes.astype(object)
+            )
+        return pd.DataFrame(data)
+
+    def _chunk_frame(
+        self, chunk: int, columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        """Memory-mapped ``columns`` of one chunk (all by default)."""
+        return read_columns(
+            self.path / "chunks" / str(chunk), self._chunk_manifest(chunk), columns
+        )
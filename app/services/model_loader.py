@@ -2,16 +2,20 @@
 FILE: app/service/model_loader.py
 Utilities for saving and loading machine learning models.
 Includes caching and logging.
+
+Models are joblib pickles by default; ``backend="onnx"`` loads an exported
+``.onnx`` graph (see ``app.services.onnx_backend``) into an onnxruntime CPU
+session instead, without importing scikit-learn or FLAML model code.
+joblib and onnxruntime are imported by the backend that needs them.
 """
 
 from __future__ import annotations
 
 from pathlib import Path
 
-import joblib
-
 from app.core import get_logger, get_settings
-from app.utils.decorators import log_and_cache
+from app.core.metrics import MODEL_LOAD_SECONDS, MODEL_MEMORY_BYTES, track
+from app.utils.decorators import log_and_cache, sizeof
 
 # --------------------------
 # Settings and Logger
@@ -20,53 +24,123 @@ settings = get_settings()
 logger = get_logger(__name__)
 
 MODEL_DIR = Path(settings.model_path).parent
-_model_cache: dict[str, object] = {}
+BACKENDS = ("joblib", "onnx")
+
+# resolved artifact path -> version of the file last loaded from it
+_VERSIONS: dict[Path, str] = {}
 
 
 # --------------------------
 # Model Load/Save
 # --------------------------
 @log_and_cache("MODEL_LOAD")
-def load_model(model_name: str) -> object:
+def load_model(
+    model_name: str, model_dir: str | Path | None = None, backend: str = "joblib"
+) -> object:
     """
     Load a model from disk, with in-memory caching.
 
     Args:
         model_name (str): Name of the model file without extension.
+        model_dir (str | Path | None): Folder holding the file.
+            Defaults to ``MODEL_DIR``.
+        backend (str): ``"joblib"`` for a ``.joblib`` pickle or ``"onnx"``
+            for an onnxruntime session over ``<model_name>.onnx``.
 
     Returns:
-        object: Loaded model.
+        object: Loaded model (or ``onnxruntime.InferenceSession``).
     """
-    if model_name in _model_cache:
-        logger.info(
-            "[%s][MODEL_LOAD] Retrieved '%s' from cache", settings.env, model_name
-        )
-        return _model_cache[model_name]
-
-    model_path = MODEL_DIR / f"{model_name}.joblib"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown model backend: {backend}")
+    suffix = ".onnx" if backend == "onnx" else ".joblib"
+    model_path = Path(model_dir or MODEL_DIR) / f"{model_name}{suffix}"
     if not model_path.exists():
         raise FileNotFoundError(f"Model file not found: {model_path}")
 
-    model = joblib.load(model_path)
-    _model_cache[model_name] = model
+    version = _file_version(model_path)
+    with track(MODEL_LOAD_SECONDS, model=model_name, backend=backend):
+        if backend == "onnx":
+            model = _onnx_session(model_path)
+        else:
+            model = _joblib_load(model_path)
+    _VERSIONS[model_path.resolve()] = version
+    # onnxruntime keeps the graph in native memory that sizeof cannot see;
+    # its weights take about the size of the .onnx file.
+    nbytes = model_path.stat().st_size if backend == "onnx" else sizeof(model)
+    MODEL_MEMORY_BYTES.labels(model=model_name).set(nbytes)
     logger.info(
-        "[%s][MODEL_LOAD] Loaded model '%s' from disk", settings.env, model_name
+        "[%s][MODEL_LOAD] Loaded %s model '%s' from disk",
+        settings.env,
+        backend,
+        model_name,
     )
     return model
 
 
+def _file_version(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+
+
+def artifact_version(
+    model_name: str, model_dir: str | Path | None = None, backend: str = "joblib"
+) -> str | None:
+    """
+    Version of the artifact ``load_model`` last read from disk.
+
+    The version (file size and modification time) changes whenever a
+    different file is loaded under the same name, which lets caches keyed on
+    model output tell models apart.
+
+    Returns:
+        str | None: Version string, or ``None`` if it was never loaded.
+    """
+    suffix = ".onnx" if backend == "onnx" else ".joblib"
+    path = Path(model_dir or MODEL_DIR) / f"{model_name}{suffix}"
+    return _VERSIONS.get(path.resolve())
+
+
+def _joblib_load(model_path: Path) -> object:
+    import joblib
+
+    return joblib.load(model_path)
+
+
+def _onnx_session(model_path: Path) -> object:
+    """CPU onnxruntime session with the configured intra-/inter-op threads."""
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = settings.onnx_intra_op_threads
+    options.inter_op_num_threads = settings.onnx_inter_op_threads
+    return ort.InferenceSession(
+        str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+    )
+
+
 def save_model(model: object, model_name: str):
     """
-    Save a model to disk and update cache.
+    Save a model to disk and invalidate its cached copies.
+
+    Every cached ``load_model`` entry for the name whose folder resolves to
+    ``MODEL_DIR`` is dropped, whether it was loaded with the default folder
+    or an explicit one.
 
     Args:
         model (object): Model object to save.
         model_name (str): Name of the model file without extension.
     """
+    import joblib
+
     MODEL_DIR.mkdir(parents=True, exist_ok=True)
     model_path = MODEL_DIR / f"{model_name}.joblib"
     joblib.dump(model, model_path)
-    _model_cache[model_name] = model
+    target = MODEL_DIR.resolve()
+    load_model.invalidate_where(  # type: ignore[attr-defined]
+        lambda key: key[0] == model_name
+        and key[2] == "joblib"
+        and Path(key[1] or MODEL_DIR).resolve() == target
+    )
     logger.info(
         "[%s][MODEL_SAVE] Saved model '%s' to %s", settings.env, model_name, model_path
     )
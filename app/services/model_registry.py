@@ -0,0 +1,297 @@
+"""
+FILE: app/services/model_registry.py
+File-based, versioned model registry with memory-mapped loads and hot swap.
+
+Layout under ``MODEL_DIR / "registry"``::
+
+    <name>/manifest.json          versions, checksums, live version
+    <name>/<version>/<artifact>   e.g. preprocessor.joblib, model.joblib
+
+Versions are immutable: a new version is written to a temporary folder and
+renamed into place, and the manifest is replaced atomically, so readers never
+see a partial version. Artifacts are dumped uncompressed and loaded with
+``joblib.load(mmap_mode="r")``, so NumPy arrays inside a model are mapped
+read-only from the page cache and shared by forked API workers.
+
+``LivePredictor`` serves the live version and swaps in a newly promoted one
+by replacing a single reference once the new version is fully loaded;
+requests already running keep the predictor they started with.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_logger, get_settings
+from app.services.model_loader import MODEL_DIR, load_model
+from app.utils.io import write_json_atomic
+
+# --------------------------
+# Settings and Logger
+# --------------------------
+settings = get_settings()
+logger = get_logger(__name__)
+
+REGISTRY_DIR = MODEL_DIR / "registry"
+MANIFEST = "manifest.json"
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(chunk_size):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ModelRegistry:
+    """
+    Versioned artifacts with a manifest and checksums.
+
+    Writes assume a single writer per model name; reads are safe at any time.
+    """
+
+    def __init__(self, root: str | Path | None = None):
+        self.root = Path(root or REGISTRY_DIR)
+
+    # -------- manifest --------
+    def manifest(self, name: str) -> dict:
+        """The manifest of ``name`` (empty when nothing is registered)."""
+        path = self.root / name / MANIFEST
+        if not path.exists():
+            return {"name": name, "live": None, "versions": {}}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def versions(self, name: str) -> list[str]:
+        """Registered versions, oldest first."""
+        return list(self.manifest(name)["versions"])
+
+    def live_version(self, name: str) -> str | None:
+        """The promoted version, if any."""
+        return self.manifest(name)["live"]
+
+    def path(self, name: str, version: str) -> Path:
+        """Folder holding the artifacts of one version."""
+        return self.root / name / version
+
+    # -------- writes --------
+    def register(
+        self,
+        name: str,
+        artifacts: Mapping[str, Any],
+        metadata: dict | None = None,
+        promote: bool = False,
+    ) -> str:
+        """
+        Store a new version of ``name``.
+
+        Args:
+            name (str): Model name.
+            artifacts (Mapping[str, Any]): Artifact name -> object (dumped as
+                ``<artifact>.joblib``) or ``Path`` of a file copied as-is
+                (e.g. an ``.onnx`` export).
+            metadata (dict | None): Free-form JSON metadata for the version.
+            promote (bool): Make the new version live.
+
+        Returns:
+            str: The new version (``v1``, ``v2``, ...).
+        """
+        import joblib
+
+        manifest = self.manifest(name)
+        version = f"v{len(manifest['versions']) + 1}"
+        (self.root / name).mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=self.root / name, prefix=".staging-"))
+        try:
+            files = {}
+            for artifact, obj in artifacts.items():
+                if isinstance(obj, Path):
+                    target = staging / f"{artifact}{obj.suffix}"
+                    shutil.copyfile(obj, target)
+                else:
+                    target = staging / f"{artifact}.joblib"
+                    joblib.dump(obj, target)  # uncompressed: loadable with mmap
+                files[target.name] = file_sha256(target)
+            os.replace(staging, self.path(name, version))
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        manifest["versions"][version] = {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "files": files,
+            "metadata": metadata or {},
+        }
+        if promote or manifest["live"] is None:
+            manifest["live"] = version
+        write_json_atomic(self.root / name / MANIFEST, manifest)
+        logger.info(
+            "[%s][MODEL_SAVE] Registered %s %s (%d artifacts)",
+            settings.env,
+            name,
+            version,
+            len(files),
+        )
+        return version
+
+    def promote(self, name: str, version: str) -> None:
+        """Make ``version`` the live version of ``name``."""
+        manifest = self.manifest(name)
+        if version not in manifest["versions"]:
+            raise KeyError(f"Unknown version {version} of {name}")
+        manifest["live"] = version
+        write_json_atomic(self.root / name / MANIFEST, manifest)
+        logger.info("[%s][MODEL_SAVE] Promoted %s %s", settings.env, name, version)
+
+    # -------- reads --------
+    def verify(self, name: str, version: str) -> None:
+        """Raise ``ValueError`` if any artifact does not match its checksum."""
+        files = self.manifest(name)["versions"][version]["files"]
+        folder = self.path(name, version)
+        for filename, expected in files.items():
+            if file_sha256(folder / filename) != expected:
+                raise ValueError(f"Checksum mismatch: {name}/{version}/{filename}")
+
+    def load(
+        self, name: str, version: str | None = None, verify: bool = True
+    ) -> dict[str, Any]:
+        """
+        Load every artifact of a version (default: the live one).
+
+        ``.joblib`` artifacts are memory-mapped read-only; other files are
+        returned as paths.
+
+        Returns:
+            dict[str, Any]: Artifact name -> object or ``Path``.
+        """
+        import joblib
+
+        version = version or self.live_version(name)
+        if version is None:
+            raise FileNotFoundError(f"No live version of {name} in {self.root}")
+        if verify:
+            self.verify(name, version)
+        folder = self.path(name, version)
+        artifacts: dict[str, Any] = {}
+        for filename in self.manifest(name)["versions"][version]["files"]:
+            path = folder / filename
+            artifacts[path.stem] = (
+                joblib.load(path, mmap_mode="r") if path.suffix == ".joblib" else path
+            )
+        return artifacts
+
+
+# --------------------------
+# Hot-swappable predictor
+# --------------------------
+class LivePredictor:
+    """
+    Predictor that follows the live version of a registry entry.
+
+    ``refresh`` loads and warms up a newly promoted version and then swaps the
+    reference used by new calls. Calls delegate to the current predictor, so
+    in-flight requests finish on the version they started with.
+    """
+
+    def __init__(
+        self,
+        name: str | None = None,
+        registry: ModelRegistry | None = None,
+        backend: str | None = None,
+    ):
+        self.name = name or settings.registry_model_name
+        self.registry = registry or ModelRegistry()
+        self.backend = backend or settings.serving_backend
+        self.version: str | None = None
+        self._current: Any = None
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def __reduce__(self):
+        return (type(self), (self.name, self.registry, self.backend))
+
+    def _build(self, version: str) -> Any:
+        from app.services.predictor import ChurnPredictor
+
+        model_name = f"{self.name}@{version}"
+        files = self.registry.manifest(self.name)["versions"][version]["files"]
+        digest = hashlib.sha256("".join(sorted(files.values())).encode())
+        model_version = f"{model_name}:{digest.hexdigest()[:16]}"
+        if self.backend == "onnx":
+            from app.services.onnx_backend import OnnxChurnPredictor
+
+            folder = self.registry.path(self.name, version)
+            self.registry.verify(self.name, version)
+            session = load_model("model_onnx", folder, backend="onnx")
+            return OnnxChurnPredictor(
+                session, model_name=model_name, model_version=model_version
+            )
+        artifacts = self.registry.load(self.name, version)
+        return ChurnPredictor(
+            artifacts["preprocessor"],
+            artifacts["model"],
+            model_name=model_name,
+            model_version=model_version,
+        )
+
+    def refresh(self) -> bool:
+        """Swap to the live version if it changed; return whether it did."""
+        from app.services.predictor import warm_up
+
+        with self._lock:
+            live = self.registry.live_version(self.name)
+            if live is None:
+                raise FileNotFoundError(f"No live version of {self.name}")
+            if live == self.version:
+                return False
+            predictor = self._build(live)
+            warm_up(predictor)
+            previous, self.version = self.version, live
+            self._current = predictor
+        logger.info(
+            "[%s][PREDICT] Serving %s %s (was %s)",
+            settings.env,
+            self.name,
+            live,
+            previous,
+        )
+        return True
+
+    @property
+    def current(self) -> Any:
+        """The predictor new calls are sent to."""
+        return self._current
+
+    @property
+    def model_name(self) -> str:
+        return self._current.model_name
+
+    @property
+    def model_version(self) -> str:
+        return self._current.model_version
+
+    @property
+    def feature_columns(self) -> list[str]:
+        return self._current.feature_columns
+
+    def predict_proba(self, features: pd.DataFrame) -> np.ndarray:
+        """Return the churn probability for every row of ``features``."""
+        return self._current.predict_proba(features)
+
+    def predict_records(self, records: Sequence[Any]) -> np.ndarray:
+        """Score a sequence of records with the current version."""
+        return self._current.predict_records(records)
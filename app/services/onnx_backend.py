@@ -0,0 +1,252 @@
+"""
+FILE: app/services/onnx_backend.py
+ONNX export of the serving preprocessor + model, and an onnxruntime predictor.
+
+``export_onnx`` converts the fitted preprocessor and model into one ONNX
+graph with one input per raw feature column (strings for categoricals,
+doubles for numerics). Two adjustments keep it numerically equal to the
+joblib pipeline:
+- onnxruntime has no double ``Imputer`` kernel, so ``SimpleImputer`` steps
+  are left out of the graph and their fill values are stored in the model
+  metadata; ``OnnxChurnPredictor`` fills missing inputs before each run.
+- features are cast to float32 right before the estimator, as scikit-learn
+  trees do, so split thresholds compare the same values.
+
+Requires the optional ``onnx`` extra (skl2onnx, onnxruntime). scikit-learn
+is only imported for the export, so serving workers never load it.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_logger, get_settings
+from app.core.metrics import INFERENCE_SECONDS, PREPROCESS_SECONDS, track
+from app.services.model_loader import artifact_version, load_model
+
+if TYPE_CHECKING:
+    from sklearn.compose import ColumnTransformer
+
+# --------------------------
+# Settings and Logger
+# --------------------------
+settings = get_settings()
+logger = get_logger(__name__)
+
+TARGET_OPSET = {"": 17, "ai.onnx.ml": 3}
+
+
+# --------------------------
+# Export
+# --------------------------
+def _unwrap_estimator(model: Any) -> Any:
+    """The fitted scikit-learn estimator inside a FLAML ``AutoML`` wrapper."""
+    inner = getattr(model, "model", None)
+    return getattr(inner, "estimator", model) if inner is not None else model
+
+
+def _strip_imputers(preprocessor: ColumnTransformer) -> tuple[ColumnTransformer, dict]:
+    """Copy of ``preprocessor`` without ``SimpleImputer`` steps, plus fill values."""
+    from sklearn.compose import ColumnTransformer
+    from sklearn.impute import SimpleImputer
+    from sklearn.pipeline import Pipeline
+
+    if not isinstance(preprocessor, ColumnTransformer):
+        raise TypeError(f"Cannot export {type(preprocessor).__name__}")
+    stripped = copy.deepcopy(preprocessor)
+    names = list(stripped.feature_names_in_)
+    fill_values: dict[str, Any] = {}
+    for _name, transformer, columns in stripped.transformers_:
+        if not isinstance(transformer, Pipeline):
+            continue
+        columns = [names[c] if isinstance(c, int) else c for c in columns]
+        kept = []
+        for step_name, step in transformer.steps:
+            if isinstance(step, SimpleImputer):
+                if step.add_indicator:
+                    raise TypeError(
+                        "SimpleImputer(add_indicator=True) cannot be exported"
+                    )
+                fill_values.update(zip(columns, step.statistics_.tolist()))
+            else:
+                kept.append((step_name, step))
+        transformer.steps = kept
+    return stripped, fill_values
+
+
+def export_onnx(
+    preprocessor: Any,
+    model: Any,
+    model_name: str,
+    model_dir: str | Path | None = None,
+) -> Path:
+    """
+    Convert the fitted preprocessor and model into one ONNX file.
+
+    Args:
+        preprocessor: Fitted ``ColumnTransformer`` over the raw columns.
+        model: Fitted classifier (a FLAML ``AutoML`` is unwrapped).
+        model_name (str): File name without extension.
+        model_dir (str | Path | None): Output folder. Defaults to
+            ``settings.serving_artifact_dir``.
+
+    Returns:
+        Path: The written ``.onnx`` file.
+    """
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import DoubleTensorType, StringTensorType
+    from skl2onnx.sklapi import CastTransformer
+    from sklearn.pipeline import Pipeline
+
+    stripped, fill_values = _strip_imputers(preprocessor)
+    estimator = _unwrap_estimator(model)
+    cast = CastTransformer(dtype=np.float32).fit(np.zeros((1, 1)))
+    pipeline = Pipeline(
+        [("preprocessor", stripped), ("cast", cast), ("model", estimator)]
+    )
+
+    string_columns = _string_columns(preprocessor)
+    inputs = [
+        (
+            col,
+            (
+                StringTensorType([None, 1])
+                if col in string_columns
+                else DoubleTensorType([None, 1])
+            ),
+        )
+        for col in preprocessor.feature_names_in_
+    ]
+    onnx_model = convert_sklearn(
+        pipeline,
+        initial_types=inputs,
+        options={type(estimator): {"zipmap": False}},
+        target_opset=TARGET_OPSET,
+    )
+    meta = onnx_model.metadata_props.add()
+    meta.key, meta.value = "fill_values", json.dumps(fill_values)
+
+    model_dir = model_dir or settings.serving_artifact_dir
+    path = Path(model_dir) / f"{model_name}.onnx"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(onnx_model.SerializeToString())
+    load_model.invalidate(model_name, model_dir, backend="onnx")  # type: ignore[attr-defined]
+    logger.info(
+        "[%s][MODEL_SAVE] Exported ONNX model '%s' to %s",
+        settings.env,
+        model_name,
+        path,
+    )
+    return path
+
+
+def _string_columns(preprocessor: ColumnTransformer) -> set[str]:
+    """Input columns routed to a one-hot encoder (fed as strings)."""
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OneHotEncoder
+
+    names = list(preprocessor.feature_names_in_)
+    string_columns: set[str] = set()
+    for _name, transformer, columns in preprocessor.transformers_:
+        steps = transformer.steps if isinstance(transformer, Pipeline) else []
+        if any(isinstance(step, OneHotEncoder) for _, step in steps):
+            string_columns.update(
+                names[c] if isinstance(c, int) else c for c in columns
+            )
+    return string_columns
+
+
+# --------------------------
+# Inference
+# --------------------------
+class OnnxChurnPredictor:
+    """Scores raw feature columns through an onnxruntime session."""
+
+    def __init__(
+        self,
+        session: Any,
+        model_name: str = "model",
+        model_dir=None,
+        model_version: str | None = None,
+    ):
+        self.session = session
+        self.model_name = model_name
+        self.model_dir = model_dir
+        self.model_version = model_version or model_name
+        inputs = session.get_inputs()
+        self.feature_columns: list[str] = [i.name for i in inputs]
+        self._string_columns = {i.name for i in inputs if i.type == "tensor(string)"}
+        meta = session.get_modelmeta().custom_metadata_map
+        self._fill_values: dict[str, Any] = json.loads(meta.get("fill_values", "{}"))
+        self._proba_output = session.get_outputs()[1].name
+
+    @classmethod
+    def load(
+        cls, model_name: str | None = None, model_dir: str | Path | None = None
+    ) -> OnnxChurnPredictor:
+        """Load the exported serving model named in settings."""
+        model_name = model_name or settings.serving_model_name
+        model_dir = model_dir or settings.serving_artifact_dir
+        session = load_model(model_name, model_dir, backend="onnx")
+        logger.info(
+            "[%s][PREDICT] Serving model '%s' with onnxruntime",
+            settings.env,
+            model_name,
+        )
+        version = artifact_version(model_name, model_dir, backend="onnx")
+        return cls(
+            session,
+            model_name=model_name,
+            model_dir=model_dir,
+            model_version=f"{model_name}.onnx:{version}",
+        )
+
+    def __reduce__(self):
+        # Sessions are not picklable; process-pool workers re-open the file.
+        return (type(self).load, (self.model_name, self.model_dir))
+
+    def _run(self, columns: Mapping[str, Any]) -> np.ndarray:
+        with track(PREPROCESS_SECONDS, path="onnx_feed"):
+            feed = self._feed(columns)
+        with track(INFERENCE_SECONDS, backend="onnx"):
+            probabilities = self.session.run([self._proba_output], feed)[0]
+        return np.asarray(probabilities, dtype="float64")[:, 1]
+
+    def _feed(self, columns: Mapping[str, Any]) -> dict[str, np.ndarray]:
+        feed = {}
+        for col in self.feature_columns:
+            fill = self._fill_values.get(col)
+            if col in self._string_columns:
+                values = [
+                    fill if _is_missing(v) and fill is not None else str(v)
+                    for v in columns[col]
+                ]
+                feed[col] = np.array(values, dtype=object).reshape(-1, 1)
+            else:
+                array = np.array(columns[col], dtype="float64").reshape(-1, 1)
+                if fill is not None:
+                    array[np.isnan(array)] = fill
+                feed[col] = array
+        return feed
+
+    def predict_proba(self, features: pd.DataFrame) -> np.ndarray:
+        """Return the churn probability for every row of ``features``."""
+        return self._run(features)
+
+    def predict_records(self, records: Sequence[Any]) -> np.ndarray:
+        """Score a sequence of records (mappings or objects with feature attributes)."""
+        rows = [r if isinstance(r, Mapping) else vars(r) for r in records]
+        return self._run(
+            {col: [row.get(col) for row in rows] for col in self.feature_columns}
+        )
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
@@ -0,0 +1,359 @@
+"""
+FILE: app/services/prediction_cache.py
+Cache of churn scores keyed on canonicalized customer features.
+
+A record is reduced to its feature values in ``feature_columns`` order, with
+numbers as floats (``26`` and ``26.0`` give the same features) and missing
+values as ``null``. The key hashes that row together with the predictor's
+``model_version``, which ``model_loader`` derives from the loaded files, so a
+new model never serves scores cached for an old one. When the version
+changes, entries of other versions are purged.
+
+Backends (``settings.prediction_cache``):
+- ``memory``: per-process LRU with a TTL
+- ``sqlite``: one SQLite file (WAL mode) that survives restarts and is shared
+  by the API worker processes; least recently used rows are evicted past
+  ``maxsize``
+
+``CachedPredictor`` wraps any serving predictor, scores only the records that
+miss, and counts hits, misses and the scoring time saved.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_logger, get_settings
+from app.core.metrics import CACHE_REQUESTS, CACHE_SAVED_SECONDS
+
+# --------------------------
+# Settings and Logger
+# --------------------------
+settings = get_settings()
+logger = get_logger(__name__)
+
+BACKENDS = ("memory", "sqlite")
+
+
+def _canonical(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, bool | np.bool_):
+        return bool(value)
+    if isinstance(value, int | float | np.integer | np.floating):
+        number = float(value)
+        return None if math.isnan(number) else number
+    return str(value)
+
+
+def feature_key(record: Any, columns: Sequence[str], model_version: str) -> str:
+    """
+    Stable hash of one record's features under ``model_version``.
+
+    Args:
+        record (Any): Mapping or object with one attribute per feature.
+        columns (Sequence[str]): Feature columns, in model order.
+        model_version (str): Version of the model that scores the record.
+
+    Returns:
+        str: 32-character hex key.
+    """
+    row = record if isinstance(record, Mapping) else vars(record)
+    values = [_canonical(row.get(col)) for col in columns]
+    payload = json.dumps([model_version, values], separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+# --------------------------
+# Backends
+# --------------------------
+class MemoryPredictionCache:
+    """Thread-safe in-process LRU of ``key -> (probability, version, expiry)``."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, float]:
+        """Return the cached, unexpired values among ``keys``."""
+        now = time.time()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._data.get(key)
+                if entry is None:
+                    continue
+                if entry[2] <= now:
+                    del self._data[key]
+                    continue
+                self._data.move_to_end(key)
+                found[key] = entry[0]
+        return found
+
+    def put_many(self, items: Mapping[str, float], version: str) -> None:
+        """Store ``key -> value`` for ``version``, evicting the least recently used."""
+        expires = time.time() + self.ttl if self.ttl else math.inf
+        with self._lock:
+            for key, value in items.items():
+                self._data[key] = (value, version, expires)
+                self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def purge(self, keep_version: str) -> int:
+        """Drop entries of every other version; return how many."""
+        with self._lock:
+            stale = [k for k, (_, v, _) in self._data.items() if v != keep_version]
+            for key in stale:
+                del self._data[key]
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SqlitePredictionCache:
+    """
+    LRU with a TTL in one SQLite file, shared by processes on the host.
+
+    Each thread (and forked process) opens its own connection.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS predictions (
+            key TEXT PRIMARY KEY,
+            version TEXT NOT NULL,
+            value REAL NOT NULL,
+            expires REAL NOT NULL,
+            used REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS predictions_used ON predictions (used);
+    """
+
+    def __init__(self, path: str | Path, maxsize: int, ttl: float | None = None):
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._local = threading.local()
+        self._puts = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, float]:
+        """Return the cached, unexpired values among ``keys``."""
+        if not keys:
+            return {}
+        now = time.time()
+        marks = ",".join("?" * len(keys))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT key, value FROM predictions "
+                f"WHERE key IN ({marks}) AND expires > ?",
+                (*keys, now),
+            ).fetchall()
+            if rows:
+                conn.execute(
+                    f"UPDATE predictions SET used = ? "
+                    f"WHERE key IN ({','.join('?' * len(rows))})",
+                    (now, *(key for key, _ in rows)),
+                )
+        return dict(rows)
+
+    def put_many(self, items: Mapping[str, float], version: str) -> None:
+        """Store ``key -> value`` for ``version``, evicting the least recently used."""
+        now = time.time()
+        expires = now + self.ttl if self.ttl else math.inf
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?, ?)",
+                [(key, version, value, expires, now) for key, value in items.items()],
+            )
+            self._puts += len(items)
+            # Evict in steps of ~10% of maxsize instead of counting every write.
+            if self._puts >= max(1, self.maxsize // 10):
+                self._puts = 0
+                conn.execute("DELETE FROM predictions WHERE expires <= ?", (now,))
+                conn.execute(
+                    "DELETE FROM predictions WHERE key IN (SELECT key FROM "
+                    "predictions ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                    (self.maxsize,),
+                )
+
+    def purge(self, keep_version: str) -> int:
+        """Drop entries of every other version; return how many."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM predictions WHERE version != ?", (keep_version,)
+            )
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+
+
+def make_cache(
+    backend: str | None = None,
+    maxsize: int | None = None,
+    ttl: float | None = None,
+    path: str | Path | None = None,
+) -> MemoryPredictionCache | SqlitePredictionCache:
+    """Build the cache backend from arguments or ``settings.prediction_cache_*``."""
+    backend = backend or settings.prediction_cache
+    maxsize = settings.prediction_cache_max_entries if maxsize is None else maxsize
+    ttl = settings.prediction_cache_ttl_seconds if ttl is None else ttl
+    if backend == "memory":
+        return MemoryPredictionCache(maxsize, ttl)
+    if backend == "sqlite":
+        return SqlitePredictionCache(
+            path or settings.prediction_cache_path, maxsize, ttl
+        )
+    raise ValueError(f"Unknown prediction cache backend: {backend}")
+
+
+# --------------------------
+# Cached predictor
+# --------------------------
+class PredictionCacheInfo(NamedTuple):
+    """Counters of one process's ``CachedPredictor``."""
+
+    hits: int
+    misses: int
+    hit_rate: float
+    saved_seconds: float  # hits x mean scoring seconds per missed record
+    entries: int
+
+
+class CachedPredictor:
+    """
+    Serving predictor that looks up record scores before scoring them.
+
+    ``predict_records`` answers cached records from the cache and scores the
+    rest in one call; ``predict_proba`` (DataFrames, batch jobs) is passed
+    through uncached.
+    """
+
+    def __init__(self, predictor: Any, cache: Any):
+        self.predictor = predictor
+        self.cache = cache
+        self._version: str | None = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._miss_seconds = 0.0
+        self._hit_counter = CACHE_REQUESTS.labels(cache="prediction", result="hit")
+        self._miss_counter = CACHE_REQUESTS.labels(cache="prediction", result="miss")
+        self._saved_counter = CACHE_SAVED_SECONDS.labels(cache="prediction")
+
+    def __reduce__(self):
+        return (type(self), (self.predictor, self.cache))
+
+    @property
+    def model_name(self) -> str:
+        return self.predictor.model_name
+
+    @property
+    def model_version(self) -> str:
+        return self.predictor.model_version
+
+    @property
+    def feature_columns(self) -> list[str]:
+        return self.predictor.feature_columns
+
+    def __getattr__(self, name: str) -> Any:
+        # refresh(), version, ... of a wrapped LivePredictor
+        if name == "predictor":
+            raise AttributeError(name)
+        return getattr(self.predictor, name)
+
+    def _check_version(self, version: str) -> None:
+        if version == self._version:
+            return
+        with self._lock:
+            if version != self._version:
+                purged = self.cache.purge(version)
+                logger.info(
+                    "[%s][PREDICT] Cache now on %s (%d stale entries purged)",
+                    settings.env,
+                    version,
+                    purged,
+                )
+                self._version = version
+
+    def predict_proba(self, features: pd.DataFrame) -> np.ndarray:
+        """Return the churn probability for every row of ``features``."""
+        return self.predictor.predict_proba(features)
+
+    def predict_records(self, records: Sequence[Any]) -> np.ndarray:
+        """Score records, reusing cached scores of identical feature rows."""
+        version = self.predictor.model_version
+        self._check_version(version)
+        columns = self.predictor.feature_columns
+        keys = [feature_key(r, columns, version) for r in records]
+        found = self.cache.get_many(list(dict.fromkeys(keys)))
+        missing = [i for i, key in enumerate(keys) if key not in found]
+
+        probabilities = np.empty(len(records), dtype="float64")
+        if missing:
+            start = time.perf_counter()
+            scores = self.predictor.predict_records([records[i] for i in missing])
+            elapsed = time.perf_counter() - start
+            probabilities[missing] = scores
+            self.cache.put_many(
+                {keys[i]: float(p) for i, p in zip(missing, scores, strict=True)},
+                version,
+            )
+        for i, key in enumerate(keys):
+            if key in found:
+                probabilities[i] = found[key]
+
+        n_hits = len(records) - len(missing)
+        with self._lock:
+            self._hits += n_hits
+            self._misses += len(missing)
+            if missing:
+                self._miss_seconds += elapsed
+            per_record = self._miss_seconds / self._misses if self._misses else 0.0
+        self._hit_counter.inc(n_hits)
+        self._miss_counter.inc(len(missing))
+        self._saved_counter.inc(n_hits * per_record)
+        return probabilities
+
+    def cache_info(self) -> PredictionCacheInfo:
+        """Hit/miss counters and the estimated scoring time saved."""
+        with self._lock:
+            hits, misses, miss_seconds = self._hits, self._misses, self._miss_seconds
+        total = hits + misses
+        per_record = miss_seconds / misses if misses else 0.0
+        return PredictionCacheInfo(
+            hits=hits,
+            misses=misses,
+            hit_rate=hits / total if total else 0.0,
+            saved_seconds=hits * per_record,
+            entries=len(self.cache),
+        )
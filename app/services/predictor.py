@@ -0,0 +1,179 @@
+"""
+FILE: app/services/predictor.py
+Vectorized churn scoring with the saved preprocessor and model.
+
+A batch of records is scored as one matrix: a single ``transform`` call on
+the preprocessor and a single ``predict_proba`` call on the model.
+
+Small batches of records (single ``/predict`` calls, micro-batches) skip the
+DataFrame and go through the preprocessor compiled by
+``app.services.fast_transform``, which gives identical features.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_logger, get_settings
+from app.core.metrics import INFERENCE_SECONDS, PREPROCESS_SECONDS, track
+from app.services.fast_transform import CompiledPreprocessor, compile_preprocessor
+from app.services.model_loader import artifact_version, load_model
+
+# --------------------------
+# Settings and Logger
+# --------------------------
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+class ChurnPredictor:
+    """Preprocessor + model pair that scores records in one vectorized call."""
+
+    def __init__(
+        self,
+        preprocessor: Any,
+        model: Any,
+        model_name: str = "model",
+        model_version: str | None = None,
+    ):
+        self.preprocessor = preprocessor
+        self.model = model
+        self.model_name = model_name
+        self.model_version = model_version or model_name
+        self.feature_columns: list[str] = list(preprocessor.feature_names_in_)
+        self.compiled: CompiledPreprocessor | None = None
+        try:
+            self.compiled = compile_preprocessor(preprocessor)
+        except TypeError as exc:
+            logger.warning(
+                "[%s][PREDICT] No compiled record path, using pandas: %s",
+                settings.env,
+                exc,
+            )
+
+    @classmethod
+    def load(cls) -> ChurnPredictor:
+        """Load the serving preprocessor and model named in settings."""
+        artifact_dir = settings.serving_artifact_dir
+        preprocessor = load_model(settings.serving_preprocessor_name, artifact_dir)
+        model = load_model(settings.serving_model_name, artifact_dir)
+        logger.info(
+            "[%s][PREDICT] Serving model '%s'",
+            settings.env,
+            settings.serving_model_name,
+        )
+        version = "+".join(
+            str(artifact_version(name, artifact_dir))
+            for name in (
+                settings.serving_preprocessor_name,
+                settings.serving_model_name,
+            )
+        )
+        return cls(
+            preprocessor,
+            model,
+            model_name=settings.serving_model_name,
+            model_version=f"{settings.serving_model_name}:{version}",
+        )
+
+    def predict_proba(self, features: pd.DataFrame) -> np.ndarray:
+        """Return the churn probability for every row of ``features``."""
+        with track(PREPROCESS_SECONDS, path="pandas"):
+            matrix = self.preprocessor.transform(features[self.feature_columns])
+        with track(INFERENCE_SECONDS, backend="sklearn"):
+            return np.asarray(self.model.predict_proba(matrix))[:, 1]
+
+    def predict_records(self, records: Sequence[Any]) -> np.ndarray:
+        """
+        Score records (mappings or objects with one attribute per feature).
+
+        Up to ``settings.fast_path_max_records`` records are transformed by
+        the compiled preprocessor straight into a dense matrix. Larger batches
+        gather columns record-by-record into one DataFrame.
+        """
+        rows = [r if isinstance(r, Mapping) else vars(r) for r in records]
+        if self.compiled is not None and len(rows) <= settings.fast_path_max_records:
+            with track(PREPROCESS_SECONDS, path="compiled"):
+                matrix = self.compiled.transform_records(rows)
+            with track(INFERENCE_SECONDS, backend="sklearn"):
+                return np.asarray(self.model.predict_proba(matrix))[:, 1]
+        frame = pd.DataFrame(
+            {col: [row.get(col) for row in rows] for col in self.feature_columns}
+        )
+        return self.predict_proba(frame)
+
+
+def load_predictor(backend: str | None = None) -> Any:
+    """
+    Load the serving predictor for ``backend`` (default ``settings.serving_backend``).
+
+    ``"joblib"`` returns a ``ChurnPredictor``; ``"onnx"`` an
+    ``OnnxChurnPredictor`` over the exported graph. With
+    ``settings.serving_registry`` the live registry version is served through
+    a hot-swappable ``LivePredictor`` instead. With ``settings.prediction_cache``
+    the predictor is wrapped in a ``CachedPredictor``. All expose
+    ``predict_proba``, ``predict_records``, ``feature_columns``,
+    ``model_name`` and ``model_version``.
+    """
+    backend = backend or settings.serving_backend
+    predictor: Any
+    if settings.serving_registry:
+        from app.services.model_registry import LivePredictor
+
+        predictor = LivePredictor(backend=backend)
+    elif backend == "onnx":
+        from app.services.onnx_backend import OnnxChurnPredictor
+
+        predictor = OnnxChurnPredictor.load()
+    elif backend == "joblib":
+        predictor = ChurnPredictor.load()
+    else:
+        raise ValueError(f"Unknown serving backend: {backend}")
+    if settings.prediction_cache != "off":
+        from app.services.prediction_cache import CachedPredictor, make_cache
+
+        predictor = CachedPredictor(predictor, make_cache())
+    return predictor
+
+
+def warm_up(predictor: Any, n_records: int | None = None) -> float:
+    """
+    Score a few rows so the first real request does not pay one-off costs.
+
+    Runs the single-record and DataFrame paths once each, which triggers lazy
+    imports, compiled-path allocations and onnxruntime buffer setup.
+
+    Args:
+        predictor: Any serving predictor (see ``load_predictor``).
+        n_records (int | None): Rows read from ``settings.warmup_data_path``
+            (default ``settings.warmup_records``); 0 skips the warm-up.
+
+    Returns:
+        float: Seconds spent.
+    """
+    n_records = settings.warmup_records if n_records is None else n_records
+    path = Path(settings.warmup_data_path or settings.default_csv_path)
+    if n_records <= 0:
+        return 0.0
+    if not path.exists():
+        logger.warning("[%s][PREDICT] No warm-up data at %s", settings.env, path)
+        return 0.0
+
+    start = time.perf_counter()
+    features = pd.read_csv(path, nrows=n_records)[predictor.feature_columns]
+    predictor.predict_records(features.head(1).to_dict("records"))
+    predictor.predict_proba(features)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "[%s][PREDICT] Warmed up on %d rows in %.3fs",
+        settings.env,
+        len(features),
+        elapsed,
+    )
+    return elapsed
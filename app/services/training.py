@@ -0,0 +1,281 @@
+"""
+FILE: app/services/training.py
+Mini-batch training of the churn MLP over one float32 feature matrix.
+
+The dataset is transformed once into a C-contiguous float32 matrix whose rows
+are laid out as ``[train | validation]`` (``TrainingData``), so both splits
+are views of it and no DataFrame is copied per split or per batch. Each epoch
+shuffles the training rows in place and ``iter_batches`` yields contiguous
+slices, i.e. zero-copy views, like a shuffling ``DataLoader``.
+
+The model is scikit-learn's ``MLPClassifier``, updated with ``partial_fit``
+once per mini-batch on the CPU, with BLAS threads capped by threadpoolctl.
+The model with the lowest validation log loss is checkpointed through
+``model_loader.save_model``; training stops after ``patience`` epochs without
+improvement. Every epoch reports throughput and peak RSS.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from app.core import get_logger, get_settings
+from app.services.data_loader import binary_target, serving_view, split_indices
+from app.services.model_loader import save_model
+from app.utils.memory import peak_rss_mb, reset_peak_rss
+
+# --------------------------
+# Settings and Logger
+# --------------------------
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+# --------------------------
+# Data
+# --------------------------
+@dataclass
+class TrainingData:
+    """Feature matrix with the training rows first, then the validation rows."""
+
+    features: np.ndarray  # (n_rows, n_features) float32, C-contiguous
+    target: np.ndarray  # (n_rows,) int8
+    n_train: int
+
+    @property
+    def train(self) -> tuple[np.ndarray, np.ndarray]:
+        return self.features[: self.n_train], self.target[: self.n_train]
+
+    @property
+    def validation(self) -> tuple[np.ndarray, np.ndarray]:
+        return self.features[self.n_train :], self.target[self.n_train :]
+
+
+def feature_columns(df: pd.DataFrame, target: str) -> tuple[list[str], list[str]]:
+    """Numeric and categorical feature columns; bool flags count as categorical."""
+    num_cols, cat_cols = [], []
+    for col in df.columns.drop(target):
+        dtype = df[col].dtype
+        numeric = pd.api.types.is_numeric_dtype(dtype)
+        if numeric and not pd.api.types.is_bool_dtype(dtype):
+            num_cols.append(col)
+        else:
+            cat_cols.append(col)
+    return num_cols, cat_cols
+
+
+def build_training_data(
+    df: pd.DataFrame,
+    target: str,
+    preprocessor: Any,
+    val_size: float | None = None,
+    random_state: int = 42,
+) -> TrainingData:
+    """
+    Split by index, fit ``preprocessor`` on the training rows and transform once.
+
+    Args:
+        df (pd.DataFrame): Labelled dataset (compact dtypes from ``load_train``
+            or plain ``yes``/``no`` strings).
+        target (str): Label column.
+        preprocessor (Any): Unfitted transformer, e.g. ``build_preprocessor``.
+        val_size (float | None): Validation fraction. Defaults to ``settings.val_size``.
+        random_state (int): Seed of the split.
+
+    Returns:
+        TrainingData: Float32 matrix laid out as ``[train | validation]``.
+    """
+    val_size = settings.val_size if val_size is None else val_size
+    y = binary_target(df[target])
+    train_idx, val_idx = split_indices(y, val_size, random_state)
+
+    features = serving_view(df, list(df.columns.drop(target)))
+    preprocessor.fit(features.iloc[train_idx])
+    matrix = preprocessor.transform(features)
+    if hasattr(matrix, "toarray"):
+        matrix = matrix.toarray()
+    order = np.concatenate([train_idx, val_idx])
+    logger.info(
+        "[%s][TRAIN] %d train / %d validation rows, %d features",
+        settings.env,
+        len(train_idx),
+        len(val_idx),
+        matrix.shape[1],
+    )
+    return TrainingData(
+        features=np.ascontiguousarray(np.asarray(matrix, dtype=np.float32)[order]),
+        target=y[order],
+        n_train=len(train_idx),
+    )
+
+
+def iter_batches(
+    features: np.ndarray,
+    target: np.ndarray,
+    batch_size: int,
+    rng: np.random.Generator,
+    drop_last: bool = True,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Shuffle rows in place, then yield contiguous mini-batches as views.
+
+    ``features`` and ``target`` are permuted identically (the generator state
+    is replayed for the second shuffle), so no index array is gathered and no
+    batch is copied.
+
+    Args:
+        features (np.ndarray): 2-D rows to shuffle (modified in place).
+        target (np.ndarray): Labels aligned with ``features``.
+        batch_size (int): Rows per batch.
+        rng (np.random.Generator): Source of the shuffle.
+        drop_last (bool): Skip a final batch shorter than ``batch_size``.
+    """
+    state = rng.bit_generator.state
+    rng.shuffle(features)
+    rng.bit_generator.state = state
+    rng.shuffle(target)
+    n = len(target)
+    stop = n - n % batch_size if drop_last and n >= batch_size else n
+    for start in range(0, stop, batch_size):
+        yield features[start : start + batch_size], target[start : start + batch_size]
+
+
+# --------------------------
+# Training
+# --------------------------
+class EpochStats(NamedTuple):
+    """Metrics of one training epoch."""
+
+    epoch: int
+    train_loss: float
+    val_loss: float
+    val_auc: float
+    seconds: float
+    samples_per_second: float
+    peak_rss_mb: float
+
+
+class TrainingResult(NamedTuple):
+    """Best model and the per-epoch history."""
+
+    model: Any
+    history: list[EpochStats]
+    best_epoch: int
+
+
+def train_mlp(
+    data: TrainingData,
+    epochs: int | None = None,
+    batch_size: int | None = None,
+    threads: int | None = None,
+    patience: int | None = None,
+    checkpoint_name: str | None = None,
+    random_state: int = 42,
+    on_epoch: Callable[[EpochStats], None] | None = None,
+) -> TrainingResult:
+    """
+    Train an ``MLPClassifier`` with streamed mini-batches and early stopping.
+
+    Args:
+        data (TrainingData): Output of ``build_training_data``.
+        epochs (int | None): Maximum epochs. Defaults to ``settings.epochs``.
+        batch_size (int | None): Rows per update. Defaults to ``settings.batch_size``.
+        threads (int | None): BLAS threads; 0 keeps the library default.
+            Defaults to ``settings.train_threads``.
+        patience (int | None): Epochs without a lower validation loss before
+            stopping. Defaults to ``settings.early_stopping_patience``.
+        checkpoint_name (str | None): Save each new best model under this
+            name via ``save_model``; ``None`` keeps it in memory only.
+        random_state (int): Seed of the weights and the shuffles.
+        on_epoch (Callable | None): Called with each epoch's ``EpochStats``.
+
+    Returns:
+        TrainingResult: Best model, history and the epoch it came from.
+    """
+    from sklearn.metrics import log_loss, roc_auc_score
+    from sklearn.neural_network import MLPClassifier
+    from threadpoolctl import threadpool_limits
+
+    epochs = epochs or settings.epochs
+    batch_size = batch_size or settings.batch_size
+    threads = settings.train_threads if threads is None else threads
+    patience = settings.early_stopping_patience if patience is None else patience
+
+    model = MLPClassifier(
+        hidden_layer_sizes=tuple(settings.mlp_hidden_layers),
+        batch_size=batch_size,
+        learning_rate_init=settings.learning_rate,
+        random_state=random_state,
+    )
+    classes = np.array([0, 1])
+    rng = np.random.default_rng(random_state)
+    x_train, y_train = data.train
+    x_val, y_val = data.validation
+    history: list[EpochStats] = []
+    best_model, best_loss, best_epoch = None, np.inf, 0
+
+    with threadpool_limits(limits=threads or None, user_api="blas"):
+        for epoch in range(1, epochs + 1):
+            reset_peak_rss()
+            start = time.perf_counter()
+            seen, loss_sum = 0, 0.0
+            for xb, yb in iter_batches(x_train, y_train, batch_size, rng):
+                model.partial_fit(xb, yb, classes=classes)
+                seen += len(yb)
+                loss_sum += model.loss_ * len(yb)
+            seconds = time.perf_counter() - start
+
+            proba = model.predict_proba(x_val)[:, 1]
+            stats = EpochStats(
+                epoch=epoch,
+                train_loss=loss_sum / max(seen, 1),
+                val_loss=float(log_loss(y_val, proba, labels=classes)),
+                val_auc=(
+                    float(roc_auc_score(y_val, proba))
+                    if len(np.unique(y_val)) > 1
+                    else float("nan")
+                ),
+                seconds=seconds,
+                samples_per_second=seen / seconds if seconds else 0.0,
+                peak_rss_mb=peak_rss_mb(),
+            )
+            history.append(stats)
+            logger.info(
+                "[%s][TRAIN] Epoch %d: loss %.4f, val loss %.4f, val AUC %.4f, "
+                "%.0f samples/s, peak RSS %.0f MB",
+                settings.env,
+                epoch,
+                stats.train_loss,
+                stats.val_loss,
+                stats.val_auc,
+                stats.samples_per_second,
+                stats.peak_rss_mb,
+            )
+            if on_epoch is not None:
+                on_epoch(stats)
+
+            if stats.val_loss < best_loss:
+                best_model, best_loss, best_epoch = (
+                    copy.deepcopy(model),
+                    stats.val_loss,
+                    epoch,
+                )
+                if checkpoint_name:
+                    save_model(best_model, checkpoint_name)
+            elif epoch - best_epoch >= patience:
+                logger.info(
+                    "[%s][TRAIN] Early stopping after epoch %d (best: %d)",
+                    settings.env,
+                    epoch,
+                    best_epoch,
+                )
+                break
+
+    return TrainingResult(best_model, history, best_epoch)
@@ -0,0 +1,67 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_cache(monkeypatch, tmp_path):
+    """Keep the columnar data cache out of the real processed-data folder."""
+    monkeypatch.setattr("app.services.data_cache.CACHE_DIR", tmp_path / "cache")
+
+
+@pytest.fixture(scope="session")
+def raw_train_df():
+    """First rows of the raw training CSV."""
+    from app.core import get_settings
+
+    return pd.read_csv(get_settings().default_csv_path, nrows=400)
+
+
+@pytest.fixture(scope="session")
+def churn_predictor(raw_train_df):
+    """Small predictor with the same preprocessing layout as the saved artifacts."""
+    from sklearn.compose import ColumnTransformer
+    from sklearn.impute import SimpleImputer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+    from app.services.predictor import ChurnPredictor
+
+    x_features = raw_train_df.drop(columns=["churn"])
+    y_target = (raw_train_df["churn"] == "yes").astype(int)
+    cat_cols = ["state", "area_code", "international_plan", "voice_mail_plan"]
+    num_cols = [c for c in x_features.columns if c not in cat_cols]
+    preprocessor = ColumnTransformer(
+        [
+            (
+                "num",
+                Pipeline(
+                    [
+                        ("imputer", SimpleImputer(strategy="median")),
+                        ("scaler", StandardScaler()),
+                    ]
+                ),
+                num_cols,
+            ),
+            (
+                "cat",
+                Pipeline(
+                    [
+                        (
+                            "imputer",
+                            SimpleImputer(strategy="constant", fill_value="missing"),
+                        ),
+                        ("onehot", OneHotEncoder(handle_unknown="ignore")),
+                    ]
+                ),
+                cat_cols,
+            ),
+        ]
+    )
+    matrix = preprocessor.fit_transform(x_features)
+    model = LogisticRegression(max_iter=1000).fit(matrix, y_target)
+    return ChurnPredictor(preprocessor, model, model_name="test_model")
@@ -0,0 +1,84 @@
+"""
+Minimal unit tests for app.services.batch_scoring
+Tests chunked scoring, process-pool ordering, and resuming.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.batch_scoring import count_written_rows, iter_chunks, score_file
+
+
+@pytest.fixture
+def customers_csv(tmp_path, raw_train_df):
+    df = raw_train_df.drop(columns=["churn"])
+    df.insert(0, "id", np.arange(1, len(df) + 1))
+    path = tmp_path / "customers.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_chunked_scores_match_one_shot(tmp_path, customers_csv, churn_predictor):
+    output = tmp_path / "scores.csv"
+    n_rows = score_file(customers_csv, output, chunk_size=64, predictor=churn_predictor)
+
+    scores = pd.read_csv(output)
+    expected = churn_predictor.predict_proba(pd.read_csv(customers_csv))
+    assert n_rows == len(scores) == len(expected)
+    assert scores["row"].tolist() == list(range(len(expected)))
+    np.testing.assert_allclose(scores["churn_probability"], expected)
+
+
+def test_process_pool_keeps_input_order(tmp_path, customers_csv, churn_predictor):
+    output = tmp_path / "scores.csv"
+    score_file(
+        customers_csv, output, chunk_size=50, workers=2, predictor=churn_predictor
+    )
+    scores = pd.read_csv(output)
+    assert scores["id"].tolist() == list(range(1, len(scores) + 1))
+
+
+def test_resume_continues_after_partial_output(
+    tmp_path, customers_csv, churn_predictor
+):
+    full = tmp_path / "full.csv"
+    score_file(customers_csv, full, chunk_size=100, predictor=churn_predictor)
+
+    partial = tmp_path / "partial.csv"
+    lines = full.read_text().splitlines(keepends=True)
+    partial.write_text("".join(lines[:151]) + lines[151][:5])  # cut mid-row
+    assert count_written_rows(partial) == 150
+
+    n_rows = score_file(
+        customers_csv, partial, chunk_size=100, resume=True, predictor=churn_predictor
+    )
+    assert n_rows == len(lines) - 1 - 150
+    pd.testing.assert_frame_equal(pd.read_csv(partial), pd.read_csv(full))
+
+
+@pytest.mark.parametrize("content", ["", "id,ro"])
+def test_resume_from_empty_output_writes_header(
+    tmp_path, customers_csv, churn_predictor, content
+):
+    full = tmp_path / "full.csv"
+    score_file(customers_csv, full, chunk_size=100, predictor=churn_predictor)
+    partial = tmp_path / "partial.csv"
+    partial.write_text(content)  # killed before (or while) writing the header
+
+    score_file(
+        customers_csv, partial, chunk_size=100, resume=True, predictor=churn_predictor
+    )
+    pd.testing.assert_frame_equal(pd.read_csv(partial), pd.read_csv(full))
+
+
+def test_iter_chunks_resumes_at_a_large_offset(tmp_path):
+    path = tmp_path / "big.csv"
+    pd.DataFrame({"id": np.arange(300_000)}).to_csv(path, index=False)
+
+    chunks = list(iter_chunks(path, chunk_size=40_000, start_row=250_000))
+
+    resumed = pd.concat(chunks)
+    assert resumed.index[0] == 250_000
+    assert resumed["id"].tolist() == list(range(250_000, 300_000))
+    assert (resumed.index == resumed["id"]).all()
@@ -0,0 +1,48 @@
+"""
+Minimal unit tests for app.scripts.benchmark_automl
+Tests the budgeted random search, the Pareto flags and the Markdown leaderboard.
+"""
+
+import numpy as np
+
+from app.scripts.benchmark_automl import pareto_front, random_search, to_markdown
+
+
+def _row(candidate, auc, latency):
+    return {
+        "candidate": candidate,
+        "features": "raw",
+        "auc": auc,
+        "accuracy": 0.9,
+        "f1": 0.5,
+        "train_seconds": 1.0,
+        "budget_overrun_seconds": 0.0,
+        "latency_ms_per_1k": latency,
+        "model_kb": 1.0,
+        "trials": 2,
+    }
+
+
+def test_random_search_runs_at_least_one_round_and_refits():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((200, 3)).astype(np.float32)
+    y = (x[:, 0] > 0).astype(np.int8)
+
+    model, search = random_search("logreg", x, y, budget=0.0, jobs=2)
+
+    assert search["trials"] == 2
+    assert search["search_auc"] > 0.9
+    assert search["search_seconds"] > 0 and search["refit_seconds"] > 0
+    assert model.predict_proba(x).shape == (200, 2)
+
+
+def test_pareto_front_and_markdown():
+    rows = [_row("fast", 0.80, 1.0), _row("accurate", 0.95, 9.0), _row("bad", 0.8, 5)]
+    pareto_front(rows)
+    assert [r["pareto"] for r in rows] == [True, True, False]
+
+    meta = {"rows": 10, "val_rows": 2, "budget_seconds": 5, "jobs": 1, "cpus": 1}
+    table = to_markdown(rows, meta).splitlines()
+    assert table[0] == "# AutoML leaderboard"
+    assert table[6].startswith("| 1 | fast | raw | 0.8000 |")
+    assert table[6].endswith("| yes |")
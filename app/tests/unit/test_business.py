@@ -0,0 +1,41 @@
+"""
+Minimal unit tests for app.scripts.eda.business
+Tests that cohort and funnel analysis accept compact bool columns and yes/no strings alike.
+"""
+
+import pandas as pd
+import pytest
+
+from app.scripts.eda.business import cohort_analysis, funnel_analysis
+
+
+@pytest.fixture
+def compact_df():
+    return pd.DataFrame(
+        {
+            "account_length": [5, 10, 20, 30],
+            "international_plan": [True, True, False, True],
+            "voice_mail_plan": [True, False, False, True],
+            "number_customer_service_calls": pd.Series([1, 0, 2, 3], dtype="int16"),
+            "churn": [True, False, True, False],
+        }
+    )
+
+
+def _as_strings(df: pd.DataFrame) -> pd.DataFrame:
+    flags = ["international_plan", "voice_mail_plan", "churn"]
+    return df.assign(**{c: df[c].map({True: "yes", False: "no"}) for c in flags})
+
+
+def test_cohort_analysis_same_for_bool_and_strings(compact_df):
+    compact = cohort_analysis(compact_df.copy())
+    strings = cohort_analysis(_as_strings(compact_df))
+    pd.testing.assert_series_equal(compact, strings)
+    assert compact["0-12m"] == 0.5
+
+
+def test_funnel_analysis_same_for_bool_and_strings(compact_df):
+    compact = funnel_analysis(compact_df)
+    strings = funnel_analysis(_as_strings(compact_df))
+    pd.testing.assert_frame_equal(compact, strings)
+    assert compact["count"].tolist() == [3, 2, 2]
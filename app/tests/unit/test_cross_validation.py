@@ -0,0 +1,152 @@
+"""
+Minimal unit tests for app.services.cross_validation
+Tests stratified index folds, per-fold preprocessing from sufficient statistics
+and parity with scikit-learn's cross_validate.
+"""
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import cross_validate
+from sklearn.pipeline import Pipeline
+
+from app.services.cross_validation import (
+    _numeric_dtype,
+    cross_validate_frame,
+    design_matrix,
+    encode_frame,
+    fold_ids,
+    fold_params,
+    stratified_folds,
+)
+from app.services.data_loader import load_train, serving_view
+from app.services.preprocessing import build_preprocessor
+from app.services.training import feature_columns
+
+
+@pytest.fixture(scope="module")
+def gappy_df(raw_train_df):
+    """Training rows with missing numerics and categoricals."""
+    df = raw_train_df.copy()
+    df.loc[::7, "total_day_minutes"] = np.nan
+    df.loc[::11, "state"] = np.nan
+    return df
+
+
+@pytest.fixture
+def compact_df():
+    """``load_train`` output, without leaving it in the loader's cache."""
+    load_train.cache_clear()
+    yield load_train()
+    load_train.cache_clear()
+
+
+def _labels(df):
+    return (df["churn"] == "yes").astype(int)
+
+
+def test_stratified_folds_partition_rows():
+    y = np.array([0] * 83 + [1] * 17)
+    folds = stratified_folds(y, n_splits=5)
+
+    tests = np.concatenate([test for _, test in folds])
+    assert sorted(tests.tolist()) == list(range(100))
+    for train, test in folds:
+        assert len(np.intersect1d(train, test)) == 0
+        assert y[test].sum() in (3, 4)
+    assert {len(test) for _, test in folds} == {20}
+
+
+@pytest.mark.parametrize("cat_cols", [["state", "area_code"], ["international_plan"]])
+def test_fold_matrices_match_fitted_preprocessor(gappy_df, cat_cols):
+    x_features = gappy_df.drop(columns=["churn"])
+    num_cols, _ = feature_columns(gappy_df, "churn")
+    encoded = encode_frame(gappy_df, num_cols, cat_cols)
+    folds = fold_ids(_labels(gappy_df), 4)
+    params = fold_params(encoded, folds, 4)
+
+    for k in range(4):
+        train, test = np.flatnonzero(folds != k), np.flatnonzero(folds == k)
+        pre = build_preprocessor(num_cols, cat_cols, engineered=False)
+        expected = pre.fit(x_features.iloc[train]).transform(x_features.iloc[test])
+        actual = design_matrix(encoded.numeric, encoded.codes, test, params[k])
+
+        assert params[k].sparse == hasattr(expected, "toarray")
+        if params[k].sparse:
+            expected, actual = expected.toarray(), actual.toarray()
+        np.testing.assert_allclose(actual, expected, rtol=1e-10, atol=1e-12)
+
+
+def test_compact_frame_matches_float32_pipeline(compact_df):
+    df = compact_df  # int16/float32 numerics, bool flags, categoricals
+    num_cols, cat_cols = feature_columns(df, "churn")
+    encoded = encode_frame(df, num_cols, cat_cols)
+    assert encoded.numeric.dtype == _numeric_dtype(df[num_cols]) == np.float32
+    folds = fold_ids(df["churn"], 3)
+    params = fold_params(encoded, folds, 3)
+
+    x_features = serving_view(df, num_cols + cat_cols)
+    for k in range(3):
+        train, test = np.flatnonzero(folds != k), np.flatnonzero(folds == k)
+        pre = build_preprocessor(num_cols, cat_cols, engineered=False)
+        expected = pre.fit(x_features.iloc[train]).transform(x_features.iloc[test])
+        actual = design_matrix(encoded.numeric, encoded.codes, test, params[k])
+        if params[k].sparse:
+            expected, actual = expected.toarray(), actual.toarray()
+        np.testing.assert_array_equal(actual, expected)
+
+
+def test_scores_match_sklearn_cross_validate(gappy_df):
+    num_cols, cat_cols = feature_columns(gappy_df, "churn")
+    y = _labels(gappy_df)
+    estimator = LogisticRegression(max_iter=2000)
+    scoring = ["roc_auc", "accuracy"]
+
+    ours = cross_validate_frame(
+        estimator, gappy_df, scoring=scoring, n_splits=4, n_jobs=2
+    )
+    expected = cross_validate(
+        Pipeline(
+            [
+                ("pre", build_preprocessor(num_cols, cat_cols, engineered=False)),
+                ("model", estimator),
+            ]
+        ),
+        gappy_df.drop(columns=["churn"]),
+        y,
+        cv=stratified_folds(y, 4),
+        scoring=scoring,
+    )
+
+    assert len(ours["fit_time"]) == 4
+    for key in ("test_roc_auc", "test_accuracy"):
+        np.testing.assert_allclose(ours[key], expected[key], rtol=1e-9)
+
+
+def test_categoricals_only(gappy_df):
+    _, cat_cols = feature_columns(gappy_df, "churn")
+    estimator = LogisticRegression(max_iter=2000)
+
+    ours = cross_validate_frame(
+        estimator, gappy_df, num_cols=[], cat_cols=cat_cols, n_splits=3
+    )
+    expected = cross_validate(
+        Pipeline(
+            [
+                ("pre", build_preprocessor([], cat_cols, engineered=False)),
+                ("model", estimator),
+            ]
+        ),
+        gappy_df.drop(columns=["churn"]),
+        _labels(gappy_df),
+        cv=stratified_folds(_labels(gappy_df), 3),
+        scoring="roc_auc",
+    )
+
+    assert _numeric_dtype(gappy_df[[]]) == np.float64
+    np.testing.assert_allclose(ours["test_score"], expected["test_score"], rtol=1e-9)
+
+
+def test_missing_target_raises(raw_train_df):
+    with pytest.raises(ValueError, match="not found"):
+        cross_validate_frame(LogisticRegression(), raw_train_df, target="label")
@@ -0,0 +1,108 @@
+"""
+Minimal unit tests for app.services.data_cache
+Tests columnar cache round-trips, declared dtypes, and invalidation.
+Tests the compact churn schema and its memory report.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from app.services.data_cache import (
+    CHURN_DTYPES,
+    apply_dtypes,
+    cache_path_for,
+    memory_report,
+    read_csv_cached,
+)
+
+
+@pytest.fixture
+def churn_csv(tmp_path):
+    """Temporary churn-like CSV for testing."""
+    df = pd.DataFrame(
+        {
+            "state": ["OH", "NJ", "OH"],
+            "total_day_minutes": [161.6, 243.4, 0.0],
+            "total_day_calls": [123, 114, 0],
+            "churn": ["no", "yes", "no"],
+        }
+    )
+    file_path = tmp_path / "train.csv"
+    df.to_csv(file_path, index=False)
+    return file_path
+
+
+def test_round_trip_keeps_dtypes(churn_csv):
+    parsed = read_csv_cached(churn_csv)
+    cached = read_csv_cached(churn_csv)
+
+    assert (cache_path_for(churn_csv) / "manifest.json").exists()
+    assert isinstance(cached["state"].dtype, pd.CategoricalDtype)
+    assert cached["total_day_minutes"].dtype == "float32"
+    assert cached["total_day_calls"].dtype == "int16"
+    assert cached["churn"].dtype == bool
+    assert cached["churn"].tolist() == [False, True, False]
+    pd.testing.assert_frame_equal(parsed, cached)
+
+
+def test_cached_frame_is_writable(churn_csv):
+    read_csv_cached(churn_csv)
+    cached = read_csv_cached(churn_csv)
+    cached.loc[0, "total_day_calls"] = 1
+    assert read_csv_cached(churn_csv).loc[0, "total_day_calls"] == 123
+
+
+def test_changed_source_invalidates(churn_csv):
+    read_csv_cached(churn_csv)
+    df = pd.read_csv(churn_csv)
+    df.loc[0, "churn"] = "yes"
+    df.to_csv(churn_csv, index=False)
+
+    assert read_csv_cached(churn_csv).loc[0, "churn"]
+
+
+def test_touched_but_unchanged_source_hits(churn_csv, mocker):
+    read_csv_cached(churn_csv)
+    stat = churn_csv.stat()
+    os.utime(churn_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    spy = mocker.spy(pd, "read_csv")
+    read_csv_cached(churn_csv)
+    assert spy.call_count == 0
+
+
+def test_yes_no_columns_parse_to_bool_or_float_with_missing():
+    df = apply_dtypes(
+        pd.DataFrame(
+            {"voice_mail_plan": ["Yes", "no"], "churn": ["yes", None]},
+        ),
+        CHURN_DTYPES,
+    )
+    assert df["voice_mail_plan"].tolist() == [True, False]
+    assert df["churn"].dtype == "float32"
+    assert df["churn"].isna().tolist() == [False, True]
+
+    with pytest.raises(ValueError, match="yes/no"):
+        apply_dtypes(pd.DataFrame({"churn": ["yes", "maybe"]}), CHURN_DTYPES)
+
+
+def test_integers_are_widened_when_out_of_range_and_extras_downcast():
+    df = apply_dtypes(
+        pd.DataFrame(
+            {"total_day_calls": [1, 40_000], "extra": [1, 2], "ratio": [0.5, 1.0]}
+        ),
+        CHURN_DTYPES,
+    )
+    assert df["total_day_calls"].dtype == "int32"
+    assert df["total_day_calls"].tolist() == [1, 40_000]
+    assert df["extra"].dtype == "int8"
+    assert df["ratio"].dtype == "float32"
+
+
+def test_memory_report_totals(churn_csv):
+    raw = pd.read_csv(churn_csv)
+    report = memory_report(raw, read_csv_cached(churn_csv))
+    assert report.splitlines()[-1].startswith("total")
+    assert "object        bool" in report
@@ -49,7 +49,7 @@ def test_load_train(monkeypatch, sample_train_csv):
 
 
 def test_load_test(monkeypatch, sample_test_csv):
-    monkeypatch.setattr("app.service.data_loader.RAW_DATA_DIR", sample_test_csv.parent)
+    monkeypatch.setattr("app.services.data_loader.RAW_DATA_DIR", sample_test_csv.parent)
     df = load_test()
     assert isinstance(df, pd.DataFrame)
     assert df.shape[0] == 2
@@ -0,0 +1,143 @@
+"""
+Minimal unit tests for app.utils.decorators
+Tests bounded LRU/TTL caching, byte budgets, and single-flight loading.
+"""
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from app.utils.decorators import log_and_cache, sizeof
+
+
+def test_lru_eviction_and_counters():
+    calls = []
+
+    @log_and_cache("TEST", maxsize=2)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    square(1)
+    square(2)
+    square(1)
+    square(3)  # evicts 2, the least recently used
+    square(2)
+
+    info = square.cache_info()
+    assert calls == [1, 2, 3, 2]
+    assert (info.hits, info.misses, info.evictions) == (1, 4, 2)
+    assert info.currsize == 2
+
+
+def test_byte_budget_measures_dataframes():
+    @log_and_cache("TEST", max_bytes=10_000)
+    def frame(n):
+        return pd.DataFrame({"x": np.zeros(n, dtype="float64")})
+
+    frame(500)  # ~4 KB
+    frame(600)  # ~4.8 KB
+    frame(700)  # ~5.6 KB, pushes the oldest entries out
+    info = frame.cache_info()
+    assert info.nbytes <= 10_000
+    assert info.evictions >= 1
+
+    frame(10_000)  # larger than the whole budget: returned, never stored
+    assert frame.cache_info().nbytes <= 10_000
+
+
+def test_ttl_expiry():
+    calls = []
+
+    @log_and_cache("TEST", ttl=0.05)
+    def load():
+        calls.append(1)
+        return "value"
+
+    load()
+    load()
+    time.sleep(0.06)
+    load()
+    assert len(calls) == 2
+
+
+def test_invalidate_and_path_keys():
+    calls = []
+
+    @log_and_cache("TEST")
+    def read(path):
+        calls.append(path)
+        return str(path)
+
+    read("data/train.csv")
+    read(Path("data/train.csv"))
+    assert len(calls) == 1
+
+    assert read.invalidate(Path("data/train.csv"))
+    read("data/train.csv")
+    assert len(calls) == 2
+
+
+def test_unhashable_arguments_bypass_cache():
+    @log_and_cache("TEST")
+    def n_rows(df):
+        return len(df)
+
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    assert n_rows(df) == 3
+    assert n_rows(df) == 3
+    assert n_rows.cache_info().currsize == 0
+
+
+def test_single_flight_shares_one_load():
+    calls = []
+    barrier = threading.Barrier(8)
+
+    @log_and_cache("TEST")
+    def slow_load():
+        calls.append(1)
+        time.sleep(0.1)
+        return object()
+
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(slow_load())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len({id(r) for r in results}) == 1
+
+
+def test_defaults_share_one_key():
+    calls = []
+
+    @log_and_cache("TEST")
+    def read(path, sep=","):
+        calls.append(path)
+        return path
+
+    read("a.csv")
+    read("a.csv", ",")
+    read(path="a.csv", sep=",")
+    assert len(calls) == 1
+
+    assert read.invalidate_where(lambda key: key[0] == "a.csv") == 1
+    read("a.csv")
+    assert len(calls) == 2
+
+
+def test_sizeof_counts_arrays_held_by_objects():
+    weights = np.zeros(10_000)
+    model = SimpleNamespace(coef_=weights, steps=[("scale", weights), {"w": weights}])
+    assert weights.nbytes < sizeof(model) < 2 * weights.nbytes
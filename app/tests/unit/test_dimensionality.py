@@ -0,0 +1,53 @@
+"""
+Minimal unit tests for app.scripts.eda.dimensionality
+Tests stratified sampling and the embedding cache.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.scripts.eda.dimensionality import compute_embedding, stratified_sample_index
+
+
+def test_stratified_sample_keeps_class_ratio():
+    y = pd.Series(["yes"] * 150 + ["no"] * 850)
+    index = stratified_sample_index(y, len(y), max_samples=200)
+
+    assert len(index) == 200
+    assert np.all(np.diff(index) > 0)
+    assert (y.iloc[index] == "yes").sum() == 30
+
+
+def test_sample_is_all_rows_when_small():
+    assert stratified_sample_index(None, 10, max_samples=50).tolist() == list(range(10))
+
+
+def test_tsne_embedding_is_cached(raw_train_df, tmp_path, monkeypatch):
+    df = raw_train_df.head(120)
+    kwargs = {
+        "target": "churn",
+        "max_samples": 80,
+        "pca_components": 5,
+        "scale": True,
+        "cache_dir": tmp_path,
+    }
+    embedding, index = compute_embedding(df, "tsne", **kwargs)
+    assert embedding.shape == (80, 2)
+    assert len(list(tmp_path.glob("tsne-*.npy"))) == 2
+
+    def no_refit(*_args, **_kwargs):
+        raise AssertionError("cached embedding should not be re-fitted")
+
+    monkeypatch.setattr("sklearn.manifold.TSNE", no_refit)
+    cached, cached_index = compute_embedding(df, "tsne", **kwargs)
+    np.testing.assert_array_equal(cached, embedding)
+    np.testing.assert_array_equal(cached_index, index)
+
+
+def test_umap_transforms_rows_outside_the_sample(raw_train_df):
+    pytest.importorskip("umap")
+    df = raw_train_df.head(200)
+    embedding, index = compute_embedding(df, "umap", "churn", max_samples=100)
+    assert embedding.shape == (200, 2)
+    assert sorted(index.tolist()) == list(range(200))
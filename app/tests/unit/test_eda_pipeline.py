@@ -0,0 +1,135 @@
+"""
+Minimal unit tests for app.scripts.eda.pipeline
+Tests stage selection, dependency ordering, failure handling and fingerprints.
+"""
+
+import importlib
+
+import pandas as pd
+import pytest
+
+from app.scripts.eda.manifest import column_digests, stage_fingerprint
+from app.scripts.eda.pipeline import Stage, run_stages, select_stages
+
+
+def row_count(df, _target, _deps):
+    return len(df)
+
+
+def target_rate(df, target, _deps):
+    return float((df[target] == "yes").mean())
+
+
+def combine(_df, _target, deps):
+    return deps["rows"] * deps["rate"]
+
+
+def explode(_df, _target, _deps):
+    raise ValueError("boom")
+
+
+STAGES = [
+    Stage("rows", row_count),
+    Stage("rate", target_rate),
+    Stage("combined", combine, ("rows", "rate")),
+]
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "state": pd.Categorical(["OH", "NJ", "OH", "KS"]),
+            "churn": ["yes", "no", "no", "yes"],
+        }
+    )
+
+
+def test_select_stages_pulls_in_deps_and_skips_dependents():
+    assert [s.name for s in select_stages(STAGES, only=["combined"])] == [
+        "rows",
+        "rate",
+        "combined",
+    ]
+    assert [s.name for s in select_stages(STAGES, skip=["rate"])] == ["rows"]
+    with pytest.raises(ValueError):
+        select_stages(STAGES, only=["nope"])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_stages_passes_dependency_values(df, workers):
+    results = run_stages(STAGES, df, target="churn", workers=workers)
+    assert {r.status for r in results.values()} == {"ok"}
+    assert results["combined"].value == pytest.approx(2.0)
+    assert list(results)[-1] == "combined"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failed_stage_skips_dependents_only(df, workers):
+    stages = [Stage("rows", explode), *STAGES[1:]]
+    results = run_stages(stages, df, target="churn", workers=workers)
+    assert results["rows"].status == "failed"
+    assert results["rate"].status == "ok"
+    assert results["combined"].status == "skipped"
+
+
+def write_marker(df, _target, _deps):
+    return len(df)
+
+
+def state_only(_df, _target):
+    return ["state"]
+
+
+def test_manifest_skips_unchanged_stages(df, tmp_path):
+    from app.scripts.eda.manifest import StageManifest
+
+    marker = tmp_path / "marker.txt"
+    marker.write_text("x")
+    stages = [
+        *STAGES,
+        Stage("state_plot", write_marker, columns=state_only, outputs=(marker,)),
+    ]
+    manifest_path = tmp_path / "manifest.json"
+
+    first = run_stages(
+        stages, df, "churn", workers=1, manifest=StageManifest(manifest_path)
+    )
+    assert {r.status for r in first.values()} == {"ok"}
+
+    second = run_stages(
+        stages, df, "churn", workers=1, manifest=StageManifest(manifest_path)
+    )
+    assert {r.status for r in second.values()} == {"cached"}
+    assert second["combined"].value == pytest.approx(2.0)
+
+    # Only the stages reading the changed column (and their dependents) re-run.
+    changed = df.assign(churn=["no", "no", "no", "yes"])
+    third = run_stages(
+        stages, changed, "churn", workers=1, manifest=StageManifest(manifest_path)
+    )
+    statuses = {name: r.status for name, r in third.items()}
+    assert statuses == {
+        "rows": "ok",
+        "rate": "ok",
+        "combined": "ok",
+        "state_plot": "cached",
+    }
+
+    marker.unlink()
+    fourth = run_stages(
+        stages, changed, "churn", workers=1, manifest=StageManifest(manifest_path)
+    )
+    assert fourth["state_plot"].status == "ok"
+
+
+def test_module_code_is_fingerprinted_by_its_whole_source(df, tmp_path, monkeypatch):
+    helper = tmp_path / "eda_helper_module.py"
+    helper.write_text("def shade():\n    return 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    stage = Stage("rows", row_count, code=(importlib.import_module(helper.stem),))
+    digests = column_digests(df)
+    first = stage_fingerprint(stage, df, digests, "churn", {})
+
+    helper.write_text("def shade():\n    return 1\n\n\ndef _helper():\n    return 2\n")
+    assert stage_fingerprint(stage, df, digests, "churn", {}) != first
@@ -0,0 +1,85 @@
+"""
+Minimal unit tests for app.scripts.eda.stats
+Tests parity with pandas in exact mode, chunked input and sketch accuracy.
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.scripts.eda import (
+    detect_outliers,
+    find_unnecessary_columns,
+    missingness_summary,
+    summarize,
+)
+from app.scripts.eda.stats import DistinctSketch, QuantileSketch, compute_stats
+
+
+def test_views_match_pandas(raw_train_df):
+    df = raw_train_df.copy()
+    df.loc[::7, "total_day_minutes"] = np.nan
+    numeric = df.select_dtypes(include="number").columns
+
+    expected_outliers = {}
+    for col in numeric:
+        q1, q3 = df[col].quantile(0.25), df[col].quantile(0.75)
+        iqr = q3 - q1
+        mask = (df[col] < q1 - 1.5 * iqr) | (df[col] > q3 + 1.5 * iqr)
+        expected_outliers[col] = int(mask.sum())
+
+    assert detect_outliers(df) == expected_outliers
+    assert (
+        missingness_summary(df)
+        == df.isna().mean().sort_values(ascending=False).to_dict()
+    )
+    summary = summarize(df, target="churn")
+    assert summary["n_rows"] == len(df)
+    assert (
+        summary["target_distribution"]["counts"] == df["churn"].value_counts().to_dict()
+    )
+    stats = compute_stats(df, target="churn")
+    assert stats.nunique().to_dict() == df.nunique().to_dict()
+    pd.testing.assert_frame_equal(
+        stats.describe(), df[numeric].describe().T, check_dtype=False
+    )
+
+
+def test_chunked_file_matches_frame(raw_train_df, tmp_path):
+    path = tmp_path / "train.csv"
+    raw_train_df.to_csv(path, index=False)
+
+    whole = compute_stats(raw_train_df, target="churn")
+    chunked = compute_stats(pd.read_csv(path, chunksize=64), target="churn")
+
+    assert chunked.n_chunks > 1
+    assert summarize(None, "churn", stats=chunked) == summarize(
+        None, "churn", stats=whole
+    )
+    assert detect_outliers(None, stats=chunked) == detect_outliers(None, stats=whole)
+
+
+def test_screening_flags_id_and_constant_columns():
+    df = pd.DataFrame({"id": range(50), "flat": 1, "churn": ["yes", "no"] * 25})
+    recs = find_unnecessary_columns(df, target="churn")
+    assert recs["id_like"] == ["id"]
+    assert recs["constant"] == ["flat"]
+
+
+def test_sketches_stay_accurate_past_exact_limit():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=200_000)
+
+    quantiles = QuantileSketch(exact_limit=1000)
+    for chunk in np.array_split(values, 20):
+        quantiles.update(chunk)
+    assert not quantiles.exact
+    assert sum(len(level) for level in quantiles.levels) < 20_000
+    estimate = quantiles.quantile([0.25, 0.5, 0.75])
+    np.testing.assert_allclose(
+        estimate, np.quantile(values, [0.25, 0.5, 0.75]), atol=0.02
+    )
+
+    distinct = DistinctSketch(exact_limit=1000)
+    distinct.update(pd.util.hash_array(np.arange(100_000)))
+    assert not distinct.exact
+    assert abs(distinct.count() - 100_000) < 3_000
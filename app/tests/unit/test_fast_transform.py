@@ -0,0 +1,115 @@
+"""
+Minimal unit tests for app.services.fast_transform
+Tests that the compiled record path matches the pandas ColumnTransformer path.
+"""
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import QuantileTransformer, StandardScaler
+
+from app.core import get_settings
+from app.services.fast_transform import compile_preprocessor
+from app.services.predictor import ChurnPredictor
+from app.services.preprocessing import build_preprocessor
+
+CAT_COLS = ["state", "area_code", "international_plan", "voice_mail_plan"]
+
+
+@pytest.fixture
+def features(raw_train_df):
+    return raw_train_df.drop(columns=["churn"])
+
+
+def _dense(matrix):
+    return matrix.toarray() if hasattr(matrix, "toarray") else matrix
+
+
+def test_compiled_matches_fixture_preprocessor(churn_predictor, features):
+    compiled = compile_preprocessor(churn_predictor.preprocessor)
+    expected = _dense(churn_predictor.preprocessor.transform(features))
+
+    actual = compiled.transform_records(features.to_dict("records"))
+
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_compiled_matches_saved_preprocessor(features):
+    settings = get_settings()
+    path = f"{settings.serving_artifact_dir}/{settings.serving_preprocessor_name}"
+    preprocessor = joblib.load(f"{path}.joblib")
+
+    actual = compile_preprocessor(preprocessor).transform_records(
+        features.to_dict("records")
+    )
+
+    np.testing.assert_array_equal(actual, _dense(preprocessor.transform(features)))
+
+
+def test_compiled_matches_engineered_preprocessor(features):
+    num_cols = [c for c in features.columns if c not in CAT_COLS]
+    preprocessor = build_preprocessor(num_cols, CAT_COLS).fit(features)
+
+    actual = compile_preprocessor(preprocessor).transform_records(
+        features.to_dict("records")
+    )
+
+    np.testing.assert_array_equal(actual, _dense(preprocessor.transform(features)))
+
+
+@pytest.mark.parametrize("scaler_params", [{"with_mean": False}, {"with_std": False}])
+def test_compiled_matches_partial_standard_scaler(features, scaler_params):
+    num_cols = [c for c in features.columns if c not in CAT_COLS]
+    preprocessor = build_preprocessor(num_cols, CAT_COLS, engineered=False)
+    scaler = Pipeline([("scaler", StandardScaler(**scaler_params))])
+    preprocessor.transformers[0] = ("num", scaler, num_cols)
+    preprocessor.fit(features)
+
+    actual = compile_preprocessor(preprocessor).transform_records(
+        features.to_dict("records")
+    )
+
+    np.testing.assert_allclose(
+        actual, _dense(preprocessor.transform(features)), rtol=1e-12
+    )
+
+
+def test_missing_and_unknown_values_match_pandas(churn_predictor, features):
+    frame = features.head(2).copy()
+    frame.loc[0, "total_day_minutes"] = np.nan
+    frame.loc[1, "state"] = "ZZ"
+    records = frame.to_dict("records")
+    records[0]["total_day_minutes"] = None
+
+    compiled = compile_preprocessor(churn_predictor.preprocessor)
+
+    np.testing.assert_array_equal(
+        compiled.transform_records(records),
+        _dense(churn_predictor.preprocessor.transform(frame)),
+    )
+
+
+def test_small_batches_skip_the_pandas_transform(churn_predictor, features, mocker):
+    spy = mocker.spy(churn_predictor.preprocessor, "transform")
+    records = features.head(3).to_dict("records")
+
+    probabilities = churn_predictor.predict_records(records)
+
+    assert spy.call_count == 0
+    np.testing.assert_allclose(
+        probabilities, churn_predictor.predict_proba(features.head(3)), rtol=1e-12
+    )
+
+
+def test_uncompilable_preprocessor_falls_back_to_pandas(churn_predictor, features):
+    num_cols = [c for c in features.columns if c not in CAT_COLS]
+    preprocessor = ColumnTransformer(
+        [("num", QuantileTransformer(n_quantiles=10), num_cols)]
+    ).fit(features)
+
+    with pytest.raises(TypeError):
+        compile_preprocessor(preprocessor)
+    predictor = ChurnPredictor(preprocessor, churn_predictor.model)
+    assert predictor.compiled is None
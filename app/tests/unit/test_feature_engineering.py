@@ -0,0 +1,147 @@
+"""
+Minimal unit tests for the fitted feature-engineering transformers
+Tests parity with the original pandas features and the serving preprocessor.
+"""
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.fast_transform import compile_preprocessor
+from app.services.preprocessing import (
+    BehavioralFeatures,
+    PriceContractFeatures,
+    build_preprocessor,
+)
+
+
+@pytest.fixture
+def usage_df():
+    return pd.DataFrame(
+        {
+            "customer_id": ["a", "a", "b", "c", "c"],
+            "total_day_minutes": [100.0, 50.0, 30.0, 0.0, 12.0],
+            "total_day_calls": [10, 0, 3, 5, 4],
+            "data_usage": [1.0, 3.0, 2.0, 4.0, 8.0],
+            "service_downgrade": [True, False, False, True, False],
+            "monthly_charge": [20.0, 0.0, 10.0, 5.0, 8.0],
+            "total_day_charge": [17.0, 8.5, 5.1, 0.0, 2.0],
+            "signup_date": ["2020-01-01"] * 5,
+            "contract_end_date": [
+                "2020-03-01",
+                "2019-12-01",
+                "2021-01-01",
+                "2020-01-31",
+                "2020-07-15",
+            ],
+        }
+    )
+
+
+def test_behavioral_features_match_pandas_definition(usage_df):
+    transformer = BehavioralFeatures().fit(usage_df)
+    out = transformer.transform(usage_df)
+
+    assert transformer.get_feature_names_out().tolist() == [
+        "avg_daily_call_minutes",
+        "data_usage_std_dev",
+        "service_downgrade_flags",
+    ]
+    expected_avg = usage_df["total_day_minutes"] / usage_df["total_day_calls"].replace(
+        0, 1
+    )
+    expected_std = (
+        usage_df.groupby("customer_id")["data_usage"].transform("std").fillna(0)
+    )
+    np.testing.assert_allclose(out[:, 0], expected_avg)
+    np.testing.assert_allclose(out[:, 1], expected_std)
+    np.testing.assert_array_equal(out[:, 2], [1, 0, 0, 1, 0])
+
+
+def test_std_is_learned_at_fit_and_looked_up(usage_df):
+    transformer = BehavioralFeatures().fit(usage_df)
+    new = usage_df.iloc[[0, 2]].assign(customer_id=["c", "unseen"])
+
+    out = transformer.transform(new)
+
+    assert out[0, 1] == pytest.approx(np.std([4.0, 8.0], ddof=1))
+    assert out[1, 1] == 0.0
+
+
+def test_price_contract_features(usage_df):
+    out = PriceContractFeatures().fit_transform(usage_df)
+
+    np.testing.assert_allclose(out[:, 0], [0.85, 8.5, 0.51, 0.0, 0.25])
+    np.testing.assert_array_equal(out[:, 1], [2, 0, 12, 1, 6])
+
+
+@pytest.mark.parametrize("cls", [BehavioralFeatures, PriceContractFeatures])
+def test_transform_record_matches_transform(usage_df, cls):
+    transformer = cls().fit(usage_df)
+    batch = transformer.transform(usage_df)
+
+    for i, record in enumerate(usage_df.to_dict("records")):
+        np.testing.assert_allclose(transformer.transform_record(record), batch[i])
+
+
+def test_missing_source_columns_yield_no_features(usage_df):
+    transformer = PriceContractFeatures().fit(usage_df[["total_day_charge"]])
+    assert transformer.transform(usage_df).shape == (5, 0)
+
+
+def test_build_preprocessor_adds_engineered_branches(raw_train_df, tmp_path):
+    x_features = raw_train_df.drop(columns=["churn"])
+    cat_cols = ["state", "area_code", "international_plan", "voice_mail_plan"]
+    num_cols = [c for c in x_features.columns if c not in cat_cols]
+
+    preprocessor = build_preprocessor(num_cols, cat_cols).fit(x_features)
+    joblib.dump(preprocessor, tmp_path / "preprocessor.joblib")
+    restored = joblib.load(tmp_path / "preprocessor.joblib")
+
+    names = restored.get_feature_names_out().tolist()
+    assert "behavioral__avg_daily_call_minutes" in names
+    # No price/contract source columns in this dataset: that branch is dropped.
+    assert not any(n.startswith("price_contract__") for n in names)
+    matrix = restored.transform(x_features.head(3))
+    assert matrix.shape == (3, len(names))
+
+
+def test_missing_contract_date_is_imputed(usage_df):
+    usage_df.loc[[1, 3], "contract_end_date"] = [None, np.nan]
+    transformer = PriceContractFeatures().fit(usage_df)
+
+    batch = transformer.transform(usage_df)
+    assert np.isnan(batch[[1, 3], 1]).all()
+    np.testing.assert_array_equal(batch[[0, 2, 4], 1], [2, 12, 6])
+    for i, record in enumerate(usage_df.to_dict("records")):
+        np.testing.assert_allclose(transformer.transform_record(record), batch[i])
+
+    preprocessor = build_preprocessor(["monthly_charge"], ["customer_id"])
+    preprocessor.fit(usage_df)
+    column = (
+        preprocessor.get_feature_names_out()
+        .tolist()
+        .index("price_contract__months_until_contract_end")
+    )
+    records = usage_df.to_dict("records")
+    for matrix in (
+        preprocessor.transform(usage_df),
+        compile_preprocessor(preprocessor).transform_records(records),
+    ):
+        months = np.asarray(matrix)[:, column]
+        assert np.isfinite(months).all()
+        # Missing dates take the median of the observed months (6).
+        assert months[1] == months[3] == months[4]
+
+
+def test_record_path_honours_date_format(usage_df):
+    for column in ("signup_date", "contract_end_date"):
+        usage_df[column] = pd.to_datetime(usage_df[column]).dt.strftime("%d/%m/%Y")
+    usage_df.loc[1, "contract_end_date"] = None
+    transformer = PriceContractFeatures(date_format="%d/%m/%Y").fit(usage_df)
+
+    batch = transformer.transform(usage_df)
+    np.testing.assert_array_equal(batch[[0, 2, 3, 4], 1], [2, 12, 1, 6])
+    for i, record in enumerate(usage_df.to_dict("records")):
+        np.testing.assert_allclose(transformer.transform_record(record), batch[i])
@@ -0,0 +1,132 @@
+"""
+Minimal unit tests for app.services.feature_store
+Tests derived features, indexed point lookups, per-column loads and
+incremental materialization of new, changed and removed rows.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import feature_store
+from app.services.data_cache import CHURN_DTYPES, apply_dtypes
+from app.services.feature_store import FeatureStore, derive_features
+
+
+@pytest.fixture
+def customers(raw_train_df):
+    df = apply_dtypes(raw_train_df, CHURN_DTYPES)
+    df.insert(0, "customer_id", np.arange(len(df)) + 1000)
+    df["monthly_charges"] = df["total_day_charge"] + df["total_eve_charge"]
+    return df
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(feature_store.settings, "feature_store_chunk_rows", 100)
+    return FeatureStore(tmp_path / "features")
+
+
+def test_derive_features_match_eda_definitions(customers):
+    features = derive_features(customers)
+
+    expected_cohort = pd.cut(
+        customers["account_length"], [0, 12, 24, 48, 1000], right=False
+    ).cat.codes
+    assert (features["cohort"].cat.codes == expected_cohort).all()
+    expected_clv = pd.qcut(customers["monthly_charges"], 4).cat.codes
+    assert (features["clv_segment"].cat.codes == expected_clv).all()
+    minutes = customers["total_day_minutes"] / customers["total_day_calls"].replace(
+        0, 1
+    )
+    np.testing.assert_allclose(features["avg_daily_call_minutes"], minutes, rtol=1e-6)
+
+
+def test_raw_csv_columns_fall_back_for_clv_and_monthly_charge(raw_train_df):
+    features = derive_features(raw_train_df)
+
+    expected_clv = pd.qcut(raw_train_df["account_length"], 4).cat.codes
+    assert (features["clv_segment"].cat.codes == expected_clv).all()
+    monthly = raw_train_df[list(feature_store.CHARGE_COLUMNS)].sum(axis=1)
+    np.testing.assert_allclose(
+        features["price_sensitivity_index"],
+        raw_train_df["total_day_charge"] / monthly,
+        rtol=1e-6,
+    )
+    assert "months_until_contract_end" not in features  # no contract dates
+
+    with pytest.raises(ValueError, match="CLV column"):
+        derive_features(raw_train_df, clv_col="monthly_charges")
+
+
+def test_get_lookup_and_column_loads(store, customers):
+    stats = store.materialize(customers)
+
+    assert stats["added"] == len(store) == 400
+    assert stats["chunks_written"] == 4
+    record = store.get(1042)
+    row = customers.iloc[42]
+    assert record["state"] == row["state"]
+    assert record["international_plan"] == row["international_plan"]
+    assert record["cohort"] in feature_store.COHORT_LABELS
+    assert store.get(5) is None
+
+    found = store.lookup([1399, 7, 1000], columns=["customer_id", "cohort"])
+    assert found["customer_id"].tolist() == [1399, 1000]
+    assert list(found.columns) == ["customer_id", "cohort"]
+
+    loaded = store.load(columns=["customer_id", "churn"])
+    assert sorted(loaded["customer_id"]) == customers["customer_id"].tolist()
+    with pytest.raises(KeyError):
+        store.get(1000, columns=["nope"])
+
+
+def test_incremental_materialize_rewrites_only_touched_chunks(store, customers):
+    store.materialize(customers)
+    reader = FeatureStore(store.root)
+    assert reader.get(1003)["total_day_calls"] == customers.loc[3, "total_day_calls"]
+
+    update = customers.copy()
+    update.loc[3, "total_day_calls"] = 0
+    update = update.drop(index=[5])
+    added = customers.iloc[[0]].assign(customer_id=9999)
+    update = pd.concat([update, added], ignore_index=True)
+    stats = store.materialize(update)
+
+    assert stats == {
+        "added": 1,
+        "changed": 1,
+        "removed": 1,
+        "unchanged": 398,
+        "chunks_written": 2,  # chunk 0 rewritten, one new chunk
+    }
+    assert reader.get(1003)["total_day_calls"] == 0
+    assert reader.get(1005) is None
+    assert reader.get(9999)["account_length"] == customers.loc[0, "account_length"]
+
+    # Same rows as a fresh build, except that the CLV quartile edges stay
+    # those of the first build until a full rebuild.
+    fresh = FeatureStore(store.root / "fresh")
+    fresh.materialize(update)
+    ours = store.load().sort_values("customer_id").reset_index(drop=True)
+    expected = fresh.load().sort_values("customer_id").reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        ours.drop(columns="clv_segment"),
+        expected.drop(columns="clv_segment"),
+        check_categorical=False,
+    )
+    edges = feature_store.clv_edges(customers["monthly_charges"])
+    assert store.manifest()["clv_edges"] == edges
+
+    assert store.materialize(update)["chunks_written"] == 0
+
+
+def test_string_keys_and_invalid_input(store, customers):
+    customers = customers.assign(customer_id=customers["customer_id"].map("c{}".format))
+    store.materialize(customers)
+    assert store.get("c1010")["account_length"] == customers.loc[10, "account_length"]
+
+    with pytest.raises(ValueError, match="duplicate"):
+        store.materialize(pd.concat([customers, customers.iloc[[0]]]))
+    with pytest.raises(ValueError, match="not found"):
+        store.materialize(customers, key="id")
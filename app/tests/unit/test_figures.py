@@ -0,0 +1,84 @@
+"""
+Minimal unit tests for app.scripts.eda.figures
+Tests histogram aggregation and the figure rendering pool.
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.scripts.eda import figures
+from app.scripts.eda.figures import FigureSpec, histogram_data, render_figures
+from app.scripts.eda.plots import plot_univariate
+
+
+def test_histogram_data_counts_finite_values_and_scales_kde():
+    rng = np.random.default_rng(0)
+    values = np.append(rng.normal(size=5000), [np.nan, np.inf])
+
+    data = histogram_data(values, bins=25)
+
+    assert data["counts"].sum() == 5000
+    assert len(data["edges"]) == 26
+    # The KDE curve integrates to the same area as the histogram.
+    width = data["edges"][1] - data["edges"][0]
+    grid_step = data["kde_x"][1] - data["kde_x"][0]
+    assert np.isclose(data["kde_y"].sum() * grid_step, 5000 * width, rtol=0.02)
+
+
+def test_histogram_data_skips_kde_for_constant_values():
+    data = histogram_data(np.ones(10))
+    assert data["counts"].sum() == 10
+    assert "kde_x" not in data
+
+
+def test_render_figures_writes_files_and_returns_timings(tmp_path):
+    specs = [
+        FigureSpec("hist", tmp_path / "h.png", histogram_data(np.arange(100))),
+        FigureSpec(
+            "bar",
+            tmp_path / "b.png",
+            {"labels": ["a", "b"], "values": np.array([3, 1])},
+            options={"palette": "viridis", "horizontal": True, "dpi": 50},
+        ),
+        FigureSpec(
+            "stacked_bar",
+            tmp_path / "s.png",
+            {"labels": [0, 1], "series": {"no": [0.8, 0.6], "yes": [0.2, 0.4]}},
+            options={"dpi": 50},
+        ),
+    ]
+
+    timings = render_figures(specs, workers=2)
+
+    assert set(timings) == {spec.path for spec in specs}
+    assert all(t > 0 for t in timings.values())
+    assert all(spec.path.stat().st_size > 0 for spec in specs)
+
+
+def test_render_figures_stays_in_process_inside_a_worker(tmp_path, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("nested process pool")
+
+    monkeypatch.setattr(figures.multiprocessing, "parent_process", lambda: object())
+    monkeypatch.setattr(figures, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(figures.settings, "figure_workers", 4)
+    specs = [
+        FigureSpec("hist", tmp_path / f"h{i}.png", histogram_data(np.arange(10)))
+        for i in range(2)
+    ]
+
+    assert set(render_figures(specs)) == {spec.path for spec in specs}
+
+
+def test_plot_univariate_renders_every_column(tmp_path):
+    df = pd.DataFrame({f"n{i}": np.arange(20.0) * i for i in range(12)})
+    for i in range(11):
+        df[f"c{i}"] = list("ab") * 10
+    df["churn"] = ["yes", "no"] * 10
+
+    timings = plot_univariate(df, target="churn", outdir=tmp_path, workers=1)
+
+    assert len(timings) == 12 + 12 + 1  # numeric, categorical (with target), target
+    assert (tmp_path / "n11_dist.png").exists()
+    assert (tmp_path / "c10_bar.png").exists()
+    assert (tmp_path / "churn_distribution.png").exists()
@@ -0,0 +1,32 @@
+"""
+Minimal unit tests for app.utils.io
+Tests atomic JSON writes and tolerant manifest reads.
+"""
+
+import pytest
+
+from app.utils.io import read_manifest, write_json_atomic, write_manifest
+
+
+def test_manifest_round_trip_leaves_no_temp_files(tmp_path):
+    write_manifest(tmp_path, {"rows": 1})
+    write_manifest(tmp_path, {"rows": 2})
+
+    assert read_manifest(tmp_path) == {"rows": 2}
+    assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
+
+
+def test_read_manifest_of_missing_or_corrupt_file_is_none(tmp_path):
+    assert read_manifest(tmp_path) is None
+    (tmp_path / "manifest.json").write_text("{not json")
+    assert read_manifest(tmp_path) is None
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    path = tmp_path / "data.json"
+    write_json_atomic(path, {"a": 1})
+    with pytest.raises(TypeError):
+        write_json_atomic(path, {"a": object()})
+
+    assert path.read_text(encoding="utf-8") == '{\n  "a": 1\n}'
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
@@ -0,0 +1,21 @@
+"""
+Minimal unit tests for app.utils.memory
+Tests that resetting the peak-RSS mark scopes the peak to later work.
+"""
+
+import numpy as np
+import pytest
+
+from app.utils.memory import peak_rss_mb, reset_peak_rss
+
+
+def test_reset_scopes_peak_to_the_next_block():
+    block = np.ones(200 * 1024 * 1024 // 8)  # 200 MB, touched
+    del block
+    before = peak_rss_mb()
+    reset_peak_rss()
+    after = peak_rss_mb()
+    if after == before:
+        pytest.skip("peak RSS cannot be reset on this platform")
+
+    assert after < before - 100
@@ -0,0 +1,147 @@
+"""
+Minimal unit tests for app.core.metrics and app.api.metrics
+Tests the text exposition format, the disabled no-op path, merging worker
+snapshots and the /metrics endpoint.
+"""
+
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.main import create_app
+from app.core import metrics
+from app.core.metrics import Counter, Gauge, Histogram, Registry, timed, track
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+@pytest.fixture
+def disabled():
+    metrics.set_enabled(False)
+    yield
+    metrics.set_enabled(True)
+
+
+def test_histogram_renders_cumulative_buckets(registry):
+    hist = Histogram("h", "Doc.", ["stage"], buckets=(0.1, 1.0), registry=registry)
+    for value in (0.05, 0.5, 0.5, 5.0):
+        hist.labels(stage="a").observe(value)
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP h Doc.", "# TYPE h histogram"]
+    assert 'h_bucket{stage="a",le="0.1"} 1' in lines
+    assert 'h_bucket{stage="a",le="1.0"} 3' in lines
+    assert 'h_bucket{stage="a",le="+Inf"} 4' in lines
+    assert 'h_sum{stage="a"} 6.05' in lines
+    assert 'h_count{stage="a"} 4' in lines
+
+
+def test_counter_and_gauge_escape_labels(registry):
+    Counter("c_total", "Doc.", ["path"], registry=registry).labels(path='a"b\\c').inc(2)
+    Gauge("g", "Doc.", registry=registry).labels().set(7)
+
+    text = registry.render()
+    assert 'c_total{path="a\\"b\\\\c"} 2.0' in text
+    assert "g 7.0" in text
+
+
+def test_duplicate_name_is_rejected(registry):
+    Counter("c_total", "Doc.", registry=registry)
+    with pytest.raises(ValueError):
+        Counter("c_total", "Doc.", registry=registry)
+
+
+def test_timed_and_track_observe_durations(registry):
+    hist = Histogram("t", "Doc.", ["fn"], registry=registry)
+
+    @timed(hist, fn="double")
+    def double(x):
+        return 2 * x
+
+    assert double(2) == 4
+    with track(hist, fn="block"):
+        pass
+    assert hist.labels(fn="double").count == 1
+    assert hist.labels(fn="block").count == 1
+
+
+def test_disabled_updates_are_no_ops(registry, disabled):
+    hist = Histogram("t", "Doc.", registry=registry)
+    counter = Counter("c_total", "Doc.", registry=registry)
+
+    with track(hist):
+        pass
+    hist.labels().observe(1.0)
+    counter.labels().inc()
+    assert hist.labels().count == 0
+    assert counter.labels().value == 0
+
+
+def test_render_aggregate_sums_workers_and_labels_gauges(registry):
+    hist = Histogram("h", "Doc.", buckets=(1.0,), registry=registry)
+    counter = Counter("c_total", "Doc.", ["path"], registry=registry)
+    gauge = Gauge("g", "Doc.", registry=registry)
+    hist.labels().observe(0.5)
+    counter.labels(path="a").inc(2)
+    gauge.labels().set(7)
+    first = registry.snapshot()
+    hist.labels().observe(5.0)
+    counter.labels(path="b").inc()
+
+    text = registry.render_aggregate({10: first, 11: registry.snapshot()})
+
+    assert 'h_bucket{le="1.0"} 2' in text
+    assert 'h_bucket{le="+Inf"} 3' in text
+    assert 'c_total{path="a"} 4.0' in text
+    assert 'c_total{path="b"} 1.0' in text
+    assert 'g{pid="10"} 7.0' in text
+    assert 'g{pid="11"} 7.0' in text
+
+
+def test_render_merges_snapshots_of_other_workers(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics.settings, "metrics_multiproc_dir", str(tmp_path))
+    metrics.CACHE_REQUESTS.labels(cache="merge_test", result="hit").inc(3)
+    metrics.MODEL_MEMORY_BYTES.labels(model="merge_test").set(5)
+    (tmp_path / "1.json").write_text(json.dumps(metrics.REGISTRY.snapshot()))
+    metrics.write_snapshot(tmp_path)  # stale copy of this worker: live values win
+    metrics.CACHE_REQUESTS.labels(cache="merge_test", result="hit").inc()
+
+    text = metrics.render()
+    assert 'churn_cache_requests_total{cache="merge_test",result="hit"} 7.0' in text
+    assert f'churn_model_memory_bytes{{model="merge_test",pid="{os.getpid()}"}}' in text
+    assert 'churn_model_memory_bytes{model="merge_test",pid="1"} 5.0' in text
+
+    metrics.mark_process_dead(1, tmp_path)
+    text = metrics.render()
+    assert 'churn_cache_requests_total{cache="merge_test",result="hit"} 7.0' in text
+    assert 'pid="1"' not in text
+
+
+def test_metrics_endpoint_reports_requests(churn_predictor, raw_train_df):
+    record = raw_train_df.drop(columns=["churn"]).head(2)
+    records = record.astype(object).where(record.notna(), None).to_dict("records")
+    app = create_app(predictor=churn_predictor, microbatch=False)
+    with TestClient(app) as client:
+        assert client.post("/v1/predict", json=records).status_code == 200
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert (
+        'churn_request_seconds_count{method="POST",route="/v1/predict",status="200"}'
+        in text
+    )
+    assert 'churn_batch_size_bucket{kind="request",le="2.0"}' in text
+    assert 'churn_inference_seconds_count{backend="sklearn"}' in text
+
+
+def test_metrics_endpoint_404_when_disabled(churn_predictor, disabled):
+    app = create_app(predictor=churn_predictor, microbatch=False)
+    with TestClient(app) as client:
+        assert client.get("/metrics").status_code == 404
@@ -0,0 +1,99 @@
+"""
+Minimal unit tests for app.services.model_registry
+Tests versioned registration, checksums, mmap loads and hot swap.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from sklearn.base import clone
+
+from app.services.model_registry import LivePredictor, ModelRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return ModelRegistry(tmp_path / "registry")
+
+
+@pytest.fixture
+def artifacts(churn_predictor):
+    return {
+        "preprocessor": churn_predictor.preprocessor,
+        "model": churn_predictor.model,
+    }
+
+
+@pytest.fixture
+def features(raw_train_df):
+    return raw_train_df.drop(columns=["churn"])
+
+
+def test_register_writes_versions_manifest_and_checksums(registry, artifacts):
+    assert registry.register("churn", artifacts) == "v1"
+    assert registry.register("churn", artifacts, metadata={"note": "x"}) == "v2"
+
+    manifest = json.loads((registry.root / "churn" / "manifest.json").read_text())
+    assert list(manifest["versions"]) == ["v1", "v2"]
+    assert manifest["live"] == "v1"  # the first version goes live by default
+    assert set(manifest["versions"]["v2"]["files"]) == {
+        "preprocessor.joblib",
+        "model.joblib",
+    }
+    assert manifest["versions"]["v2"]["metadata"] == {"note": "x"}
+    assert not list((registry.root / "churn").glob(".staging-*"))
+
+
+def test_load_memory_maps_arrays(registry, artifacts):
+    registry.register("churn", artifacts)
+
+    loaded = registry.load("churn")
+
+    assert isinstance(loaded["model"].coef_, np.memmap)
+    assert not loaded["model"].coef_.flags.writeable
+    np.testing.assert_array_equal(loaded["model"].coef_, artifacts["model"].coef_)
+
+
+def test_load_rejects_tampered_artifact(registry, artifacts):
+    registry.register("churn", artifacts)
+    with open(registry.path("churn", "v1") / "model.joblib", "ab") as f:
+        f.write(b"\0")
+
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        registry.load("churn")
+
+
+def test_live_predictor_hot_swaps_on_promote(
+    registry, artifacts, churn_predictor, features, raw_train_df
+):
+    registry.register("churn", artifacts)
+    live = LivePredictor("churn", registry, backend="joblib")
+    before = live.current
+    np.testing.assert_array_equal(
+        live.predict_proba(features), churn_predictor.predict_proba(features)
+    )
+
+    weaker = clone(churn_predictor.model).set_params(C=0.001)
+    matrix = churn_predictor.preprocessor.transform(features)
+    weaker.fit(matrix, raw_train_df["churn"] == "yes")
+    registry.register("churn", dict(artifacts, model=weaker))
+    assert not live.refresh()  # v2 registered but not promoted
+
+    registry.promote("churn", "v2")
+    assert live.refresh()
+    assert live.version == "v2"
+    assert live.model_name == "churn@v2"
+    np.testing.assert_allclose(
+        live.predict_proba(features), weaker.predict_proba(matrix)[:, 1]
+    )
+    # A request that grabbed the old predictor still completes on v1.
+    np.testing.assert_array_equal(
+        before.predict_proba(features), churn_predictor.predict_proba(features)
+    )
+
+
+def test_promote_unknown_version_raises(registry, artifacts):
+    registry.register("churn", artifacts)
+    with pytest.raises(KeyError):
+        registry.promote("churn", "v9")
@@ -0,0 +1,74 @@
+"""
+Minimal unit tests for app.services.onnx_backend
+Tests ONNX export parity with the joblib predictor and the onnxruntime backend.
+"""
+
+import pickle
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("skl2onnx")
+pytest.importorskip("onnxruntime")
+
+from app.services.model_loader import load_model
+from app.services.onnx_backend import OnnxChurnPredictor, export_onnx
+
+
+@pytest.fixture
+def onnx_predictor(churn_predictor, tmp_path):
+    export_onnx(
+        churn_predictor.preprocessor, churn_predictor.model, "test_model", tmp_path
+    )
+    return OnnxChurnPredictor.load("test_model", tmp_path)
+
+
+@pytest.fixture
+def features(raw_train_df):
+    return raw_train_df.drop(columns=["churn"])
+
+
+def test_onnx_matches_joblib_predictor(onnx_predictor, churn_predictor, features):
+    np.testing.assert_allclose(
+        onnx_predictor.predict_proba(features),
+        churn_predictor.predict_proba(features),
+        atol=1e-5,
+    )
+
+
+def test_missing_values_use_imputer_statistics(
+    onnx_predictor, churn_predictor, features
+):
+    frame = features.head(2).copy()
+    frame.loc[0, "total_day_minutes"] = np.nan
+    frame.loc[1, "state"] = None
+
+    np.testing.assert_allclose(
+        onnx_predictor.predict_proba(frame),
+        churn_predictor.predict_proba(frame),
+        atol=1e-5,
+    )
+
+
+def test_predict_records_accepts_objects_and_mappings(onnx_predictor, features):
+    rows = features.head(3).to_dict("records")
+    expected = onnx_predictor.predict_proba(features.head(3))
+
+    np.testing.assert_allclose(onnx_predictor.predict_records(rows), expected)
+    np.testing.assert_allclose(
+        onnx_predictor.predict_records([SimpleNamespace(**r) for r in rows]), expected
+    )
+
+
+def test_predictor_pickles_by_reloading(onnx_predictor, features):
+    restored = pickle.loads(pickle.dumps(onnx_predictor))
+    np.testing.assert_array_equal(
+        restored.predict_proba(features.head(5)),
+        onnx_predictor.predict_proba(features.head(5)),
+    )
+
+
+def test_load_model_rejects_unknown_backend(tmp_path):
+    with pytest.raises(ValueError):
+        load_model("test_model", tmp_path, backend="tflite")
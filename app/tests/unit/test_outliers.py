@@ -0,0 +1,81 @@
+"""
+Minimal unit tests for app.scripts.eda.outliers and OutlierCapper
+Tests parity with the per-column pandas loop, group counts and capping.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.impute import SimpleImputer
+from sklearn.pipeline import make_pipeline
+
+from app.scripts import run_eda
+from app.scripts.eda.outliers import cap_outliers, detect_outliers
+from app.scripts.eda.stats import EXACT_LIMIT, compute_stats
+from app.services.preprocessing import OutlierCapper
+
+
+def _loop_outliers(df: pd.DataFrame) -> dict:
+    outliers = {}
+    for col in df.select_dtypes(include="number").columns:
+        q1 = df[col].quantile(0.25)
+        q3 = df[col].quantile(0.75)
+        iqr = q3 - q1
+        mask = (df[col] < (q1 - 1.5 * iqr)) | (df[col] > (q3 + 1.5 * iqr))
+        outliers[col] = int(mask.sum())
+    return outliers
+
+
+def test_vectorized_matches_loop(raw_train_df):
+    df = raw_train_df.copy()
+    df.loc[::9, "total_eve_minutes"] = np.nan
+    assert detect_outliers(df) == _loop_outliers(df)
+
+
+def test_group_counts_add_up(raw_train_df):
+    by_churn = detect_outliers(raw_train_df, by="churn")
+    total = detect_outliers(raw_train_df)
+
+    assert set(by_churn) == {"no", "yes"}
+    for col, count in total.items():
+        assert by_churn["no"][col] + by_churn["yes"][col] == count
+
+
+def test_summary_totals_match_target_split_above_sketch_limit(tmp_path, monkeypatch):
+    rng = np.random.default_rng(0)
+    n = EXACT_LIMIT + 5000  # quantile sketches are approximate from here on
+    df = pd.DataFrame(
+        {
+            "heavy": rng.standard_t(2, n),
+            "skewed": rng.lognormal(size=n),
+            "churn": rng.choice(["yes", "no"], n),
+        }
+    )
+    monkeypatch.setattr(run_eda, "REPORTS_DIR", tmp_path)
+
+    stats = compute_stats(df, target="churn")
+    summary = run_eda.stage_summary(df, "churn", {"stats": stats})
+
+    by_churn = summary["outliers_by_target"]
+    for col, count in summary["outliers"].items():
+        assert by_churn["no"][col] + by_churn["yes"][col] == count
+
+
+def test_capper_clips_and_keeps_nan():
+    X = np.array([[1.0], [2.0], [3.0], [4.0], [100.0], [np.nan]], dtype="float32")
+    capper = OutlierCapper().fit(X)
+    out = capper.transform(X)
+
+    assert out.dtype == np.float32
+    assert out[4, 0] == capper.upper_[0] < 100
+    assert np.isnan(out[5, 0])
+
+    pipeline = make_pipeline(OutlierCapper(quantiles=(0.0, 0.75)), SimpleImputer())
+    assert pipeline.fit_transform(X).max() <= np.nanquantile(X, 0.75)
+
+
+def test_cap_outliers_removes_original_outliers(raw_train_df):
+    capped = cap_outliers(raw_train_df, quantiles=(0.05, 0.95))
+    col = "total_day_minutes"
+    low, high = raw_train_df[col].quantile([0.05, 0.95])
+    assert capped[col].between(low - 1e-9, high + 1e-9).all()
+    assert capped["state"].equals(raw_train_df["state"])
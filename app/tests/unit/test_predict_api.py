@@ -0,0 +1,52 @@
+"""
+Minimal unit tests for app.api.v1.predict
+Tests single and batched scoring through the FastAPI endpoint.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.main import create_app
+
+
+@pytest.fixture
+def client(churn_predictor):
+    with TestClient(create_app(predictor=churn_predictor)) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def records(raw_train_df):
+    features = raw_train_df.drop(columns=["churn"])
+    return json.loads(features.to_json(orient="records"))
+
+
+def test_predict_single_record(client, records):
+    response = client.post("/v1/predict", json=records[0])
+    assert response.status_code == 200
+    body = response.json()
+    assert body["model_name"] == "test_model"
+    assert len(body["predictions"]) == 1
+    assert 0.0 <= body["predictions"][0]["churn_probability"] <= 1.0
+
+
+def test_predict_batch_is_one_vectorized_call(
+    client, records, churn_predictor, raw_train_df, mocker
+):
+    spy = mocker.spy(churn_predictor.preprocessor, "transform")
+    response = client.post("/v1/predict", json=records)
+
+    assert response.status_code == 200
+    assert spy.call_count == 1
+    probabilities = [p["churn_probability"] for p in response.json()["predictions"]]
+    expected = churn_predictor.predict_proba(raw_train_df)
+    np.testing.assert_allclose(probabilities, expected)
+
+
+def test_predict_rejects_invalid_record(client, records):
+    bad = dict(records[0], international_plan="maybe")
+    assert client.post("/v1/predict", json=bad).status_code == 422
+    assert client.post("/v1/predict", json=[]).status_code == 422
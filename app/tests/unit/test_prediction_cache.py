@@ -0,0 +1,145 @@
+"""
+Minimal unit tests for app.services.prediction_cache
+Tests feature canonicalization, the memory/SQLite backends and version purges.
+"""
+
+import time
+from types import SimpleNamespace
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.main import create_app
+from app.core.metrics import MODEL_MEMORY_BYTES
+from app.services import model_loader
+from app.services.model_loader import artifact_version, load_model, save_model
+from app.services.prediction_cache import (
+    CachedPredictor,
+    MemoryPredictionCache,
+    SqlitePredictionCache,
+    feature_key,
+)
+from app.services.predictor import ChurnPredictor
+
+
+@pytest.fixture
+def records(raw_train_df):
+    return raw_train_df.drop(columns=["churn"]).head(20).to_dict("records")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return MemoryPredictionCache(maxsize=1000)
+    return SqlitePredictionCache(tmp_path / "cache.sqlite", maxsize=1000)
+
+
+def test_feature_key_is_canonical():
+    columns = ["a", "b", "c"]
+    key = feature_key({"a": 26, "b": "no", "c": None}, columns, "v1")
+
+    assert key == feature_key({"c": float("nan"), "b": "no", "a": 26.0}, columns, "v1")
+    assert key == feature_key(SimpleNamespace(a=26, b="no", c=None), columns, "v1")
+    assert key != feature_key({"a": 26, "b": "no", "c": None}, columns, "v2")
+    assert key != feature_key({"a": 27, "b": "no", "c": None}, columns, "v1")
+
+
+def test_cached_predictor_scores_only_misses(churn_predictor, cache, records, mocker):
+    cached = CachedPredictor(churn_predictor, cache)
+    spy = mocker.spy(churn_predictor, "predict_records")
+    expected = churn_predictor.predict_records(records)
+    spy.reset_mock()
+
+    np.testing.assert_allclose(cached.predict_records(records[:10]), expected[:10])
+    np.testing.assert_allclose(cached.predict_records(records), expected)
+
+    assert [len(call.args[0]) for call in spy.call_args_list] == [10, 10]
+    info = cached.cache_info()
+    assert (info.hits, info.misses, info.entries) == (10, 20, 20)
+    assert info.hit_rate == pytest.approx(1 / 3)
+    assert info.saved_seconds > 0
+
+
+def test_new_model_version_purges_old_entries(churn_predictor, cache, records):
+    cached = CachedPredictor(churn_predictor, cache)
+    cached.predict_records(records)
+
+    retrained = ChurnPredictor(
+        churn_predictor.preprocessor,
+        churn_predictor.model,
+        model_name="test_model",
+        model_version="test_model:v2",
+    )
+    other = CachedPredictor(retrained, cache)
+    other.predict_records(records[:5])
+
+    assert len(cache) == 5
+    assert other.cache_info().misses == 5
+
+
+def test_sqlite_cache_survives_reopen_and_expires(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    SqlitePredictionCache(path, maxsize=10).put_many({"k": 0.25}, "v1")
+    assert SqlitePredictionCache(path, maxsize=10).get_many(["k", "x"]) == {"k": 0.25}
+
+    short = SqlitePredictionCache(path, maxsize=10, ttl=0.05)
+    short.put_many({"k": 0.5}, "v1")
+    time.sleep(0.1)
+    assert short.get_many(["k"]) == {}
+
+
+def test_lru_eviction(cache):
+    cache.maxsize = 2
+    cache.put_many({"a": 0.1, "b": 0.2}, "v1")
+    cache.get_many(["a"])
+    cache.put_many({"c": 0.3}, "v1")
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 0.1, "c": 0.3}
+
+
+def test_artifact_version_changes_with_the_file(tmp_path):
+    joblib.dump({"weights": [1]}, tmp_path / "m.joblib")
+    load_model("m", tmp_path)
+    first = artifact_version("m", tmp_path)
+
+    joblib.dump({"weights": [1, 2]}, tmp_path / "m.joblib")
+    load_model.invalidate("m", tmp_path)
+    load_model("m", tmp_path)
+
+    assert first is not None
+    assert artifact_version("m", tmp_path) != first
+
+
+def test_model_memory_gauge_measures_the_loaded_model(tmp_path):
+    weights = np.zeros(50_000)
+    joblib.dump({"weights": weights}, tmp_path / "zeros.joblib", compress=3)
+    load_model("zeros", tmp_path)
+
+    assert (tmp_path / "zeros.joblib").stat().st_size < weights.nbytes
+    assert MODEL_MEMORY_BYTES.labels(model="zeros").value >= weights.nbytes
+
+
+def test_save_model_drops_entries_loaded_with_an_explicit_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_loader, "MODEL_DIR", tmp_path)
+    save_model({"weights": [1]}, "m")
+    assert load_model("m", tmp_path) == {"weights": [1]}
+    assert load_model("m") == {"weights": [1]}
+
+    save_model({"weights": [1, 2]}, "m")
+    assert load_model("m", tmp_path) == {"weights": [1, 2]}
+    assert load_model("m", str(tmp_path), backend="joblib") == {"weights": [1, 2]}
+    assert load_model("m") == {"weights": [1, 2]}
+
+
+def test_cache_info_endpoint(churn_predictor, records):
+    cached = CachedPredictor(churn_predictor, MemoryPredictionCache(maxsize=100))
+    with TestClient(create_app(predictor=cached, microbatch=False)) as client:
+        client.post("/v1/predict", json=records[0])
+        client.post("/v1/predict", json=records[0])
+        body = client.get("/v1/predict/cache").json()
+    assert (body["hits"], body["misses"]) == (1, 1)
+
+    with TestClient(create_app(predictor=churn_predictor)) as client:
+        assert client.get("/v1/predict/cache").status_code == 404
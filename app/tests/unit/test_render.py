@@ -0,0 +1,46 @@
+"""
+Minimal unit tests for app.scripts.eda.render
+Tests the aggregations behind the binned EDA plots.
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.scripts.eda.render import density_grid, missing_bitmap, shade
+
+
+def test_missing_bitmap_blocks_rows():
+    df = pd.DataFrame({"a": [np.nan] * 50 + [1.0] * 50, "b": 1.0})
+    fractions, starts = missing_bitmap(df, max_blocks=4)
+
+    assert fractions.shape == (4, 2)
+    assert starts.tolist() == [0, 25, 50, 75]
+    assert fractions[:, 0].tolist() == [1.0, 1.0, 0.0, 0.0]
+    assert not fractions[:, 1].any()
+
+
+def test_density_grid_counts_every_point_per_class():
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=(2, 1000))
+    labels = np.where(x > 0, "yes", "no")
+    x[0] = np.nan
+
+    counts, x_edges, y_edges, classes = density_grid(x, y, labels, bins=20)
+
+    assert classes == ["no", "yes"]
+    assert counts.shape == (2, 20, 20)
+    assert counts.sum() == 999
+    assert counts[1].sum() == (labels[1:] == "yes").sum()
+    assert len(x_edges) == len(y_edges) == 21
+
+
+def test_shade_is_transparent_where_empty():
+    counts = np.zeros((2, 3, 3))
+    counts[0, 0, 0] = 5
+    counts[1, 2, 1] = 1
+    image = shade(counts, np.array([[0, 0, 1], [1, 0, 0]], dtype=float))
+
+    assert image.shape == (3, 3, 4)
+    assert image[0, 0].tolist() == [0, 0, 1, 1]
+    assert image[1, 2, 0] == 1 and 0 < image[1, 2, 3] < 1
+    assert image[2, 2, 3] == 0
@@ -0,0 +1,47 @@
+"""
+Minimal unit tests for app.api.health and model warm-up
+Tests the readiness probe and the warm-up run before a worker reports ready.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.main import create_app
+from app.services.predictor import warm_up
+
+
+def test_ready_only_after_startup(churn_predictor):
+    app = create_app(predictor=churn_predictor, microbatch=False)
+    client = TestClient(app)
+    assert client.get("/ready").status_code == 503  # lifespan not run yet
+    assert client.get("/health").status_code == 200
+
+    with client:
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["model_name"] == "test_model"
+    assert not app.state.ready
+
+
+def test_startup_warms_up_when_asked(churn_predictor, mocker):
+    spy = mocker.spy(churn_predictor, "predict_proba")
+    with TestClient(create_app(predictor=churn_predictor, warmup=True)) as client:
+        assert spy.call_count == 1
+        assert client.get("/ready").status_code == 200
+
+
+def test_passed_in_predictor_is_not_warmed_again(churn_predictor, mocker):
+    spy = mocker.spy(churn_predictor, "predict_proba")
+    with TestClient(create_app(predictor=churn_predictor)):
+        assert spy.call_count == 0
+
+
+@pytest.mark.parametrize("n_records", [0, 16])
+def test_warm_up_scores_requested_rows(churn_predictor, mocker, n_records):
+    spy = mocker.spy(churn_predictor, "predict_proba")
+    elapsed = warm_up(churn_predictor, n_records=n_records)
+
+    assert spy.call_count == (1 if n_records else 0)
+    if n_records:
+        assert len(spy.call_args.args[0]) == n_records
+        assert elapsed > 0
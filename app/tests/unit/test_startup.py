@@ -0,0 +1,51 @@
+"""
+Minimal unit tests for lazy package imports
+Tests that importing app.services and app.scripts.eda stays cheap.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from app.scripts.benchmark_startup import parse_importtime
+
+HEAVY = ("pandas", "sklearn", "joblib", "matplotlib", "seaborn", "umap")
+
+
+def _imported_after(code: str) -> set[str]:
+    probe = f"{code}; import sys; print(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize("module", ["app.services", "app.scripts.eda"])
+def test_package_import_loads_no_heavy_dependencies(module):
+    assert not _imported_after(f"import {module}") & set(HEAVY)
+
+
+def test_lazy_names_resolve_on_access():
+    modules = _imported_after(
+        "from app.scripts.eda import compute_stats, dimensionality; "
+        "from app.services import get_splits"
+    )
+    assert "app.scripts.eda.stats" in modules
+    assert not modules & {"sklearn", "matplotlib"}
+
+
+def test_unknown_name_raises_attribute_error():
+    import app.services
+
+    with pytest.raises(AttributeError):
+        app.services.not_a_loader  # noqa: B018
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   numpy.core\n"
+        "import time:        80 |        200 | numpy\n"
+    )
+    assert parse_importtime(stderr) == {"numpy.core": (120, 120), "numpy": (80, 200)}
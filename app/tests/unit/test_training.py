@@ -0,0 +1,90 @@
+"""
+Minimal unit tests for app.services.training
+Tests index splits, zero-copy shuffled batches, the [train | validation] layout and early stopping.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.data_cache import CHURN_DTYPES, apply_dtypes
+from app.services.data_loader import split_indices
+from app.services.preprocessing import build_preprocessor
+from app.services.training import (
+    build_training_data,
+    feature_columns,
+    iter_batches,
+    train_mlp,
+)
+
+
+@pytest.fixture(scope="module")
+def compact_df(raw_train_df):
+    return apply_dtypes(raw_train_df, CHURN_DTYPES)
+
+
+@pytest.fixture
+def training_data(compact_df):
+    num_cols, cat_cols = feature_columns(compact_df, "churn")
+    preprocessor = build_preprocessor(num_cols, cat_cols)
+    return build_training_data(compact_df, "churn", preprocessor, val_size=0.25)
+
+
+def test_split_indices_are_disjoint_and_stratified():
+    y = np.array([0] * 80 + [1] * 20)
+    train, val = split_indices(y, val_size=0.25)
+
+    assert len(np.intersect1d(train, val)) == 0
+    assert len(train) + len(val) == len(y)
+    assert y[val].sum() == 5
+    assert np.all(np.diff(train) > 0)
+
+
+def test_iter_batches_yields_aligned_views():
+    features = np.arange(20, dtype=np.float32).reshape(10, 2)
+    target = np.arange(10)
+    batches = list(iter_batches(features, target, 4, np.random.default_rng(0)))
+
+    assert [len(yb) for _, yb in batches] == [4, 4]
+    for xb, yb in batches:
+        assert np.shares_memory(xb, features)
+        np.testing.assert_array_equal(xb[:, 0], 2 * yb)  # rows stayed paired
+    assert sorted(target.tolist()) == list(range(10))
+
+
+def test_training_data_layout(training_data, compact_df):
+    features, target = training_data.train
+    _, val_target = training_data.validation
+
+    assert training_data.features.dtype == np.float32
+    assert training_data.features.flags.c_contiguous
+    assert np.shares_memory(features, training_data.features)
+    assert len(target) + len(val_target) == len(compact_df)
+    assert val_target.sum() == round(compact_df["churn"].sum() * 0.25)
+
+
+def test_feature_columns_treat_flags_as_categorical(compact_df):
+    _, cat_cols = feature_columns(compact_df, "churn")
+    assert {"state", "international_plan", "voice_mail_plan"} <= set(cat_cols)
+
+
+def test_train_mlp_stops_early_and_checkpoints(training_data, monkeypatch, tmp_path):
+    monkeypatch.setattr("app.services.model_loader.MODEL_DIR", tmp_path)
+    seen = []
+    result = train_mlp(
+        training_data,
+        epochs=30,
+        batch_size=32,
+        threads=1,
+        patience=1,
+        checkpoint_name="ckpt",
+        on_epoch=seen.append,
+    )
+
+    assert len(result.history) == len(seen) < 30
+    best = min(result.history, key=lambda s: s.val_loss)
+    assert result.best_epoch == best.epoch
+    assert all(s.samples_per_second > 0 and s.peak_rss_mb > 0 for s in seen)
+    assert (tmp_path / "ckpt.joblib").exists()
+    proba = result.model.predict_proba(training_data.validation[0])[:, 1]
+    assert pd.Series(proba).between(0, 1).all()
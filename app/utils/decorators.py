@@ -1,29 +1,282 @@
 # app/utils/decorators.py
-from functools import wraps, cache
-from typing import Callable
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from functools import wraps
+from os import PathLike, fspath
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, NamedTuple
+
+import numpy as np
+import pandas as pd
+
 from app.core.config import get_settings
 from app.core.logger import get_logger
+from app.core.metrics import CACHE_REQUESTS
 
 settings = get_settings()
 logger = get_logger(__name__)
 
 
-def log_and_cache(label: str):
+class CacheInfo(NamedTuple):
+    """Counters reported by ``cache_info()`` on a ``log_and_cache`` function."""
+
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int
+    nbytes: int
+    max_bytes: int
+
+
+def sizeof(value: Any) -> int:
+    """
+    Approximate memory footprint of a cached value in bytes.
+
+    Frames and arrays count their buffers. Containers and plain objects
+    (fitted estimators, pipelines) are walked, so the arrays they hold count
+    too; objects reachable twice are counted once.
+    """
+    return _sizeof(value, {})
+
+
+_OPAQUE = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def _sizeof(value: Any, seen: dict[int, Any]) -> int:
+    # ``seen`` keeps the objects alive so that temporary pickled states
+    # cannot free their ids for reuse mid-walk.
+    if id(value) in seen:
+        return 0
+    seen[id(value)] = value
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_sizeof(k, seen) + _sizeof(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_sizeof(item, seen) for item in value)
+    elif isinstance(value, _OPAQUE):
+        pass
+    elif hasattr(value, "__dict__"):
+        size += _sizeof(vars(value), seen)
+    elif type(value).__getstate__ is not object.__getstate__:
+        # Extension types (e.g. fitted sklearn trees) expose their arrays
+        # only through their pickled state.
+        try:
+            size += _sizeof(value.__getstate__(), seen)
+        except Exception:  # noqa: BLE001, S110 - unpicklable: keep the shallow size
+            pass
+    return size
+
+
+def _make_key(args: tuple, kwargs: dict) -> tuple | None:
+    """Build a hashable cache key; ``None`` means the call is uncacheable."""
+    key = tuple(fspath(a) if isinstance(a, PathLike) else a for a in args)
+    if kwargs:
+        key += (object,) + tuple(
+            (k, fspath(v) if isinstance(v, PathLike) else v)
+            for k, v in sorted(kwargs.items())
+        )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class BoundedCache:
+    """
+    Thread-safe LRU cache with optional TTL and a byte budget.
+
+    Concurrent misses on the same key are collapsed into a single call
+    (single-flight); the other callers wait for and share its result.
+    """
+
+    def __init__(self, maxsize: int, max_bytes: int, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._data: OrderedDict[tuple, tuple[Any, int, float]] = OrderedDict()
+        self._inflight: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_call(self, key: tuple, func: Callable[[], Any]) -> tuple[Any, bool]:
+        """Return ``(value, hit)``, calling ``func`` at most once per key."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[2] > time.monotonic():
+                self._data.move_to_end(key)
+                self._hits += 1
+                return entry[0], True
+            if entry is not None:
+                self._discard(key)
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                future: Future = Future()
+                self._inflight[key] = future
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if pending is not None:
+            return pending.result(), True
+
+        try:
+            value = func()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            del self._inflight[key]
+            self._store(key, value)
+        future.set_result(value)
+        return value, False
+
+    def invalidate(self, key: tuple) -> bool:
+        """Drop one entry; return whether it was present."""
+        with self._lock:
+            return self._discard(key)
+
+    def invalidate_where(self, predicate: Callable[[tuple], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``; return how many."""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                self._discard(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._data),
+                self.maxsize,
+                self._nbytes,
+                self.max_bytes,
+            )
+
+    def _store(self, key: tuple, value: Any) -> None:
+        size = sizeof(value)
+        if size > self.max_bytes or self.maxsize <= 0:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl else float("inf")
+        self._discard(key)
+        self._data[key] = (value, size, expires)
+        self._nbytes += size
+        while len(self._data) > self.maxsize or self._nbytes > self.max_bytes:
+            _, (_, evicted_size, _) = self._data.popitem(last=False)
+            self._nbytes -= evicted_size
+            self._evictions += 1
+
+    def _discard(self, key: tuple) -> bool:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return False
+        self._nbytes -= entry[1]
+        return True
+
+
+def log_and_cache(
+    label: str,
+    maxsize: int | None = None,
+    max_bytes: int | None = None,
+    ttl: float | None = None,
+):
     """
     Decorator to log function calls with label and environment,
-    and cache the result.
+    and cache the result in a bounded, thread-safe LRU cache.
+
+    Limits default to ``settings.cache_max_entries``, ``settings.cache_max_bytes``
+    and ``settings.cache_ttl_seconds``. Arguments are bound to the signature
+    with defaults applied, so ``f(x)``, ``f(x, None)`` and ``f(x, dir=None)``
+    share one entry; calls with unhashable arguments bypass the cache. The
+    wrapper exposes ``cache_info()``, ``invalidate(*args, **kwargs)``,
+    ``invalidate_where(predicate)`` (over the bound positional key) and
+    ``cache_clear()``.
     """
 
     def decorator(func: Callable):
-        cached_func = cache(func)
+        cache = BoundedCache(
+            maxsize=settings.cache_max_entries if maxsize is None else maxsize,
+            max_bytes=settings.cache_max_bytes if max_bytes is None else max_bytes,
+            ttl=settings.cache_ttl_seconds if ttl is None else ttl,
+        )
+        hits = CACHE_REQUESTS.labels(cache=func.__name__, result="hit")
+        misses = CACHE_REQUESTS.labels(cache=func.__name__, result="miss")
+        signature = inspect.signature(func)
+
+        def key_of(args: tuple, kwargs: dict) -> tuple | None:
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError:
+                return None  # let the call itself raise
+            bound.apply_defaults()
+            return _make_key(bound.args, bound.kwargs)
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            logger.info("[%s][%s] Calling %s", settings.env, label, func.__name__)
-            result = cached_func(*args, **kwargs)
-            logger.info("[%s][%s] Completed %s", settings.env, label, func.__name__)
+            key = key_of(args, kwargs)
+            if key is None:
+                logger.debug(
+                    "[%s][%s] Unhashable arguments, not caching %s",
+                    settings.env,
+                    label,
+                    func.__name__,
+                )
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            result, hit = cache.get_or_call(key, lambda: func(*args, **kwargs))
+            (hits if hit else misses).inc()
+            if hit:
+                logger.debug(
+                    "[%s][%s] Cache hit for %s", settings.env, label, func.__name__
+                )
+            else:
+                logger.info(
+                    "[%s][%s] Completed %s in %.3fs",
+                    settings.env,
+                    label,
+                    func.__name__,
+                    time.perf_counter() - start,
+                )
             return result
 
+        def invalidate(*args, **kwargs) -> bool:
+            key = key_of(args, kwargs)
+            return key is not None and cache.invalidate(key)
+
+        wrapper.cache_info = cache.info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        wrapper.invalidate = invalidate  # type: ignore[attr-defined]
+        wrapper.invalidate_where = cache.invalidate_where  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
@@ -0,0 +1,53 @@
+"""
+FILE: app/utils/io.py
+Atomic JSON files and the directory manifests of the on-disk stores.
+
+The columnar data cache, the model registry and the feature store each keep
+a ``manifest.json`` next to their files. Writers replace it atomically, so
+readers see either the previous or the new manifest, never a partial one.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+MANIFEST_NAME = "manifest.json"
+
+
+def write_json_atomic(path: str | Path, data: Any) -> None:
+    """
+    Write ``data`` as JSON to a temporary file, fsync it and rename it over ``path``.
+
+    Args:
+        path (str | Path): Target file; its directory must exist.
+        data (Any): JSON-serializable value.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def read_manifest(directory: str | Path) -> dict | None:
+    """The ``manifest.json`` of ``directory``, or None if missing or unreadable."""
+    try:
+        with open(Path(directory) / MANIFEST_NAME, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(directory: str | Path, manifest: dict) -> None:
+    """Atomically replace the ``manifest.json`` of ``directory``."""
+    write_json_atomic(Path(directory) / MANIFEST_NAME, manifest)